@@ -2,9 +2,15 @@ import random
 import string
 import time
 import os
+import sys
 
 def clear():
-    os.system("cls" if os.name == "nt" else "clear")
+    # sequência ANSI numa única escrita em vez de abrir um processo `clear` a cada rodada
+    if os.name == "nt" and not os.environ.get("WT_SESSION"):
+        os.system("cls")
+    elif sys.stdout.isatty():
+        sys.stdout.write("\x1b[2J\x1b[3J\x1b[H")
+        sys.stdout.flush()
 
 def gerar_placa():
     letras = ''.join(random.choices(string.ascii_uppercase, k=3))
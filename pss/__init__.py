@@ -0,0 +1,17 @@
+"""
+# PERSONAL_SECURITY_SYSTEM - ver. 0.9.1-beta
+# Copyright (C) 2025 Bandeirinha
+# Licensed under the GNU GPL v3.0 or later
+
+NOTAS DE ATUALIZAÇÃO:
+
+- Imposição de limites para jobs e study, exigindo mínimo de foco necessário.
+
+- Um clear_screen() implementado ao iniciar o jogo
+
+ESTRUTURA:
+
+- core.py: motor (jogador, mundo, IAs, mecânicas, headless/batch, save, journal, benchmarks).
+- commands.py, art.py, narrative.py: comandos do shell, arte e textos das missões, importados
+  só no primeiro uso.
+"""
@@ -0,0 +1,7 @@
+"""python -m pss: o mesmo que python PERSONAL_SECURITY_SYSTEM.py."""
+
+import sys
+
+from .core import main
+
+sys.exit(main())
@@ -0,0 +1,248 @@
+"""Arte do terminal: boot, animação do scan, mapa e cenas de viagem. Carregada só no primeiro uso."""
+
+import random
+
+from .core import RENDERER, clear_screen, pause
+
+
+def boot_sequence():
+    """Arte de boot completa: BIOS, barra de progresso e mensagens com glitch."""
+    clear_screen()
+    pause(0.2)
+    RENDERER.frame("\a")
+
+    # ===== SECURE BOOT SHOCK =====
+    RENDERER.frame("\a")
+    pause(random.uniform(0.32, 3.35))
+
+    # ===== BIOS ALERT - CLASSIFIED =====
+    bios_options = [
+        [
+            "BlackIce Secure UEFI Loader v7.8",
+            "Cryptographic Hardware Seal.............OK",
+            "Anti-Forensic Module...................ARMED",
+            "AI Surveillance Kernel.................ENABLED",
+            "Traceback Prevention...................ACTIVE",
+        ],
+        [
+            "Classified Firmware: Clearance Level RED",
+            "Zero Trust Boot Chain..................INTACT",
+            "Threat Monitoring (Global).............ONLINE",
+            "Network Counter-Intrusion..............READY",
+            "Identity Spoofing Allowed..............YES",
+        ],
+        [
+            "Quantum Hardened Hypervisor ROM",
+            "Virtual Host Fingerprint...............MASKED",
+            "Anomaly Matrix..........................CLEAN",
+            "Offensive Modules.......................LOADED",
+            "Rootkit Shield.........................DISENGAGED",
+        ],
+        [
+            "Stealth Firmware - DO NOT DISTRIBUTE",
+            "Hardware Identity......................OBFUSCATED",
+            "System Attestation.....................FAILED (?)",
+            "This Device Is Not Officially Registered",
+            "Proceeding Anyway...",
+        ],
+    ]
+
+    bios_lines = random.choice(bios_options)
+
+    # ===== Boot Progress Bar =====
+    boot_frames = [
+        "▏░░░░░░░░░░░░░░░░░▏",
+        "▏▒░░░░░░░░░░░░░░░░▏",
+        "▏▒▒░░░░░░░░░░░░░░░▏",
+        "▏▓▒▒░░░░░░░░░░░░░░▏",
+        "▏▓▓▒▒░░░░░░░░░░░░░▏",
+        "▏▓▓▓▒▒░░░░░░░░░░░░▏",
+        "▏▓▓▓▓▒▒░░░░░░░░░░░▏",
+        "▏▓▓▓▓▓▒▒░░░░░░░░░░▏",
+        "▏▓▓▓▓▓▓▒▒░░░░░░░░░▏",
+        "▏▓▓▓▓▓▓▓▒▒░░░░░░░░▏",
+        "▏▓▓▓▓▓▓▓▓▒▒░░░░░░░▏",
+        "▏▓▓▓▓▓▓▓▓▓▒▒░░░░░░▏",
+        "▏▓▓▓▓▓▓▓▓▓▓▒▒░░░░░▏",
+        "▏▓▓▓▓▓▓▓▓▓▓▓▒▒░░░░▏",
+        "▏▓▓▓▓▓▓▓▓▓▓▓▓▒▒░░░▏",
+        "▏▓▓▓▓▓▓▓▓▓▓▓▓▓▒░░░▏",
+        "▏▓▓▓▓▓▓▓▓▓▓▓▓▓▓▒░░▏",
+        "▏▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▒░▏",
+        "▏▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▒▏",
+        "▏▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▏"
+    ]
+
+    RENDERER.write("\nBooting unauthorized system...\n")
+
+    corrupted = RENDERER.encode("\r▏░░░FIRMWARE CORRUPTED░░░▏")
+    for frame in RENDERER.frames([f"\r{frame}" for frame in boot_frames]):
+        RENDERER.frame(frame)
+        pause(random.uniform(0.03, 0.12))
+
+        # Chance de glitch visual
+        if random.random() < 0.06:
+            RENDERER.frame(corrupted)
+            pause(random.uniform(0.03, 0.09))
+            RENDERER.frame(frame)
+
+    RENDERER.write("\r[STEALTH MODE ENGAGED]\n\n")
+    pause(random.uniform(0.28, 0.65))
+
+    # ===== BIOS Logs com falhas sutis =====
+    for line in bios_lines:
+        # glitch sonoro (só em terminal) sai junto com a linha
+        bell = "\a" if random.random() < 0.07 and RENDERER.is_tty() else ""
+        RENDERER.write(bell + line + "\n")
+        pause(random.uniform(0.25, 0.46))
+
+        # chance de erro transitório
+        if random.random() < 0.05:
+            RENDERER.write("Unexpected interrupt....handled\n")
+            pause(random.uniform(0.08, 0.20))
+
+    # ===== OS Bring-Up =====
+    boot_msgs = [
+        "Deploying cyberwarfare subsystems...",
+        "Encrypting volatile memory...",
+        "Globally poisoning telemetry signals...",
+        "Forging legal identity metadata...",
+        "Monitoring federated agencies...",
+        "Bypassing security enforcement...",
+        "Injecting deepfake credentials...",
+        "Preparing covert operations shell...",
+        "System ready for infiltration.",
+    ]
+
+    print()
+
+    ghost_frames = ["...", ". .", ".x.", ". .", "..."]
+
+    for msg in boot_msgs:
+        base = msg.rstrip(".")
+
+        # animação Ghost Glitch
+        for frame in RENDERER.frames([f"\r{base}{frame}" for frame in ghost_frames]):
+            RENDERER.frame(frame)
+            pause(random.uniform(0.32, 0.52))
+
+        # fixa linha final
+        RENDERER.write("\r" + msg + "\n")
+
+        # eventos extras
+        if random.random() < 0.05:
+            RENDERER.write(">> Shadow redundancy engaged\n")
+            pause(random.uniform(1.10, 2.35))
+
+
+    RENDERER.frame("\a")
+    pause(random.uniform(2.40, 3.70))
+
+
+def fast_boot():
+    """Boot comprimido do --fast-start: uma linha, sem pausas."""
+    clear_screen()
+    RENDERER.write("Booting unauthorized system... [STEALTH MODE ENGAGED]\n")
+
+
+def scan_animation():
+    bar_stages = [
+        "▏░░░░░░░░░░░░░░░░░▏",
+        "▏▒░░░░░░░░░░░░░░░░▏",
+        "▏▒▒░░░░░░░░░░░░░░░▏",
+        "▏▓▒▒░░░░░░░░░░░░░░▏",
+        "▏▓▓▒▒░░░░░░░░░░░░░▏",
+        "▏▓▓▓▒▒░░░░░░░░░░░░▏",
+        "▏▓▓▓▓▒▒░░░░░░░░░░░▏",
+        "▏▓▓▓▓▓▒▒░░░░░░░░░░▏",
+        "▏▓▓▓▓▓▓▒▒░░░░░░░░░▏",
+        "▏▓▓▓▓▓▓▓▒▒░░░░░░░░▏",
+        "▏▓▓▓▓▓▓▓▓▒▒░░░░░░░▏",
+        "▏▓▓▓▓▓▓▓▓▓▒▒░░░░░░▏",
+        "▏▓▓▓▓▓▓▓▓▓▓▒▒░░░░░▏",
+        "▏▓▓▓▓▓▓▓▓▓▓▓▒▒░░░░▏",
+        "▏▓▓▓▓▓▓▓▓▓▓▓▓▒▒░░░▏",
+        "▏▓▓▓▓▓▓▓▓▓▓▓▓▓▒░░░▏",
+        "▏▓▓▓▓▓▓▓▓▓▓▓▓▓▓▒░░▏",
+        "▏▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▒░▏",
+        "▏▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▒▏",
+        "▏▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▏"
+    ]
+
+    for stage in RENDERER.frames([f"\rEscaneando rede... {stage}" for stage in bar_stages]):
+        RENDERER.frame(stage)
+        pause(random.uniform(0.05, 0.38))  # variação de velocidade
+
+    # Efeito final de “estabilizando”
+    full, settle = RENDERER.frames(["\rEscaneando rede... ▏██████████████████▏", "\rEscaneando rede... ▏▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▏"])
+    for _ in range(3):
+        RENDERER.frame(full)
+        pause(0.10)
+        RENDERER.frame(settle)
+        pause(0.10)
+
+    print("\rEscaneando rede... [COMPLETE]               ")
+
+
+
+MAP_ART = """
+
+                            P  5  P5!5555 55
+                        55     5!555 5  P                              5
+                              :P5  !P555555                   P          55
+                           5      5 555  !                  5   5  55   !5   55
+                  55  P P 5   5    5555PP          ?   5P   P5 55  5   55  P55555 5555
+       P P    555   55?5 55  55    P 5            P55555555  5PPP  555    5555 P5 P 55555^ P
+        ~5  P   5 P55575.   55.                  55  55  PPP5   .  5 :P5P PP   55555    55
+         5    ?555    55 5  5   5                    57  ~P55 ~P55~5:5P55P75  P       5
+                P P555P55555   7 5             5  5 755  PPPP^5P  P   555555P55 575
+                  5P  555P:P555              5 P55.5?Y5   5 PP 55 55   5P!75 555P 5
+                  Y5P55P555 5                 5       P5:55P   Y555.   5  55  5
+                    5PP5   5                 5  55?5 PP   5   ~P75PP5P55  !55
+                     5                      5P~55    557  5?55  5 5   P ! .5
+                        P                  .5  555  P  55        5 55   55
+                            5 55P           55555  P5555555        5
+                           75 Y5  P5              55  5                 . 5     .
+                              55P5PP5              P55555
+                                 P 5              5  55    5                   555 5
+                              555P55                  5P  5                55~   5 P5
+                             5 5.                   55                      5    .P       5
+                             55^                                                        5
+                             5P
+                              5
+
+"""
+
+
+def ascii_travel_cutscene(mode, region):
+    if mode == "normal":
+        # Estilo "aeroporto"
+        return (
+            "\n\n"
+            "  ████████████████████████████████████████\n"
+            "  █        SISTEMA DE EMBARQUE AIRSING     █\n"
+            "  ████████████████████████████████████████\n"
+            "  ▓▓  CHECK-IN AUTOMÁTICO EM PROGRESSO  ▓▓\n"
+            "  ░░────────────────────────────────────░░\n"
+            f"      PORTÃO: D-{hash(region)%30:02d}   VOO: NX{abs(hash(region))%900+100}\n"
+            f"      DESTINO: {region:<14} STATUS: LIBERADO\n"
+            "  ░░────────────────────────────────────░░\n"
+            "     Passageiro autenticado. Bagagem criptografada.\n"
+            "            Favor aguardar o embarque...\n\n"
+        )
+    else:
+        # Sub-rede clandestina permanece sombria e intensa
+        return (
+            "\n\n"
+            "██████████████████████████████████████████\n"
+            "█     ENTRANDO EM SUB-REDE FANTASMA      █\n"
+            "██████████████████████████████████████████\n"
+            "▓▓▓─┤┤ ROTA FORA DO RADAR ├┤─▓▓▓\n"
+            "   Identidade → Quebra total\n"
+            "   Spoofing → MÁXIMO\n"
+            "   Proxy-chains → ENCADEADO\n"
+            "░░░ Logs se dissolvendo em ruídos digitais...\n"
+            "░░░ Você não existe para os satélites.\n\n"
+            f"        Destino final: {region}\n"
+            "        Cuidado com olhos sem corpo.\n\n"
+        )
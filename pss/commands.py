@@ -0,0 +1,1044 @@
+"""
+Comandos do shell, eventos aleatórios, loja e o registro COMMANDS que execute_command consulta.
+Importado no primeiro comando executado, não junto com o motor.
+"""
+
+from datetime import timedelta
+
+from .core import (
+    BRIBE_COST, GAME_OVER_ON_JAIL, MIN_FOCUS_JOB, MIN_FOCUS_STUDY, RENDERER, SAVE_PATH, Target,
+    apply_trace, ask, attempt_hack, attempt_special_mission, calc_hack_chance,
+    check_reputation_unlocks, pause, save_game, trigger_reputation_event, visual_hack_roll,
+    visual_mission_roll,
+)
+
+
+# -------------------- Eventos aleatórios e missões simples --------------------
+def trigger_random_event(player, world):
+    """Pode apresentar uma escolha ao jogador. Retorna string com resultado/descrição."""
+    rng = world.rng.events
+    # base probability grows with player's risk and day
+    base_p = 0.003 + min(0.25, player.risk / 100.0) + min(0.1, world.day / 200.0)
+    if rng.random() > base_p:
+        return None
+    # escolher evento
+    event_pool = ["client_offer", "asset_seizure", "mysterious_tip", "ai_contact"]
+
+    # police_check renomeado para state_check
+    if player.risk > 15 or player.reputation.get("crime", 0) > 8:
+        event_pool.append("state_check")
+    ev = rng.choice(event_pool)
+
+    if ev == "client_offer":
+        pay = rng.randint(200, 30000)
+        difficulty = rng.randint(1, 18)
+        desc = f"Cliente oferta trabalho: Promessa de recompensa ${pay}, dificuldade {difficulty}."
+        print("\nEVENTO:", desc)
+        print("A) Aceitar (ganha dinheiro se sucesso, risco maior).")
+        print("B) Recusar (sem ganho).")
+        choice = ask("Escolha A/B (contrato): ").strip().upper()
+        if choice == "A":
+            t = world._make_random_target(region="Contract", diff=difficulty)
+            ok, msg = attempt_hack(player, t, world)
+            return f"Contrato: {msg}"
+        else:
+            return "Você recusou o contrato."
+
+    elif ev == "state_check":
+        print("\nEVENTO: Operação de fiscalização. Alguém chamou a atenção até você?")
+        print("A) Subornar agente (custa dinheiro, reduz risco).")
+        print("B) Negar tudo (chance de multa/prisão).")
+        choice = ask(f"Escolha A/B (suborno, saldo ${player.money:.2f}): ").strip().upper()
+
+        if choice == "A":
+            cost = rng.randint(*BRIBE_COST)
+            if player.money < cost:
+                player.jailed_until = player.time + timedelta(hours=rng.randint(24, 120))
+                player.risk = 0.0
+                player.jailed = True
+                player.game_over = True
+                return "Você tentou subornar sem ter o valor... agentes perceberam → Prisão imediata."
+
+            player.money -= cost
+            player.risk = max(0.0, player.risk - rng.uniform(5.0, 20.0))
+            return f"Você subornou agentes por ${cost:.2f}. Risco reduzido."
+
+        chance_multa = 0.2 + player.risk / 100.0
+        if rng.random() < chance_multa:
+            multa = rng.randint(100, 10000)
+            if player.money < multa:
+                player.jailed_until = player.time + timedelta(hours=rng.randint(24, 120))
+                player.risk = 0.0
+                player.jailed = True         # <- ADICIONAR
+                player.game_over = True
+                return "A fiscalização aplicou uma multa impossível de pagar."
+
+            player.money -= multa
+            player.risk += rng.uniform(2.0, 8.0)
+            return f"Negações não convenceram. Multa paga: ${multa:.2f}."
+        return "Nenhuma ação adicional. Você saiu limpo."
+
+    elif ev == "asset_seizure":
+        if not player.assets:
+            return "EVENTO: Operações locais, mas você não tem ativos."
+
+        a = rng.choice(player.assets)
+        print(f"\nEVENTO: Risco de confisco do ativo '{a['type']}'.")
+        print("A) Tentar esconder (custa tempo e risco).")
+        print("B) Desistir e perder o ativo.")
+        choice = ask("Escolha A/B (confisco): ").strip().upper()
+
+        if choice == "A":
+            player.hours_pass(6, world)
+            if rng.random() < 0.5 + player.skills["stealth"] * 0.05:
+                a["income_per_day"] = a.get("income_per_day", 0.0) * 0.6
+                return f"Esconderijo bem-sucedido. Rendimento do ativo reduzido temporariamente."
+            else:
+                if a in player.assets:
+                    player.assets.remove(a)
+                return f"Tentativa falhou. Ativo '{a['type']}' apreendido."
+        else:
+            if a in player.assets:
+                player.assets.remove(a)
+            return f"Você perdeu o ativo '{a['type']}'."
+
+    elif ev == "mysterious_tip":
+        t = world._make_random_target(region=player.region, diff=rng.randint(2, 6))
+
+        world.add_target(t)
+        return f"Você recebeu uma dica anônima: alvo potencial detectável em breve -> {t.name} - {t.region} (security {t.security})."
+
+    elif ev == "ai_contact":
+        # spawn de IA com tipo probabilístico
+        ai = world.spawn_enemy_ai(preferred_type=rng.choice(["Pirata", "Federal", "Hacktivista", None]), region=player.region, player=player)
+        return f"Um agente desconhecido (IA nível {ai.level}, tipo oculto) agora começou a te monitorar: {ai.uid}."
+
+
+# -------------------- Comandos shell --------------------
+def cmd_help():
+    return "Comandos: " + ", ".join(name for name, spec in COMMANDS.items() if not spec["hidden"])
+
+
+def cmd_ls(player, args):
+    path = player.cwd if not args else join_path(player.cwd, args[0])
+    items = ls(player.fs, path)
+    if items is None:
+        return f"ls: {path}: No such file or directory"
+    return "\n".join(items)
+
+
+def cmd_cd(player, args):
+    if not args:
+        player.cwd = "/home"
+        return ""
+    path = join_path(player.cwd, args[0])
+    if path in player.fs and player.fs[path]["type"] == "dir":
+        player.cwd = path
+        return ""
+    return f"cd: {args[0]}: No such directory"
+
+
+def cmd_cat(player, args):
+    if not args:
+        return "cat: falta argumento"
+    path = join_path(player.cwd, args[0])
+    content = cat(player.fs, path)
+    if content is None:
+        return f"cat: {args[0]}: No such file"
+    return content
+
+
+def cmd_scan(player, args, world):
+    # Custo de tempo e risco-base do scan
+    hrs = 1
+    player.hours_pass(hrs, world)
+    player.risk = min(100.0, player.risk + 0.6)
+
+    from .art import scan_animation
+    scan_animation()
+
+    seen = world.get_targets_for_scan(player, limit=6)
+    if not seen:
+        return "Nenhum alvo encontrado."
+
+    # ---------- Exibição de alvos ----------
+    s = "Alvos encontrados (informações limitadas):\n"
+    for t in seen:
+        s += f" id={t.id} | {t.name} | region={t.region}\n"
+
+    # ---------- Enxames distantes: recon pode isolar um membro ----------
+    swarm_regions = world.swarm_regions()
+    for region, (count, level_sum) in swarm_regions.items():
+        if player.skills["recon"] >= level_sum / count * world.rng.scan.uniform(1.1, 2.5):
+            ai = world.materialize_swarm_member(region)
+            world.reveal_enemy(ai)
+            player.record_enemy_fingerprint(ai)
+
+    # ---------- IAs na rede ----------
+    if world.enemy_ais:
+        s += "\nIAs detectadas na rede:\n"
+        for ai in world.enemy_ais:
+            # Tentativa de revelar fingerprint com recon
+            if ai.fingerprint == "UNKNOWN":
+                if player.skills["recon"] >= ai.level * world.rng.scan.uniform(1.1, 2.5):
+                    world.reveal_enemy(ai)
+                    player.record_enemy_fingerprint(ai)
+
+            fp_visivel = ai.fingerprint
+
+            # exibição do tempo restante caso bloqueada
+            if ai.status == "bloqueada" and ai.blocked_until:
+                restante = ai.blocked_until - player.time
+                total_horas = int(restante.total_seconds() // 3600)
+                if total_horas <= 0:
+                    texto_restante = "desbloqueando agora"
+                elif total_horas < 24:
+                    texto_restante = f"{total_horas} horas restantes"
+                else:
+                    dias = total_horas // 24
+                    texto_restante = f"{dias} dia restante" if dias == 1 else f"{dias} dias restantes"
+
+                s += (
+                    f"  ai:{ai.uid} | fp:{fp_visivel} | nível {ai.level} | "
+                    f"status: bloqueada ({texto_restante}) | região: {getattr(ai,'region','?')}\n"
+                )
+            else:
+                s += (
+                    f"  ai:{ai.uid} | fp:{fp_visivel} | nível {ai.level} | "
+                    f"status: {ai.status} | região: {getattr(ai,'region','?')}\n"
+                )
+
+    swarm_regions = world.swarm_regions()
+    if swarm_regions:
+        s += "\nEnxames de IAs distantes (sinais agregados):\n"
+        for region, (count, level_sum) in swarm_regions.items():
+            s += f"  enxame:{region} | {count} IAs | nível médio {level_sum / count:.1f}\n"
+
+    return s
+
+
+    print("\rEscaneando rede... [COMPLETE]               ")
+
+def cmd_connect(player, args, world):
+    if not args:
+        return "connect: falta id"
+    try:
+        tid = int(args[0])
+    except ValueError:
+        return "connect: id inválido"
+
+    candidate = world.find_target(tid)
+    if not candidate:
+        return "connect: alvo não encontrado"
+
+    # passar tempo para a conexão
+    player.hours_pass(0.5, world)
+
+    import random, time, sys
+
+    # Estilos variados de banner por alvo
+    banners = [
+        lambda name: f"--- {{ {name} }} ---",
+        lambda name: f"*** Acesso ao Host: {name} ***",
+        lambda name: f"[+] Sessão ativa em {name} [+]",
+        lambda name: f"<<< {name} - remote shell >>>",
+        lambda name: f"SSH-2.0-OpenSSH_8.4 - Host: {name}",
+        lambda name: f"## Conexão com {name} estabelecida ##",
+        lambda name: f"<-- Remote Node: {name} -->"
+    ]
+
+    banner_style = random.choice(banners)
+    banner = banner_style(candidate.name)
+
+    # ===== Autenticação cinematográfica, agora sem barra =====
+    phases = [
+        "Trocando chaves DH",
+        "Sincronizando relógios",
+        "Estabelecendo túnel criptografado",
+        "Ofuscando impressão digital",
+        "Camuflando endereço de origem",
+        "Cortando rastreamento reverso",
+        "Autenticando sessão invisível"
+    ]
+
+    print()
+    for phase in random.sample(phases, 3):
+        RENDERER.write(phase + "...\n")
+        pause(random.uniform(0.18, 0.44))
+
+        # Pequena chance de falha e correção
+        if random.random() < 0.09:
+            glitch = random.choice([
+                "Chave inválida detectada",
+                "Checksum inconsistente",
+                "Latência crítica",
+                "Fingerprint conflitante",
+                "Sequência TLS fora de ordem"
+            ])
+            RENDERER.write(f"{glitch}... corrigindo...\n")
+            pause(random.uniform(0.25, 0.55))
+
+    RENDERER.write("Sessão criptografada estabelecida.\n\n")
+    pause(random.uniform(0.25, 0.55))
+
+    # Banner final da sessão remota
+    print(banner)
+    pause(random.uniform(0.12, 0.25))
+
+    print("Captura de banners de serviços...")
+    pause(random.uniform(0.03, 0.32))
+
+    for h in candidate.hints:
+        print(f" - {h}")
+        pause(random.uniform(0.09, 0.17))
+
+    fake = getattr(candidate, "fake_security", None)
+    if getattr(candidate, "honeypot", False) and fake is not None:
+        print(f"Nível de segurança aparente: {fake} (enganoso)")
+        pause(random.uniform(0.33, 0.70))
+        print("\n[!] ALERTA: comportamento anômalo detectado!")
+        print("    Possível HONEYPOT em operação.\n")
+    else:
+        print(f"Nível de segurança estimado: {candidate.security}\n")
+
+    pause(random.uniform(1.0, 1.6))
+    print("Conexão encerrada automaticamente após inspeção.\n")
+
+    return ""
+
+
+def cmd_hack(player, args, world):
+    if not args:
+        return "hack: falta id ou fingerprint"
+
+    arg = args[0].strip()
+
+    # Caso 1: valor numérico → alvo normal
+    if arg.isdigit():
+        tid = int(arg)
+        target = world.find_target(tid)
+        if not target:
+            return "hack: alvo não encontrado. Rode scan primeiro."
+        ok, msg = attempt_hack(player, target, world)
+        if "proxy_pack" in player.inventory:
+            player.risk = max(0.0, player.risk - 3.0)
+        return msg
+
+    # Caso 2: enxame distante → um membro é isolado e vira o alvo
+    if arg.startswith("enxame:"):
+        ai = world.materialize_swarm_member(arg[len("enxame:"):])
+        if ai is None:
+            return f"Enxame não encontrado: {arg}"
+        return hack_enemy_ai(player, world, ai)
+
+    # Caso 3: fingerprint pura ou formatos especiais (fp:<hex>, ai:<uid>), aceitando prefixo único
+    ai = world.find_enemy_by_identifier(arg)
+    if ai:
+        return hack_enemy_ai(player, world, ai)
+    if arg.startswith("fp:") or arg.startswith("ai:"):
+        return f"IA não encontrada (ou prefixo ambíguo): {arg}"
+
+    return "hack: argumento não corresponde a uma fingerprint válida."
+
+
+def hack_enemy_ai(player, world, ai):
+    """Hack de IA unificado com chance real, trace real e três tipos de sucesso."""
+    rng = world.rng.hack
+    # Ainda faltando o fator de foco
+    if ai.status == "bloqueada":
+        return f"{ai.fingerprint} já está bloqueado temporariamente."
+
+    hrs = 2 + int(ai.level * 1.1)
+    player.hours_pass(hrs, world)
+
+    security = 8 + ai.level * 2
+    trace_speed = 1.2 + ai.level * 0.2
+
+    temp_target = Target(
+        tid=-ai.level,
+        name=f"IA Hostil {ai.fingerprint}",
+        security=security,
+        reward=0,
+        trace_speed=trace_speed
+    )
+
+    base = calc_hack_chance(player, temp_target, world)
+    chance = max(0.01, base * 0.62)
+
+    print(f"Iniciando ataque contra IA {ai.fingerprint} (nível {ai.level})...")
+    visual_hack_roll(chance, player)
+    print("\n")
+    roll = rng.random()
+
+    if roll < chance:
+        r2 = rng.random()
+
+        player.knowledge += max(1, security // 2)
+        player.skills["recon"] += 0.02 * security
+        player.skills["exploit"] += 0.02 * security
+        player.skills["stealth"] += 0.02 * security
+        player.risk = max(0.0, player.risk - security * 0.25)
+        for k in player.skills:
+            player.skills[k] = round(player.skills[k], 2)
+
+        # sucesso crítico: remoção/comprometimento total
+        if r2 < 0.15:
+            ai.compromised = True
+            ai.reveal_fp()
+            world.remove_enemy_ai(ai)
+            world.handle_ai_removal(ai, player)
+            return (
+                f"\n[{ai.fingerprint}] Vazamento severo concluído.\n"
+                f"IA removida completamente da rede.\n"
+            )
+
+        # sucesso parcial: neutralização permanente
+        if r2 < 0.50:
+            ai.compromised = True
+            ai.reveal_fp()
+            world.remove_enemy_ai(ai)
+            world.handle_ai_removal(ai, player)
+            return (
+                f"\n[{ai.fingerprint}] Neutralizado permanentemente.\n"
+            )
+
+        # sucesso menor: bloqueio temporário
+        horas = rng.randint(24, 72)
+        ai.status = "bloqueada"
+        ai.blocked_until = player.time + timedelta(hours=horas)
+        world.schedule_unblock(ai, player)
+        return (
+            f"\n[{ai.fingerprint}] Bloqueado por {horas} horas.\n"
+        )
+
+    # FALHA
+    incr = security * (0.6 + rng.random())
+    player.risk = min(100.0, player.risk + incr)
+    player.knowledge += 0.1 * security
+
+    detected = rng.random() < (0.30 * trace_speed)
+    msg = f"Falha ao atacar IA {ai.fingerprint}. Risco +{incr:.1f}%."
+
+    if detected:
+        msg += "\nIA detectou sua intrusão. Iniciando trace..."
+        pause(1.0)
+        trace_msg = apply_trace(player, temp_target, rng)
+        if trace_msg:
+            msg += "\n" + trace_msg
+        if player.in_jail() and GAME_OVER_ON_JAIL:
+            player.game_over = True
+
+    for k in player.skills:
+        player.skills[k] = round(player.skills[k], 2)
+
+    return msg
+
+
+def cmd_job_state(player, args, world):
+    rng = world.rng.hack
+    if player.reputation.get("state", 0) < 15:
+        return "Você ainda não tem confiança suficiente do Estado."
+
+    # Alvo temporário para auditoria
+    class GovAudit:
+        def __init__(self):
+            self.security = 7 + int(player.reputation["state"] / 6)
+            self.reward = 30 + player.reputation["state"] * 3
+            self.trace_speed = 1.7
+
+    target = GovAudit()
+    title = "Auditoria Interna — Setor Classificado"
+
+    print("\n[STATE] Contrato autorizado pelo núcleo sigiloso.\n")
+    visual_mission_roll(calc_hack_chance(player, target, world), player, title)
+
+    roll = rng.random()
+    chance = calc_hack_chance(player, target, world)
+
+    if roll < chance:
+        player.money += target.reward
+        player.skills["recon"] += 1.4
+        player.skills["exploit"] += 1.4
+        player.reputation["state"] += 2
+
+        return (
+            f"Sucesso! Estado pagou ${target.reward:.2f}.\n"
+            "A vigilância agradece sua colaboração."
+        )
+    else:
+        incr = target.security * (0.8 + rng.random())
+        player.risk = min(100.0, player.risk + incr)
+        return (
+            "Falha. Os firewalls internos te estranham.\n"
+            f"Risco aumentado em {incr:.1f}%."
+        )
+
+    hrs = rng.randint(4, 8)
+    player.hours_pass(hrs, world)
+
+
+# -------------------- Loja --------------------
+SHOP = {
+    "raspberry": {"price": 150.0, "desc": "Hardware barato. +5 exploit"},
+    "proxy_pack": {"price": 300.0, "desc": "Serviços de proxy. +5 stealth"},
+    "ritaline": {"price": 120.0, "desc": "4 comprimidos. Aumenta foco, mas pode causar vício"},
+    "crawler_pack": {"price": 500.0, "desc": "Toolkit profissional de webcrawling. +6 recon"},
+    "botnet_worm": {"price": 1800.0, "desc": "Aumenta chance. +20 exploit temporário após 30 dias e baixa renda passiva", "asset": {"type": "botnet_worm", "income_per_day": 30.0}},
+    "vpn_node": {"price": 1200.0, "desc": "Nó VPN. Ajuda a proteger ativos", "asset": {"type": "vpn", "income_per_day": 0.0}},
+    "rack": {"price": 2000.0, "desc": "Rack em colo. Renda passiva", "asset": {"type": "rack", "income_per_day": 100.0}},
+    "datacenter_unit": {"price": 15000.0, "desc": "Unidade de datacenter", "asset": {"type": "datacenter", "income_per_day": 400.0}},
+    "honeypot_api": {"price": 2500.0, "desc": "API mensal que detecta honeypots automaticamente", "asset": {"type": "honeypot_api", "income_per_day": 0.0}},
+}
+
+INVENTORY_BUFFS = {
+    "raspberry": {"exploit": 5},
+    "proxy_pack": {"stealth": 5},
+    "crawler_pack": {"recon": 6}
+}
+
+def recalc_inventory_bonuses(player):
+    # zera buffs temporários
+    base = {"recon":1.0,"exploit":1.0,"stealth":1.0}
+    # soma bônus de cada item presente
+    for item in player.inventory:
+        if item in INVENTORY_BUFFS:
+            for k,v in INVENTORY_BUFFS[item].items():
+                base[k] += v
+    # aplica
+    player.skills.update(base)
+
+
+def buy_item(player, item, world):
+    if item not in SHOP:
+        return False, "Item não encontrado na loja."
+    is_asset = "asset" in SHOP[item]
+
+    # Ritaline nunca ocupa slot de inventário
+    if item != "ritaline":
+        if not is_asset and len(player.inventory) >= getattr(player, "inventory_limit", 6):
+            return False, f"Inventário cheio. Limite: {player.inventory_limit} itens."
+
+    cost = SHOP[item]["price"]
+    if player.money < cost:
+        return False, "Dinheiro insuficiente."
+
+    # se for asset, perguntar região antes de deduzir
+    if is_asset:
+        if item == "honeypot_api":
+            player.inventory.append(item)
+            return True, "honeypot_api instalado."
+
+        print(f"Regiões disponíveis para instalação:")
+        for rn, meta in world.regions.items():
+            if meta.get("unlocked"):
+                print(f" - {rn} (diff {meta.get('difficulty')}) | state:{meta.get('state')} crime:{meta.get('crime')} hx:{meta.get('hacktivists')}")
+        reg = ask("Instalar ativo em qual região? ").strip()
+        if reg not in world.regions or not world.regions[reg]["unlocked"]:
+            return False, "Região inválida ou bloqueada."
+
+    # confirmar compra
+    player.money -= cost
+
+    if item == "ritaline":
+        player.ritaline_pills += 4
+        return True, "Você comprou ritaline (4 comprimidos)."
+
+    if is_asset:
+        a = SHOP[item]["asset"].copy()
+        a["bought_at"] = player.time.isoformat()
+        a["item_name"] = item
+        a["region"] = reg
+        player.assets.append(a)
+    else:
+        player.inventory.append(item)
+        if item == "botnet_worm":
+            a = {"type": "botnet_worm", "income_per_day": 0.0, "bought_at": player.time.isoformat(), "item_name": item, "region": player.region}
+            player.assets.append(a)
+            player.skills["exploit"] += 20
+
+    recalc_inventory_bonuses(player)
+    return True, f"Comprado {item} por ${cost:.2f}."
+
+
+def cmd_buy(player, args, world):
+    if not args:
+        s = "Loja disponível:\n"
+        for k, v in SHOP.items():
+            s += f" {k} - ${v['price']:.2f} - {v['desc']}\n"
+        return s
+    item = args[0]
+    ok, msg = buy_item(player, item, world)
+    return msg
+
+
+def cmd_ritaline(player, args, world):
+    rng = world.rng.player
+    if not args:
+        return "Uso: ritaline <quantidade>"
+    try:
+        q = int(args[0])
+    except ValueError:
+        return "Quantidade inválida."
+
+    if q <= 0:
+        return "Quantidade deve ser positiva."
+
+    if player.ritaline_pills < q:
+        return "Você não possui tantos comprimidos."
+
+    player.ritaline_pills -= q
+
+    # efeito positivo
+    boost = q * 12.5
+    player.focus = min(100.0, player.focus + boost)
+
+    # chance de vício aumenta com uso
+    addiction_gain = q * rng.uniform(6.0, 16.0)
+    player.ritaline_addiction = min(100.0, player.ritaline_addiction + addiction_gain)
+
+    msg = f"Você tomou {q} comprimido(s). Foco +{boost:.1f}%."
+
+    # verificar se tornou-se viciado
+    if rng.random() < (player.ritaline_addiction / 140):
+        player.push_alert("Você desenvolveu dependência de ritaline. Foco passa a cair 2x mais rápido.")
+        player.ritaline_addicted = True
+        player.ritaline_addiction = 100.0  # inicia viciado
+        msg += " Você agora está viciado."
+
+    return msg
+
+
+def cmd_status(player, args, world):
+    jail = "Sim" if player.in_jail() else "Não"
+    assets_str = ""
+    if player.assets:
+        for i, a in enumerate(player.assets, 1):
+            name = a.get("item_name", a.get("type", "asset"))
+            assets_str += f" {i}. {name}({a.get('type')})[{a.get('region','?')}] "
+    else:
+        assets_str = "Nenhum"
+    hist_tail = list(player.command_history)[-5:]
+    recent = "\n".join(hist_tail) if hist_tail else "Nenhum"
+    inv_count = len(player.inventory)
+    inv_limit = getattr(player, "inventory_limit", 6)
+    return (
+        f"Tempo: {player.time.strftime('%Y-%m-%d %H:%M')}\n"
+        f"Região atual: {player.region}\n"
+        f"Dinheiro: ${player.money:.2f}\n"
+        f"Skills: {player.skills}\n"
+        f"Foco: {player.focus:.1f}%\n"
+        f"Risco: {player.risk:.1f}%\n"
+        f"Inventário ({inv_count}/{inv_limit}): {player.inventory}\n"
+        f"Ativos: {assets_str}\n"
+        f"Ritaline: {player.ritaline_pills} comprimidos | Vício: {player.ritaline_addiction:.1f}%\n"
+        f"Conhecimento: {player.knowledge}\n"
+        f"Reputação: {player.reputation}\n"
+        f"Dias no mundo: {world.day}\n"
+        f"IA's inimigas: {world.enemy_ai_count()}\n"
+        f"Comandos recentes:\n{recent}"
+    )
+
+
+def cmd_sleep(player, world):
+    rng = world.rng.player
+    hrs = rng.randint(8, 11)
+    player.hours_pass(hrs, world)
+    player.focus = min(100.0, player.focus + hrs * 1.8)
+    player.risk = max(0.0, player.risk - hrs * 1.3)
+    return f"Você descansou por {hrs} horas. Concentração restaurada e risco reduzido."
+
+
+def cmd_job(player, world):
+    rng = world.rng.player
+    if player.focus < MIN_FOCUS_JOB:
+        return (
+            "Você está mentalmente exausto para trabalhar.\n"
+            "Forçar agora só chamaria atenção indesejada."
+        )
+
+    hrs = rng.randint(4, 8)
+    player.hours_pass(hrs, world)
+
+    pay = rng.randint(60, 120)
+    player.money += pay
+
+    player.focus = max(0.0, player.focus - hrs * 6)
+
+    warning = ""
+    if player.focus < 30:
+        warning = " Você está exausto."
+
+    bonus_rep = rng.randint(1, 3)
+    player.reputation["state"] += bonus_rep
+    player.reputation["crime"] = max(0, player.reputation["crime"] - 1)
+
+    # punição se zerar foco
+#    if player.focus == 0:
+#        apply_zero_focus_penalty(player, world)
+
+    return (
+        f"Trabalho concluído: +${pay}. "
+        f"Concentração atual: {player.focus:.1f}%.{warning}\n"
+        f"Reputação estatal +{bonus_rep}. Crime -1."
+    )
+
+
+JOB_STATE_MIN_REP = 25   # reputação estatal que libera o job_state
+
+
+def cmd_job_state(player, args, world):
+    rng = world.rng.hack
+    if player.reputation.get("state", 0) < JOB_STATE_MIN_REP:
+        return "Você ainda não tem confiança suficiente do Estado."
+
+    # Alvo temporário para auditoria
+    class GovAudit:
+        def __init__(self):
+            self.security = 7 + int(player.reputation["state"] / 4)
+            self.reward = 1000 + player.reputation["state"] * 400
+            self.trace_speed = 0.7
+
+    target = GovAudit()
+    title = "Auditoria Interna — Setor Classificado"
+
+    print("\n[STATE] Contrato autorizado pelo núcleo sigiloso.\n")
+    visual_mission_roll(calc_hack_chance(player, target, world), player, title)
+
+    roll = rng.random()
+    chance = calc_hack_chance(player, target, world)
+
+    if roll < chance:
+        player.money += target.reward
+        player.skills["recon"] += 1.5
+        player.skills["exploit"] += 1.5
+        player.focus = min(100, player.focus + 4)
+
+        # Estado gosta — crime continua feio
+        player.reputation["state"] += 2
+        player.reputation["crime"] += 1
+
+        return (
+            f"Sucesso! Estado pagou ${target.reward:.2f}.\n"
+            "A vigilância agradece sua colaboração."
+        )
+    else:
+        incr = target.security * (0.8 + rng.random())
+        player.risk = min(100.0, player.risk + incr)
+        return (
+            "Falha. Os firewalls internos te estranham.\n"
+            f"Risco aumentado em {incr:.1f}%."
+        )
+
+
+def cmd_study(player, args, world):
+    if player.focus < MIN_FOCUS_STUDY:
+        return (
+            "Foco insuficiente para estudar.\n"
+            f"Necessário: {MIN_FOCUS_STUDY}%. Atual: {player.focus:.1f}%.\n"
+            "Talvez dormir antes seja uma boa ideia."
+        )
+
+    hrs = 4
+    if args:
+        try:
+            hrs = int(args[0])
+        except ValueError:
+            return "study: argumento inválido"
+
+    return study(player, hrs, world)
+
+
+def cmd_train(player, args):
+    if len(args) < 2:
+        return "train: uso train <skill> <pontos>"
+    skill = args[0]
+    try:
+        pts = int(args[1])
+    except ValueError:
+        return "train: pontos inválidos"
+    ok, msg = train(player, skill, pts)
+    return msg
+
+
+def cmd_assets(player, args):
+    if not player.assets:
+        return "Nenhum ativo."
+    s = "Ativos:\n"
+    for i, a in enumerate(player.assets, 1):
+        s += f" {i}. {a['type']} - renda/dia: ${a.get('income_per_day', 0.0):.2f} - região: {a.get('region','?')}\n"
+    return s
+
+
+def cmd_map(player, args, world):
+    from .art import MAP_ART
+    print(MAP_ART)
+    s = "Mapa de regiões (desbloqueio automático por tempo):\n"
+    for name, meta in world.regions.items():
+        s += (f" - {name}: {'Desbloqueado' if meta['unlocked'] else 'Bloqueado'} "
+              f"(diff {meta['difficulty']}) | state:{meta.get('state',0)} crime:{meta.get('crime',0)} hx:{meta.get('hacktivists',0)}\n")
+    return s
+
+
+def travel_cost(difficulty, mode):
+    """Preço de uma viagem até uma região de dificuldade `difficulty` (normal ou clandestino)."""
+    base_cost = 500 * difficulty
+    return base_cost if mode == "normal" else int(base_cost * 6.5)
+
+
+def cmd_travel(player, args, world):
+    rng = world.rng.player
+    if not args:
+        return "travel: uso travel <regiao> [normal|clandestino]"
+
+    region = args[0]
+    mode = args[1] if len(args) > 1 else "normal"
+    if region not in world.regions:
+        return "Região desconhecida."
+    if not world.regions[region]["unlocked"]:
+        return "Região ainda bloqueada."
+
+    # região atual pode não existir ainda
+    diff_atual = world.regions.get(getattr(player, "region", None), {}).get("difficulty", 1)
+    diff_dest = world.regions[region]["difficulty"]
+
+    base_time = 12 + 4 * diff_dest
+
+    if mode == "normal":
+        cost = travel_cost(diff_dest, mode)
+        hrs = base_time
+        risk_drop = max(1.0, abs(diff_atual - diff_dest) * 2.8)
+    elif mode == "clandestino":
+        cost = travel_cost(diff_dest, mode)
+        hrs = int(base_time * 1.6)
+        risk_drop = 42 + diff_dest * 4
+    else:
+        return "Modo inválido. Use 'normal' ou 'clandestino'."
+
+    if player.money < cost:
+        return "Dinheiro insuficiente para viajar."
+
+    # aplicação dos efeitos
+    player.money -= cost
+    player.hours_pass(hrs, world)
+    player.risk = max(0.0, player.risk - risk_drop)
+    player.region = region
+
+    # benefícios clandestinos
+    if mode == "clandestino":
+        # pequenas chances de ruído no mundo
+        if rng.random() < 0.25 and hasattr(world, "last_alerts"):
+            player.reputation["crime"] += 1
+
+        if hasattr(world, "enemy_ais"):
+            world.clear_enemy_ais()
+        if hasattr(world, "last_scan"):
+            world.last_scan.clear()
+        if hasattr(world, "last_alerts"):
+            world.last_alerts.clear()
+
+        # stealth sempre existe no Player dentro dessa estrutura
+        player.skills["stealth"] = player.skills.get("stealth", 0) + 2
+
+    from .art import ascii_travel_cutscene
+    scene = ascii_travel_cutscene(mode, region)
+
+    return (
+        scene +
+        f"Viagem realizada para {region} via {mode}.\n"
+        f"Custo: ${cost:.2f} | Tempo: {hrs}h | Risco reduzido em {risk_drop:.1f}%.\n"
+        + ("Rastro totalmente zerado. IAs perderam sua localização.\n" if mode == "clandestino" else "")
+    )
+
+
+def cmd_history(player, args):
+    return "\n".join(player.command_history) if player.command_history else "Sem histórico."
+
+
+def cmd_spawn_ai(player, args, world):
+    """Spawn manual para debug: spawn_ai [type] [region]"""
+    preferred = args[0] if args else None
+    region = args[1] if len(args) > 1 else player.region
+    ai = world.spawn_enemy_ai(preferred_type=preferred, region=region, player=player)
+    return f"IA inimiga {ai.uid} (tipo oculto) iniciada em {region} (debug spawn)."
+
+
+def cmd_news(player, args, world):
+    """news [region] — mostra notícias regionais desbloqueadas ou de uma região específica."""
+    if not args:
+        out = []
+        for region, meta in world.regions.items():
+            if meta.get("unlocked"):
+                out.append(world.generate_news_for_region(region, player))
+        return "\n\n".join(out)
+    region = args[0]
+    if region not in world.regions:
+        return "Região desconhecida."
+    if not world.regions[region]["unlocked"]:
+        return "Região bloqueada."
+    return world.generate_news_for_region(region, player)
+
+
+# -------------------- Treino e estudo --------------------
+def study(player, hrs, world):
+    player.hours_pass(hrs, world)
+    gain = max(1, int(hrs * (1 + (0.1 - (player.skills["recon"] + player.skills["exploit"]) / 2) * 0.2)))
+    player.knowledge += gain
+    player.focus = max(0.0, player.focus - hrs * 6)
+
+    if player.focus < 30:
+        warning = "Você está exausto. Sua concentração está muito baixa."
+    else:
+        warning = ""
+    return f"Estudou por {hrs} horas e ganhou {gain} pontos de conhecimento.\nConcentração atual: {player.focus:.1f}%. {warning}"
+
+
+def train(player, skill, points):
+    if skill not in player.skills:
+        return False, "Skill desconhecida."
+    if points <= 0:
+        return False, "Pontos inválidos."
+    if player.knowledge < points:
+        return False, "Conhecimento insuficiente."
+    player.knowledge -= points
+    improvement = points * 0.3
+    player.skills[skill] += improvement
+    player.skills[skill] = round(player.skills[skill], 2)
+    return True, f"{skill} aumentada em {improvement:.2f}."
+
+
+# -------------------- Utilitários --------------------
+def join_path(cwd, target):
+    import os
+    if target.startswith("/"):
+        return os.path.normpath(target)
+    return os.path.normpath(os.path.join(cwd, target))
+
+
+def ls(fs, path):
+    if path in fs and fs[path]["type"] == "dir":
+        return fs[path]["children"]
+    elif path in fs and fs[path]["type"] == "file":
+        return [path.split("/")[-1]]
+    else:
+        return None
+
+
+def cat(fs, path):
+    if path in fs and fs[path]["type"] == "file":
+        return fs[path]["content"]
+    return None
+
+
+# -------------------- Registro de comandos --------------------
+# nome -> {"handler": fn(player, world, args) -> texto ou None,
+#          "events": roda POST_COMMAND_HOOKS depois, "ends_session": encerra o shell, "hidden": fora do help}
+COMMANDS = {}
+POST_COMMAND_HOOKS = []   # fn(player, world), em ordem, depois de todo comando com events=True
+
+
+def register_command(name, handler, events=False, ends_session=False, hidden=False):
+    COMMANDS[name] = {
+        "handler": handler,
+        "events": events,
+        "ends_session": ends_session,
+        "hidden": hidden,
+    }
+    return handler
+
+
+def post_command_events(player, world):
+    """Evento aleatório e desbloqueios de reputação depois dos comandos que mexem no mundo."""
+    ev = trigger_random_event(player, world)
+    if ev: print("\n" + ev)
+    unlocks = check_reputation_unlocks(player, world)
+    for u in unlocks: print(trigger_reputation_event(player, world, u))
+
+
+POST_COMMAND_HOOKS.append(post_command_events)
+
+
+def cmd_drop(player, args):
+    if not args:
+        return "drop: especificar item"
+    item = args[0]
+    if item in player.inventory:
+        player.inventory.remove(item)
+        recalc_inventory_bonuses(player)
+        return f"Item {item} descartado."
+    return "Item não encontrado no inventário."
+
+
+def cmd_remove_asset(player, args):
+    if not args:
+        return "remove_asset: especificar índice do ativo"
+    try:
+        idx = int(args[0]) - 1
+    except ValueError:
+        return "Índice inválido."
+    if 0 <= idx < len(player.assets):
+        removed = player.assets.pop(idx)
+        return f"Ativo {removed.get('item_name', removed.get('type'))} removido."
+    return "Índice inválido."
+
+
+def cmd_job_state_cooldown(player, args, world):
+    """job_state com o intervalo de 7 a 15 dias entre usos."""
+    if player.next_job_state_time and player.time < player.next_job_state_time:
+        delta = player.next_job_state_time - player.time
+        dias = delta.days
+        horas = delta.seconds // 3600
+        return f"job_state indisponível. Aguarde {dias} dia(s) e {horas} hora(s)."
+    out = cmd_job_state(player, args, world)
+    # sortear intervalo entre 7 e 15 dias
+    wait_days = world.rng.player.randint(7, 15)
+    player.next_job_state_time = player.time + timedelta(days=wait_days)
+    world.scheduler.schedule(world.day_of(player, player.next_job_state_time), "job_state_ready")
+    return out
+
+
+def cmd_mission(player, args, world):
+    if not args:
+        return "Usage: mission <id>"
+    success, m = attempt_special_mission(player, world, args[0])
+    return m
+
+
+# mesma ordem do help
+register_command("help", lambda player, world, args: cmd_help())
+register_command("ls", lambda player, world, args: cmd_ls(player, args))
+register_command("cd", lambda player, world, args: cmd_cd(player, args))
+register_command("cat", lambda player, world, args: cmd_cat(player, args))
+register_command("scan", lambda player, world, args: cmd_scan(player, args, world), events=True)
+register_command("connect", lambda player, world, args: cmd_connect(player, args, world), events=True)
+register_command("hack", lambda player, world, args: cmd_hack(player, args, world), events=True)
+register_command("buy", lambda player, world, args: cmd_buy(player, args, world), events=True)
+register_command("drop", lambda player, world, args: cmd_drop(player, args))
+register_command("remove_asset", lambda player, world, args: cmd_remove_asset(player, args))
+register_command("status", lambda player, world, args: cmd_status(player, args, world))
+register_command("ritaline", lambda player, world, args: cmd_ritaline(player, args, world), hidden=True)
+register_command("sleep", lambda player, world, args: cmd_sleep(player, world), events=True)
+register_command("study", lambda player, world, args: cmd_study(player, args, world), events=True)
+register_command("train", lambda player, world, args: cmd_train(player, args), events=True)
+register_command("jobs", lambda player, world, args: cmd_job(player, world), events=True)
+register_command("job_state", lambda player, world, args: cmd_job_state_cooldown(player, args, world),
+                 events=True)
+register_command("assets", lambda player, world, args: cmd_assets(player, args))
+register_command("map", lambda player, world, args: cmd_map(player, args, world))
+register_command("travel", lambda player, world, args: cmd_travel(player, args, world), events=True)
+register_command("mission", lambda player, world, args: cmd_mission(player, args, world), events=True)
+register_command("history", lambda player, world, args: cmd_history(player, args))
+register_command("spawn_ai", lambda player, world, args: cmd_spawn_ai(player, args, world))
+register_command("news", lambda player, world, args: cmd_news(player, args, world))
+register_command("exit", lambda player, world, args: "Encerrado.", ends_session=True)
+
+
+def cmd_save(player, args, world):
+    path = args[0] if args else SAVE_PATH
+    try:
+        size = save_game(path, player, world)
+    except (OSError, TypeError) as exc:
+        return f"save: falhou ({exc})"
+    return f"Jogo salvo em {path} ({size / 1024:.1f} KB)."
+
+
+register_command("save", lambda player, world, args: cmd_save(player, args, world))
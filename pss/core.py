@@ -0,0 +1,5186 @@
+"""
+Motor do jogo: jogador, mundo, IAs, mecânicas, execução headless/batch, save, journal e benchmarks.
+
+A arte (art.py), os textos das missões (narrative.py) e os comandos do shell (commands.py) são
+importados só no primeiro uso; os nomes deles continuam acessíveis por aqui (ver __getattr__).
+"""
+
+import time
+import random
+import sys
+import hashlib
+import os
+import re
+import math
+import heapq
+import bisect
+import itertools
+import operator
+import struct
+from array import array
+from collections import Counter, deque
+from collections.abc import Mapping
+from types import MappingProxyType
+from datetime import datetime, timedelta
+
+from importlib.util import find_spec
+
+
+class _LazyModule:
+    """
+    Módulo importado só no primeiro acesso a um atributo. Depois disso o nome global
+    passa a apontar para o módulo de verdade, sem custo extra nos acessos seguintes.
+    """
+
+    def __init__(self, name, alias):
+        self._name = name
+        self._alias = alias
+
+    def __getattr__(self, attr):
+        import importlib
+        module = importlib.import_module(self._name)
+        globals()[self._alias] = module
+        return getattr(module, attr)
+
+    def __repr__(self):
+        return f"<módulo {self._name} (ainda não importado)>"
+
+
+# NumPy é opcional (BatchWorld, populações e pools grandes) e custa ~100 ms
+# para importar: só carrega quando um desses caminhos é usado de fato
+np = _LazyModule("numpy", "np") if find_spec("numpy") is not None else None
+
+# Configurações globais
+GAME_OVER_ON_JAIL = True
+START_DATE = datetime(2095, 11, 1, 8, 0)
+RNG_SEED = None  # coloque um int para runs reproduzíveis
+MIN_FOCUS_STUDY = 35
+MIN_FOCUS_JOB = 25
+FAST_FORWARD = False   # hours_pass longos pulam dias calmos em vez de simular dia a dia
+FAST_FORWARD_STRIDE = 30  # máximo de dias calmos pulados de uma vez
+HEADLESS = False       # True durante simulações sem terminal (sem pausas de animação)
+PROMPT_HANDLER = None  # callable(prompt) -> str usado no lugar de input() quando definido
+RECORD_PATH = None     # arquivo de gravação da sessão (--record); ver SessionRecorder
+RECORDER = None        # SessionRecorder ativo: recebe comandos e respostas de ask()
+SAVE_PATH = "pss.sav"  # arquivo padrão do comando save
+LOAD_PATH = None       # save a retomar no repl (--load)
+JOURNAL_PATH = None    # prefixo do journal da sessão (--journal): <prefixo>.snap + <prefixo>.log
+JOURNAL = None         # Journal ativo: recebe comandos e respostas e compacta em snapshots
+CLOCK_ENV = "PSS_CLOCK"  # real | instant | turbo | fator (ex.: 4 ou x4); o mesmo que --clock
+TURBO_FACTOR = 8.0
+FAST_START_ENV = "PSS_FAST_START"  # 1 = boot comprimido; o mesmo que --fast-start
+FAST_START = os.environ.get(FAST_START_ENV, "").lower() in ("1", "true", "yes", "on")
+BRIBE_COST = (150, 750)   # faixa do suborno na fiscalização
+
+
+class Clock:
+    """
+    Relógio das animações e pausas dramáticas: real, acelerado (×N) ou instantâneo.
+    Só muda quanto tempo de parede as pausas custam; o tempo de jogo não passa por aqui.
+    `elapsed` acumula o tempo virtual pedido, inclusive no modo instantâneo.
+    """
+
+    def __init__(self, mode="real", factor=1.0):
+        if mode not in ("real", "scaled", "instant"):
+            raise ValueError(f"modo de relógio desconhecido: {mode}")
+        if mode == "scaled" and factor <= 0:
+            raise ValueError("fator do relógio deve ser positivo")
+        self.mode = mode
+        self.factor = factor if mode == "scaled" else 1.0
+        self.elapsed = 0.0
+
+    @classmethod
+    def from_spec(cls, spec):
+        spec = (spec or "real").strip().lower()
+        if spec in ("real", "instant"):
+            return cls(spec)
+        if spec == "turbo":
+            return cls("scaled", TURBO_FACTOR)
+        try:
+            return cls("scaled", float(spec.lstrip("x")))
+        except ValueError:
+            raise ValueError(f"relógio inválido: {spec!r} (use real, instant, turbo ou um fator como x4)")
+
+    def sleep(self, seconds):
+        if seconds <= 0:
+            return
+        self.elapsed += seconds
+        if self.mode == "instant":
+            return
+        time.sleep(seconds / self.factor)
+
+    def __repr__(self):
+        return f"Clock({self.mode!r}, factor={self.factor})"
+
+
+CLOCK = Clock.from_spec(os.environ.get(CLOCK_ENV))
+
+
+def set_clock(spec):
+    """Troca o relógio global (spec como em PSS_CLOCK) e devolve o novo."""
+    global CLOCK
+    CLOCK = spec if isinstance(spec, Clock) else Clock.from_spec(spec)
+    return CLOCK
+
+def clear_screen():
+    RENDERER.clear()
+
+
+def pause(seconds):
+    """Pausa de animação, medida pelo relógio global; ignorada no modo headless."""
+    if HEADLESS:
+        return
+    CLOCK.sleep(seconds)
+
+
+def ask(prompt):
+    """Pergunta interativa dentro do jogo (eventos, loja). Bots respondem via PROMPT_HANDLER."""
+    answer = PROMPT_HANDLER(prompt) if PROMPT_HANDLER is not None else input(prompt)
+    if RECORDER is not None:
+        RECORDER.answer(answer)
+    if JOURNAL is not None:
+        JOURNAL.answer(answer)
+    return answer
+
+#def clear_screen():
+#    print("\033c", end="")
+
+
+# -------------------- Terminal --------------------
+ANSI_CLEAR = "\x1b[2J\x1b[3J\x1b[H"   # limpa tela e scrollback, cursor no topo
+
+
+class Renderer:
+    """
+    Saída das animações. Cada quadro vira um único os.write de bytes (pré-codificados com
+    frames()), e limpar a tela é uma sequência ANSI em vez de um processo `clear`.
+    Fora de um TTY (pipe, arquivo, headless) os quadros transitórios são descartados e só
+    o texto que fica na tela é escrito. Sempre escreve no sys.stdout do momento, então
+    redirect_stdout continua funcionando.
+    """
+
+    def __init__(self, stream=None):
+        self._stream = stream
+        self._tty = (None, False)   # (stream, isatty) em cache: isatty custa uma syscall
+        self.writes = 0             # escritas feitas (quadros + linhas), para medições
+
+    @property
+    def stream(self):
+        return self._stream or sys.stdout
+
+    def is_tty(self):
+        stream = self.stream
+        if self._tty[0] is not stream:
+            try:
+                self._tty = (stream, stream.isatty())
+            except (AttributeError, ValueError):
+                self._tty = (stream, False)
+        return self._tty[1]
+
+    def encode(self, text):
+        return text.encode(getattr(self.stream, "encoding", None) or "utf-8", errors="replace")
+
+    def frames(self, texts):
+        """Pré-codifica quadros estáticos para reutilizar sem recodificar a cada exibição."""
+        return [self.encode(t) for t in texts]
+
+    def write(self, data):
+        """Texto que permanece na tela (str ou bytes): sempre escrito, numa única chamada."""
+        stream = self.stream
+        try:
+            fd = stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            fd = None
+        if fd is None:
+            stream.write(data if isinstance(data, str) else data.decode("utf-8", errors="replace"))
+            stream.flush()
+        else:
+            if isinstance(data, str):
+                data = self.encode(data)
+            stream.flush()   # o que o print() deixou no buffer sai antes, na ordem certa
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        self.writes += 1
+
+    def frame(self, data):
+        """Quadro transitório de animação: descartado fora de um terminal e em modo headless/batch."""
+        if HEADLESS or not self.is_tty():
+            return False
+        self.write(data)
+        return True
+
+    def clear(self):
+        if not self.is_tty():
+            return
+        if os.name == "nt" and not os.environ.get("WT_SESSION"):
+            os.system("cls")   # console clássico do Windows não interpreta ANSI
+            return
+        self.write(ANSI_CLEAR)
+
+
+RENDERER = Renderer()
+
+if RNG_SEED is not None:
+    random.seed(RNG_SEED)
+
+
+# -------------------- Modelos --------------------
+class Reputation(dict):
+    """Reputação por facção que anota quais facções mudaram desde a última checagem de missões."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dirty = set(self)
+
+    def __setitem__(self, faction, value):
+        if self.get(faction) != value:
+            self.dirty.add(faction)
+        super().__setitem__(faction, value)
+
+    def update(self, *args, **kwargs):
+        for faction, value in dict(*args, **kwargs).items():
+            self[faction] = value
+
+    def setdefault(self, faction, default=None):
+        if faction not in self:
+            self[faction] = default
+        return self[faction]
+
+
+class Player:
+    def __init__(self):
+        self.name = ""
+        self.money = 75.0
+        self.focus = 100.0
+        self.ritaline_pills = 0
+        self.ritaline_addiction = 0.0  # 0 a 100, chance de vício
+        self.time = START_DATE
+        self.skills = {"recon": 1.0, "exploit": 1.0, "stealth": 1.0}
+        self.risk = 0.0  # risco individual (mantido fora dos metadados regionais)
+        self.fs = default_filesystem()
+        self.cwd = "/home"
+        self.inventory = []
+        self.inventory_limit = 6
+        self.assets = []
+        self.jailed_until = None
+        self.knowledge = 0
+        self.game_over = False
+        # reputações globais do jogador
+        self.reputation = Reputation({"hacktivists": 0, "state": 0, "crime": 0})
+        self.command_history = deque(maxlen=200)
+        self.known_enemy_fps = {}   # {fingerprint: {"id":ai.uid, "first_seen": datetime, "meta":{}}}
+        self.local_alerts = deque(maxlen=200)  # mensagens importantes recebidas
+        self.region = "NorthAmerica"  # região onde o jogador está baseado/inicialmente
+        self.next_job_state_time = None
+
+    def record_enemy_fingerprint(self, ai):
+        fp = ai.fingerprint
+        if not fp or fp == "UNKNOWN":
+            return
+        if fp not in self.known_enemy_fps:
+            self.known_enemy_fps[fp] = {
+                "id": ai.uid,
+                "first_seen": self.time,
+                "level": ai.level,
+                "note": "",
+                "type_known": getattr(ai, "type", "Unknown") if getattr(ai, "revealed_type", False) else None,
+            }
+
+    def push_alert(self, text, delay=True):
+        ts = self.time.strftime("%Y-%m-%d %H:%M")
+        self.local_alerts.append(f"{ts} | {text}")
+        print(f"\n...{text}\n")
+        if delay:
+            pause(1.0)
+
+    def hours_pass(self, hrs, world):
+        """Avança tempo e dispara efeitos diários quando um dia completo passa."""
+
+        # Redução de foco
+        decay = hrs * 0.32231
+        addicted = getattr(self, "ritaline_addicted", False)
+
+        # Caso ainda esteja viciado, foco decai mais rápido
+        if addicted:
+            decay *= 2
+
+        self.focus = max(0.0, self.focus - decay)
+
+        old_time = self.time
+        self.time += timedelta(hours=hrs)
+
+        # risco decai com o tempo
+        self.risk = max(0.0, self.risk - hrs * 0.17)
+
+        # Decaimento do vício
+        self.ritaline_addiction = max(0.0, self.ritaline_addiction - hrs * 0.12)
+
+        # Se vício chegou a zero → cura da dependência
+        if addicted and self.ritaline_addiction <= 0:
+            self.ritaline_addicted = False
+            self.push_alert("Seu vício foi superado. Seu foco agora decai normalmente.")
+
+        # renda passiva e efeitos de dia
+        self._generate_passive_income(old_time, self.time, world.rng.player)
+        days_passed = (self.time.date() - old_time.date()).days
+        if FAST_FORWARD and days_passed > 1:
+            world.fast_forward(self, days_passed)
+            return
+        for _ in range(days_passed):
+            world.advance_day(self)
+
+    def in_jail(self):
+        return self.jailed_until and self.time < self.jailed_until
+
+    def _generate_passive_income(self, t0, t1, rng=random):
+        days = (t1.date() - t0.date()).days
+        if days <= 0:
+            return
+        income = 0.0
+        for a in self.assets:
+            income += a.get("income_per_day", 0.0) * days
+        if income > 0:
+            self.money += income
+            # manutenção eventual
+            if rng.random() < 0.05 * days:
+                cost = min(self.money, 30 * days)
+                self.money -= cost
+
+    def record_command(self, line):
+        self.command_history.append(f"{self.time.strftime('%Y-%m-%d %H:%M')} $ {line}")
+
+    def maybe_game_over(self):
+        if self.in_jail() and GAME_OVER_ON_JAIL:
+            self.game_over = True
+
+
+class Target:
+    def __init__(self, tid, name, security, reward, trace_speed, region=None, hints=None, honeypot=False):
+        self.id = tid
+        self.name = name
+        self.security = security
+        self.reward = reward
+        self.trace_speed = trace_speed
+        self.region = region
+        self.hints = hints or []
+        self.honeypot = honeypot
+        self.fake_security = security
+
+
+TARGET_NAMES = (
+    "Servidor universitário", "Empresa média", "Data center pequeno",
+    "Banco local", "Serviço de e-mail", "Operadora", "Cloud node", "Nó IoT",
+)
+HONEYPOT_CHANCE = 0.25
+TARGET_TABLE_NUMPY_MIN = 256   # pools diários normais (até ~21 alvos) saem mais rápido no laço em Python
+
+
+def target_hints(security):
+    if security <= 2:
+        return ["porta 22 aberta", "login fraco"]
+    elif security <= 5:
+        return ["firewall ativo", "vpn", "patches moderados"]
+    return ["IDS presente", "monitoramento 24h", "segurança física"]
+
+
+class TargetTable:
+    """
+    Pool diário de alvos em colunas (listas paralelas, uma linha por alvo). Objetos Target só
+    são criados quando scan/connect/hack tocam a linha, e ficam em cache para manter a identidade.
+    """
+
+    COLUMNS = ("ids", "region_codes", "security", "reward", "trace_speed", "name_codes",
+               "honeypot", "fake_security", "fake_reward")
+
+    def __init__(self, regions, **columns):
+        self.regions = list(regions)        # region_codes indexam aqui
+        for name in self.COLUMNS:
+            setattr(self, name, columns.get(name, []))
+        self._row_by_id = None          # id -> linha, montado na primeira busca
+        self._views = {}
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def from_targets(cls, targets, regions):
+        table = cls(regions)
+        for t in targets:
+            table.append(t)
+        return table
+
+    def region_of(self, row):
+        return self.regions[self.region_codes[row]]
+
+    def view(self, row):
+        t = self._views.get(row)
+        if t is None:
+            security = self.security[row]
+            region = self.region_of(row)
+            t = Target(self.ids[row], f"{TARGET_NAMES[self.name_codes[row]]} ({region})", security,
+                       self.reward[row], self.trace_speed[row], region=region, hints=target_hints(security))
+            if self.honeypot[row]:
+                t.is_honeypot = True
+                t.fake_security = self.fake_security[row]
+                t.fake_reward = self.fake_reward[row]
+            self._views[row] = t
+        return t
+
+    def views(self):
+        return [self.view(row) for row in range(len(self.ids))]
+
+    def get(self, tid):
+        if self._row_by_id is None:
+            self._row_by_id = {t: row for row, t in enumerate(self.ids)}
+        row = self._row_by_id.get(tid)
+        return None if row is None else self.view(row)
+
+    def append(self, target):
+        """Acrescenta um Target já existente (dica anônima, pool montado à mão); ele vira a view da linha."""
+        row = len(self.ids)
+        region = getattr(target, "region", None) or "Global"
+        if region not in self.regions:
+            self.regions.append(region)
+        honeypot = bool(getattr(target, "is_honeypot", False))
+        self.ids.append(target.id)
+        self.region_codes.append(self.regions.index(region))
+        self.security.append(target.security)
+        self.reward.append(getattr(target, "reward", 0))
+        self.trace_speed.append(getattr(target, "trace_speed", 1.0))
+        self.name_codes.append(0)
+        self.honeypot.append(honeypot)
+        self.fake_security.append(getattr(target, "fake_security", target.security))
+        self.fake_reward.append(getattr(target, "fake_reward", getattr(target, "reward", 0)))
+        if self._row_by_id is not None:
+            self._row_by_id[target.id] = row
+        self._views[row] = target
+        return row
+
+
+def generate_target_table(regions, first_tid, rng):
+    """
+    Sorteia o pool do dia (1 + dificuldade alvos por região desbloqueada, embaralhados) de uma vez.
+    Em pools grandes com NumPy cada coluna sai de uma única chamada vetorizada; senão, um laço sobre as colunas.
+    As distribuições são as de World._make_random_target.
+    """
+    names = list(regions)
+    codes, diffs = [], []
+    for code, name in enumerate(names):
+        meta = regions[name]
+        if meta["unlocked"]:
+            codes += [code] * (1 + meta["difficulty"])
+            diffs += [meta["difficulty"]] * (1 + meta["difficulty"])
+    n = len(codes)
+
+    if np is not None and n >= TARGET_TABLE_NUMPY_MIN:
+        g = rng.generator()
+        diff = np.asarray(diffs, dtype=float)
+        security = np.clip(np.rint(g.normal(diff * 1.8, 1.5)), 1, 30).astype(np.int64)
+        reward = (50 * security ** 1.6 * g.uniform(0.6, 1.4, n)).astype(np.int64)
+        trace_speed = np.maximum(0.4, g.uniform(0.5, 1.5, n) * (1 + (security - 1) * 0.08))
+        name_codes = g.integers(0, len(TARGET_NAMES), n)
+        honeypot = g.random(n) < HONEYPOT_CHANCE
+        fake_security = np.where(honeypot, g.integers(1, 5, n), security)
+        fake_reward = np.where(honeypot, (reward * g.uniform(0.6, 0.9, n)).astype(np.int64), reward)
+        order = g.permutation(n)
+        columns = {
+            "ids": (first_tid + order).tolist(),
+            "region_codes": np.asarray(codes)[order].tolist(),
+            "security": security[order].tolist(),
+            "reward": reward[order].tolist(),
+            "trace_speed": trace_speed[order].tolist(),
+            "name_codes": name_codes[order].tolist(),
+            "honeypot": honeypot[order].tolist(),
+            "fake_security": fake_security[order].tolist(),
+            "fake_reward": fake_reward[order].tolist(),
+        }
+        return TargetTable(names, **columns)
+
+    rows = []
+    for i, (code, diff) in enumerate(zip(codes, diffs)):
+        security = max(1, min(30, int(round(rng.gauss(diff * 1.8, 1.5)))))
+        reward = int(50 * (security ** 1.6) * rng.uniform(0.6, 1.4))
+        trace_speed = max(0.4, rng.uniform(0.5, 1.5) * (1 + (security - 1) * 0.08))
+        name_code = rng.randrange(len(TARGET_NAMES))
+        if rng.random() < HONEYPOT_CHANCE:
+            rows.append((first_tid + i, code, security, reward, trace_speed, name_code,
+                         True, rng.randint(1, 4), int(reward * rng.uniform(0.6, 0.9))))
+        else:
+            rows.append((first_tid + i, code, security, reward, trace_speed, name_code, False, security, reward))
+    rng.shuffle(rows)
+    return TargetTable(names, **dict(zip(TargetTable.COLUMNS, map(list, zip(*rows)))))
+
+
+# -------------------- Aleatoriedade --------------------
+# cada World tem seus próprios streams, um por subsistema: mexer no número de sorteios de um
+# (ex.: um scan a mais) não desloca a sequência dos outros, e vários mundos convivem no processo
+RNG_STREAMS = ("ai", "spawns", "regions", "targets", "scan", "assets", "hack", "events", "player", "fast_forward")
+
+
+def derive_seed(master_seed, index):
+    """Semente independente e reprodutível do item `index` (campanha, stream) a partir da semente mestre."""
+    digest = hashlib.sha256(f"{master_seed}:{index}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def rng_backend():
+    """
+    "numpy" ou "python". Os sorteios escalares dos streams (random, uniforms, sample_binomial) são
+    os mesmos nos dois; só os caminhos vetorizados (RandomStream.generator: pools de alvos com
+    TARGET_TABLE_NUMPY_MIN+ linhas, BatchWorld) existem apenas com NumPy e seguem outra sequência.
+    """
+    return "python" if np is None else "numpy"
+
+
+def switch_rng_backend(name):
+    """
+    Passa a sortear como o backend `name` (de rng_backend(); None = o atual) e devolve o valor
+    anterior de `np`, para quem chamou restaurar. Só dá para descer de "numpy" para "python":
+    uma sessão gravada com NumPy não roda sem ele (ValueError).
+    """
+    global np
+    old = np
+    if name is None or name == rng_backend():
+        return old
+    if name == "numpy":
+        raise ValueError("sessão gravada com NumPy; instale numpy para reexecutá-la")
+    if name != "python":
+        raise ValueError(f"backend de RNG desconhecido: {name!r}")
+    np = None
+    return old
+
+
+class RandomStream(random.Random):
+    """
+    random.Random com sorteios em lote (uniforms) e, com NumPy, um Generator próprio para os
+    caminhos vetorizados. random() é sempre o Mersenne Twister da instância: a mesma semente dá a
+    mesma sequência com ou sem NumPy instalado.
+    """
+
+    def seed(self, a=None, version=2):
+        super().seed(a, version)
+        self._generator = None
+
+    def generator(self):
+        """Generator do NumPy próprio do stream, para sorteios vetorizados (requer NumPy)."""
+        if self._generator is None:
+            self._generator = np.random.default_rng(self.getrandbits(64))
+        return self._generator
+
+    def uniforms(self, n):
+        """n sorteios em [0, 1) de uma vez (para laços que sabem quantos precisam)."""
+        r = self.random
+        return [r() for _ in itertools.repeat(None, n)]
+
+
+class WorldRNG:
+    """Streams aleatórios nomeados de um World, todos derivados de uma única semente."""
+
+    def __init__(self, seed):
+        self.seed = seed
+
+    def __getattr__(self, name):
+        # streams nascem no primeiro uso (a semente de cada um não depende da ordem de criação)
+        if name not in RNG_STREAMS:
+            raise AttributeError(name)
+        return self.stream(name)
+
+    def stream(self, name):
+        if name not in self.__dict__:
+            setattr(self, name, RandomStream(derive_seed(self.seed, name)))
+        return self.__dict__[name]
+
+
+# -------------------- Agenda de eventos --------------------
+# fases dentro de um dia, na ordem de advance_day
+PHASE_DAWN = 0      # antes das IAs agirem (desbloqueios de regiões e de IAs)
+PHASE_ASSETS = 1    # depois das IAs (efeitos mensais de ativos)
+PHASE_EVENTS = 2    # depois da rotação de alvos (eventos regionais, avisos)
+
+REGION_UNLOCK_DAYS = {7: "SouthAmerica", 15: "Europe", 30: "Asia", 90: "Global"}
+
+# estado inicial das regiões de um mundo novo (World e BatchWorld partem daqui)
+REGION_DEFAULTS = {
+    "NorthAmerica": {"unlocked": True, "difficulty": 1, "state": 2, "crime": 3, "hacktivists": 5},
+    "SouthAmerica": {"unlocked": False, "difficulty": 2, "state": 3, "crime": 6, "hacktivists": 2},
+    "Europe": {"unlocked": False, "difficulty": 3, "state": 6, "crime": 3, "hacktivists": 4},
+    "Asia": {"unlocked": False, "difficulty": 4, "state": 4, "crime": 5, "hacktivists": 5},
+    "Global": {"unlocked": False, "difficulty": 6, "state": 5, "crime": 8, "hacktivists": 6},
+}
+
+# tendências regionais (padrões que influenciam as flutuações)
+REGION_TRENDS = {
+    "NorthAmerica": {"state": 0, "crime": 0, "hacktivists": 0},
+    "SouthAmerica": {"state": 1, "crime": 1, "hacktivists": -1},
+    "Europe": {"state": 1, "crime": -1, "hacktivists": 1},
+    "Asia": {"state": -1, "crime": 1, "hacktivists": 1},
+    "Global": {"state": 0, "crime": 1, "hacktivists": 1},
+}
+
+# chance diária por ponto de metadado regional dos eventos de ativos (metadados vão de 0 a 20)
+ASSET_EVENT_RATES = {"crime": 0.01, "state": 0.01, "hacktivists": 0.008}
+
+
+class Scheduler:
+    """Fila de prioridade de efeitos do mundo, indexada por (dia simulado, fase)."""
+
+    def __init__(self):
+        self._heap = []
+        self._seq = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def schedule(self, day, kind, payload=None, phase=PHASE_EVENTS):
+        heapq.heappush(self._heap, (day, phase, self._seq, kind, payload))
+        self._seq += 1
+
+    def next_day(self):
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, day, phase):
+        """Entrega (kind, payload) de tudo que vence até (day, phase), inclusive o que for agendado durante a iteração."""
+        while self._heap and self._heap[0][:2] <= (day, phase):
+            _, _, _, kind, payload = heapq.heappop(self._heap)
+            yield kind, payload
+
+
+def geometric_gap(p, rng=random):
+    """Dias sem disparo antes do primeiro sucesso de um Bernoulli diário de chance p."""
+    if p <= 0.0:
+        return math.inf
+    if p >= 1.0:
+        return 0
+    return int(math.log(1.0 - rng.random()) / math.log(1.0 - p))
+
+
+# -------------------- Índices --------------------
+MIN_ID_PREFIX = 3   # prefixos mais curtos que isso só casam por igualdade
+
+
+class PrefixIndex:
+    """Dicionário chave -> objeto com as chaves também numa lista ordenada, para busca por prefixo único."""
+
+    def __init__(self):
+        self._items = {}
+        self._keys = []
+
+    def __len__(self):
+        return len(self._items)
+
+    def add(self, key, value):
+        if key not in self._items:
+            bisect.insort(self._keys, key)
+        self._items[key] = value
+
+    def update(self, pairs):
+        """Inserção em lote (carregar um save): ordena as chaves uma vez em vez de um insort por item."""
+        self._items.update(pairs)
+        self._keys = sorted(self._items)
+
+    def discard(self, key):
+        if self._items.pop(key, None) is not None:
+            i = bisect.bisect_left(self._keys, key)
+            del self._keys[i]
+
+    def clear(self):
+        self._items.clear()
+        self._keys.clear()
+
+    def get(self, key):
+        return self._items.get(key)
+
+    def find(self, key):
+        """Igualdade exata; senão, o único item cuja chave começa com `key` (None se nenhum ou ambíguo)."""
+        hit = self._items.get(key)
+        if hit is not None or len(key) < MIN_ID_PREFIX:
+            return hit
+        i = bisect.bisect_left(self._keys, key)
+        if i == len(self._keys) or not self._keys[i].startswith(key):
+            return None
+        if i + 1 < len(self._keys) and self._keys[i + 1].startswith(key):
+            return None
+        return self._items[self._keys[i]]
+
+
+# -------------------- Mundo dinâmico --------------------
+class World:
+    def __init__(self, seed=None):
+        # sem semente explícita, deriva do `random` global (RNG_SEED / --seed continuam valendo)
+        self.rng = WorldRNG(random.getrandbits(64) if seed is None else seed)
+        self.day = 0
+        self.regions = {name: dict(meta) for name, meta in REGION_DEFAULTS.items()}
+        self.target_table = TargetTable(self.regions)   # pool de alvos disponíveis (colunas; ver global_targets)
+        self.next_tid = 1
+        self.enemy_ais = AIPopulation()   # EnemyAI ativos, em colunas
+        self.ai_swarms = {}               # (região, tipo) -> enxame de IAs distantes (ver new_swarm)
+        self._lod_next = 0                # população individual acima da qual compactar de novo
+        self._ai_by_uid = PrefixIndex()
+        self._ai_by_fp = None          # fingerprint real -> EnemyAI, montado na primeira busca
+        self._ai_by_revealed = PrefixIndex()   # só fingerprints já reveladas ao jogador
+        # agregados mantidos incrementalmente (spawn, evolução mensal, remoção, rotação de alvos)
+        self.ai_level_sum = 0
+        self.ai_type_counts = {t: 0 for t in AI_TYPES}      # tipo real
+        self.ai_visible_counts = {t: 0 for t in AI_TYPES}   # tipo como aparece no noticiário
+        self.honeypot_count = 0
+        self.last_scan = []
+        self.last_alerts = deque(maxlen=500)
+        self.ai_activity_logs = []     # feedback textual das IAs (novo, antes logs indefinido)
+        self._forced_rolls = deque()   # resultados pré-sorteados pelo fast-forward (ver _chance)
+        self._pending_drift = None
+        self.scheduler = Scheduler()
+        self._watched_assets = {}      # id(asset) -> asset com eventos regionais agendados
+        for unlock_day, region in REGION_UNLOCK_DAYS.items():
+            self.scheduler.schedule(unlock_day, "unlock", region, phase=PHASE_DAWN)
+        self.scheduler.schedule(30, "monthly_assets", phase=PHASE_ASSETS)
+        self.generate_daily_targets()
+        self.missions_def = MISSION_CATALOG   # catálogo compartilhado por todos os mundos (imutável)
+
+        # tendências regionais (padrões que influenciam as flutuações)
+        self.region_trends = {name: dict(trend) for name, trend in REGION_TRENDS.items()}
+
+    def advance_day(self, player):
+        """Avança um dia no mundo: IAs evoluem, metadados regionais mudam e eventos disparam."""
+        self.day += 1
+        # IAs envelhecem junto com o calendário (evoluções são calculadas na leitura)
+        self.ai_level_sum += self.enemy_ais.age(1) + self._age_swarms(1)
+
+        # desbloqueio progressivo de regiões e fim de bloqueios de IAs
+        self._run_scheduled(player, PHASE_DAWN)
+
+        # IAs inimigas agem, todas de uma vez (IAs comprometidas já saíram no hack)
+        for ai, msg in self.enemy_ais.act(player, self):
+            self.last_alerts.append((self.day, msg))
+            # registro adicional em ai_activity_logs para feedback detalhado
+            self.ai_activity_logs.append(f"Day {self.day} - AI-{ai.uid}: {msg}")
+        for swarm, msg in self._swarms_act(player):
+            self.last_alerts.append((self.day, msg))
+            self.ai_activity_logs.append(f"Day {self.day} - Enxame {swarm['region']}/{swarm['type']}: {msg}")
+
+        # ativos com efeitos
+        self._run_scheduled(player, PHASE_ASSETS)
+
+        # nova rotação diária de alvos
+        self.generate_daily_targets()
+
+        # eventos regionais relacionados a ativos e metadados regionais
+        self._watch_assets(player, self.day)
+        self._run_scheduled(player, PHASE_EVENTS)
+
+        # pequenas flutuações regionais guiadas por tendências
+        self._drift_regions()
+
+        # spawn dinâmico de IAs conforme metadados regionais e reputações globais
+        self.dynamic_ai_spawns(player)
+        if len(self.enemy_ais) > max(AI_LOD_POPULATION, self._lod_next):
+            self.compact_enemy_ais(player)
+
+        # resultados forçados pelo fast-forward valem só para este dia
+        self._forced_rolls.clear()
+
+    def _run_scheduled(self, player, phase):
+        for kind, payload in self.scheduler.pop_due(self.day, phase):
+            self._handle_scheduled(kind, payload, player)
+
+    def _handle_scheduled(self, kind, payload, player):
+        if kind == "unlock":
+            self.regions[payload]["unlocked"] = True
+            self.last_alerts.append((self.day, f"{payload} foi desbloqueada."))
+
+        elif kind == "unblock":
+            ai = payload
+            if ai.status != "bloqueada" or not ai.blocked_until:
+                return
+            if player.time >= ai.blocked_until:
+                ai.status = "ativa"
+                ai.blocked_until = None
+            else:
+                self.scheduler.schedule(self.day + 1, "unblock", ai, phase=PHASE_DAWN)
+
+        elif kind == "monthly_assets":
+            self._monthly_asset_effects(player)
+            self.scheduler.schedule(self.day + 30, "monthly_assets", phase=PHASE_ASSETS)
+
+        elif kind == "asset_event":
+            self._regional_asset_event(player, *payload)
+
+        elif kind == "job_state_ready":
+            # fim silencioso do intervalo entre usos de job_state
+            if player.next_job_state_time and player.time >= player.next_job_state_time:
+                player.next_job_state_time = None
+            elif player.next_job_state_time:
+                self.scheduler.schedule(self.day + 1, "job_state_ready")
+
+    def day_of(self, player, when):
+        """Dia do mundo em que o relógio do jogador chega à data de `when`."""
+        return self.day + (when.date() - player.time.date()).days
+
+    def schedule_unblock(self, ai, player):
+        self.scheduler.schedule(self.day_of(player, ai.blocked_until), "unblock", ai, phase=PHASE_DAWN)
+
+    def _monthly_asset_effects(self, player):
+        for asset in list(player.assets):
+            if asset.get("type") == "botnet_worm":
+                player.skills["exploit"] += 10 # verificar ganho real quando ativado
+                self.last_alerts.append((self.day, "Botnet worm forneceu impulso temporário de exploit."))
+            elif asset.get("type") == "honeypot_api": #???? talvez eu tire isso futuramente
+                detected = self._detect_honeypots(verbose=False)
+                if detected:
+                    self.last_alerts.append((self.day, f"Honeypot API detectou {detected} honeypots na malha."))
+
+    def _watch_assets(self, player, first_day):
+        """Agenda os eventos regionais de ativos novos; o dia de cada evento é sorteado geometricamente."""
+        for asset in player.assets:
+            if id(asset) in self._watched_assets or asset.get("region") not in self.regions:
+                continue
+            self._watched_assets[id(asset)] = asset
+            for key, rate in ASSET_EVENT_RATES.items():
+                self.scheduler.schedule(first_day + geometric_gap(20 * rate, self.rng.assets), "asset_event", (asset, key))
+
+    def _regional_asset_event(self, player, asset, key):
+        """
+        Dia candidato de um evento regional. O sorteio geométrico usa a chance máxima
+        (metadado 20); aqui o evento é aceito com chance_real / chance_máxima (thinning).
+        """
+        rng = self.rng.assets
+        if not any(a is asset for a in player.assets):
+            self._watched_assets.pop(id(asset), None)
+            return
+        reg = asset.get("region")
+        meta = self.regions[reg]
+        self.scheduler.schedule(self.day + 1 + geometric_gap(20 * ASSET_EVENT_RATES[key], rng), "asset_event", (asset, key))
+        if rng.random() >= meta[key] / 20:
+            return
+
+        if key == "crime":
+            # perda de rendimento quando crime alta
+            asset["income_per_day"] = asset.get("income_per_day", 0.0) * 0.7
+            self.last_alerts.append((self.day, f"Evento regional: ativo '{asset.get('item_name', asset.get('type'))}' impactado por crime em {reg}."))
+        elif key == "state":
+            # ações estatais (inspeções) quando state alto -> aumenta risco
+            player.risk = min(100.0, player.risk + 3)
+            self.last_alerts.append((self.day, f"Inspeção administrativa em {reg}: risco do jogador levemente aumentado."))
+        else:
+            # hacktivistas podem gerar conhecimento ou pequenas bonificações
+            player.knowledge += 1
+            self.last_alerts.append((self.day, f"Coletivo em {reg} compartilhou informações. +1 conhecimento."))
+
+    def _drift_regions(self):
+        rng = self.rng.regions
+        if self._pending_drift is not None:
+            # drift do dia já sorteado pelo fast-forward
+            for rname, values in self._pending_drift.items():
+                self.regions[rname].update(values)
+            self._pending_drift = None
+            return
+        for rname, meta in self.regions.items():
+            trend = self.region_trends.get(rname, {"state": 0, "crime": 0, "hacktivists": 0})
+            for key in ("state", "crime", "hacktivists"):
+                base_change = rng.choice([-1, 0, 1])
+                if rng.random() < 0.15:
+                    base_change += trend.get(key, 0) * rng.choice([0, 1])
+                if rng.random() < 0.02:
+                    base_change += rng.choice([-3, -2, 2, 3])
+                meta[key] = max(0, min(20, meta.get(key, 0) + base_change))
+
+    def dynamic_ai_spawns(self, player):
+        """Gera IAs conforme condições regionais e reputações do jogador."""
+        spawns = self.rng.spawns
+        for rname, meta in self.regions.items():
+            if not meta.get("unlocked"):
+                continue
+            base_chance = 0.003 + meta["crime"] * 0.003 + meta["state"] * 0.002 + meta["hacktivists"] * 0.001
+            base_chance += min(0.03, self.day / 1000.0)
+
+            # Pirata
+            if meta["state"] >= 10 and self._chance(base_chance * 1.0, spawns):
+                ai = self.spawn_enemy_ai(preferred_type="Pirata", region=rname, player=player)
+                self.last_alerts.append((self.day, f"Nova IA suspeita tipo 'Pirata' detectada em {rname}: {ai.uid}"))
+
+            # Federal
+            if meta["crime"] >= 10 and self._chance(base_chance * 0.7, spawns):
+                ai = self.spawn_enemy_ai(preferred_type="Federal", region=rname, player=player)
+                self.last_alerts.append((self.day, f"Nova IA suspeita tipo 'Federal' monitorando {rname}: {ai.uid}"))
+
+            # Hacktivista
+            if meta["hacktivists"] >= 9 and self._chance(base_chance * 0.5, spawns):
+                ai = self.spawn_enemy_ai(preferred_type="Hacktivista", region=rname, player=player)
+                self.last_alerts.append((self.day, f"Coletivo digital (IA) ativo em {rname}: {ai.uid}"))
+
+        # spawns reativos à reputação do jogador
+        if player.reputation.get("state", 0) >= 18 and self._chance(0.1, spawns):
+            ai = self.spawn_enemy_ai(preferred_type="Pirata", region=player.region, player=player)
+            self.last_alerts.append((self.day, f"IA Pirata emergiu por resposta às suas ações estatais: {ai.uid}"))
+        if player.reputation.get("crime", 0) >= 18 and self._chance(0.1, spawns):
+            ai = self.spawn_enemy_ai(preferred_type="Federal", region=player.region, player=player)
+            self.last_alerts.append((self.day, f"IA Federal emergiu por resposta às suas ações criminais: {ai.uid}"))
+        if any(v > 20 for v in player.reputation.values()) and self._chance(0.08, spawns):
+            ai = self.spawn_enemy_ai(preferred_type="Hacktivista", region=player.region, player=player)
+            self.last_alerts.append((self.day, f"IA Hacktivista começou a monitorar suas ações: {ai.uid}"))
+
+    def _chance(self, p, rng):
+        """Teste de Bernoulli diário. O fast-forward pode pré-decidir os primeiros resultados do dia."""
+        if self._forced_rolls:
+            return self._forced_rolls.popleft()
+        return rng.random() < p
+
+    # ---- fast-forward ----
+    # Cada teste de Bernoulli do dia (ação de IA, spawn) é uma "fonte"; eventos de ativos vivem na agenda.
+    # Os dias calmos são pulados sorteando geometricamente o próximo dia candidato com limites
+    # superiores das probabilidades (thinning); no dia candidato as probabilidades reais decidem
+    # se houve evento. Assim o resultado tem a mesma distribuição do passo a passo.
+
+    def _hazard_sources(self, player, horizon):
+        """Fontes do dia na ordem de avaliação de advance_day: lista de (tipo, ref, limite superior)."""
+        sources = []
+        risk_term = min(0.6, player.risk / 100.0)
+        for ai in self.enemy_ais:
+            if ai.compromised or ai.status == "bloqueada":
+                continue
+            ups = (ai.age_days % 30 + horizon) // 30   # evoluções mensais possíveis no trecho
+            sources.append(("ai", ai, min(1.0, ai.aggression + 0.03 * ups + risk_term)))
+        for swarm in self.ai_swarms.values():
+            # cada membro evolui no máximo uma vez a cada 30 dias
+            p = swarm_member_p(swarm, risk_term, ups=-(-horizon // 30))
+            sources.append(("swarm", swarm, 1.0 - (1.0 - p) ** swarm["count"]))
+
+        spawn_max = 0.003 + 20 * 0.006 + 0.03
+        for rname, meta in self.regions.items():
+            if not meta.get("unlocked"):
+                continue
+            sources.append(("spawn", (rname, "state", 10, 1.0), spawn_max * 1.0))
+            sources.append(("spawn", (rname, "crime", 10, 0.7), spawn_max * 0.7))
+            sources.append(("spawn", (rname, "hacktivists", 9, 0.5), spawn_max * 0.5))
+
+        if player.reputation.get("state", 0) >= 18:
+            sources.append(("react", None, 0.1))
+        if player.reputation.get("crime", 0) >= 18:
+            sources.append(("react", None, 0.1))
+        if any(v > 20 for v in player.reputation.values()):
+            sources.append(("react", None, 0.08))
+        return sources
+
+    def _sample_drift(self, days):
+        """Sorteia os metadados regionais após `days` dias de drift, sem aplicá-los."""
+        rng = self.rng.fast_forward
+        drift = {}
+        for rname, meta in self.regions.items():
+            trend = self.region_trends.get(rname, {"state": 0, "crime": 0, "hacktivists": 0})
+            drift[rname] = {
+                key: sample_index(drift_transition(trend.get(key, 0), days)[meta.get(key, 0)], rng)
+                for key in ("state", "crime", "hacktivists")
+            }
+        return drift
+
+    def _quiet_horizon(self, player, limit):
+        """Quantos dias a partir de amanhã podem ser pulados antes do próximo item da agenda."""
+        horizon = min(limit, FAST_FORWARD_STRIDE)
+        nxt = self.scheduler.next_day()
+        if nxt is not None:
+            horizon = min(horizon, nxt - self.day - 1)
+        return max(0, horizon)
+
+    def _skip_quiet_days(self, player, days, drift=None):
+        """Aplica `days` dias sem nenhum evento estocástico: calendário, idade das IAs e drift regional."""
+        if days <= 0:
+            return
+        self.day += days
+        self.ai_level_sum += self.enemy_ais.age(days) + self._age_swarms(days)
+        if drift is None:
+            drift = self._sample_drift(days)
+        for rname, values in drift.items():
+            self.regions[rname].update(values)
+
+    def _resolve_candidate_day(self, player, sources):
+        """
+        Decide o dia candidato. Retorna (forçados, drift): forçados é None se nenhuma fonte
+        disparou de fato; senão, a lista de resultados até o primeiro disparo, na ordem dos testes.
+        """
+        rng = self.rng.fast_forward
+        bounds = [b for _, _, b in sources]
+        first = len(sample_first_firing(bounds, rng)) - 1
+        if first < 0:
+            return None, self._sample_drift(1)
+        candidates = {first}
+        for i in range(first + 1, len(bounds)):
+            if rng.random() < bounds[i]:
+                candidates.add(i)
+
+        drift = self._sample_drift(1)
+        risk_term = min(0.6, player.risk / 100.0)
+        day = self.day + 1
+        outcomes = []   # resultado de cada teste que de fato existirá no dia
+        for i, (kind, ref, bound) in enumerate(sources):
+            if kind == "ai":
+                aggression = ref.aggression
+                if (ref.age_days + 1) % 30 == 0:
+                    aggression = min(1.0, aggression + 0.03)
+                p = aggression + risk_term
+            elif kind == "swarm":
+                swarm = dict(ref)   # cópia rasa: a evolução de amanhã só mexe nas somas
+                swarm_age(swarm, self.day, 1)
+                p = 1.0 - (1.0 - swarm_member_p(swarm, risk_term)) ** swarm["count"]
+            elif kind == "spawn":
+                rname, key, minimum, factor = ref
+                meta = drift[rname]
+                if meta[key] < minimum:
+                    continue  # teste não existe com os metadados de hoje
+                p = (0.003 + meta["crime"] * 0.003 + meta["state"] * 0.002 + meta["hacktivists"] * 0.001
+                     + min(0.03, day / 1000.0)) * factor
+            else:
+                p = bound
+            fired = i in candidates and bound > 0 and rng.random() < p / bound
+            outcomes.append(fired)
+            if fired:
+                return outcomes, drift
+        return None, drift
+
+    def fast_forward(self, player, days):
+        """
+        Equivalente a `days` chamadas de advance_day, pulando os dias em que nenhum teste de
+        Bernoulli dispara. Dias com itens na agenda e dias com eventos usam o passo normal.
+        """
+        remaining = days
+        stale_targets = False
+        while remaining > 0:
+            self._watch_assets(player, self.day + 1)
+            horizon = self._quiet_horizon(player, remaining)
+            if horizon > 0:
+                sources = self._hazard_sources(player, horizon)
+                gap = sample_first_event_gap([b for _, _, b in sources], self.rng.fast_forward)
+                if gap >= horizon:
+                    self._skip_quiet_days(player, horizon)
+                    remaining -= horizon
+                    stale_targets = True
+                    continue
+                self._skip_quiet_days(player, gap)
+                remaining -= gap
+                forced, drift = self._resolve_candidate_day(player, sources)
+                if forced is None:
+                    self._skip_quiet_days(player, 1, drift=drift)
+                    remaining -= 1
+                    stale_targets = True
+                    continue
+                self._forced_rolls.extend(forced)
+                self._pending_drift = drift
+            elif stale_targets:
+                # a honeypot API mensal conta os alvos do dia anterior
+                self.generate_daily_targets()
+            self.advance_day(player)
+            remaining -= 1
+            stale_targets = False
+
+        # a rotação diária de alvos só importa no último dia
+        if stale_targets:
+            self.generate_daily_targets()
+
+    def _detect_honeypots(self, verbose=False):
+        """Analisa a rede e conta honeypots nos targets atuais."""
+        if not verbose:
+            return self.honeypot_count
+        table = self.target_table
+        count = 0
+        for row in range(len(table)):
+            if table.honeypot[row]:
+                count += 1
+                t = table.view(row)
+                print(f"[⚠️ Honeypot API] Alvo suspeito detectado: {t.name} (Segurança aparente: {t.fake_security}, região: {t.region})")
+        if count == 0:
+            print("[Honeypot API] Nenhum honeypot detectado nesta varredura.")
+        return count
+
+    @property
+    def global_targets(self):
+        """Pool do dia como objetos Target (materializa todas as linhas; prefira target_table)."""
+        return self.target_table.views()
+
+    @global_targets.setter
+    def global_targets(self, targets):
+        self.target_table = TargetTable.from_targets(targets, self.regions)
+        self.honeypot_count = sum(self.target_table.honeypot)
+
+    def generate_daily_targets(self):
+        """Gera targets por região com chance de honeypots."""
+        self.target_table = generate_target_table(self.regions, self.next_tid, self.rng.targets)
+        self.next_tid += len(self.target_table)
+        self.honeypot_count = sum(self.target_table.honeypot)
+
+    def _make_random_target(self, region, diff):
+        rng = self.rng.targets
+        tid = self.next_tid
+        self.next_tid += 1
+        security = max(1, min(30, int(round(rng.gauss(diff * 1.8, 1.5)))))
+        reward = int(50 * (security ** 1.6) * rng.uniform(0.6, 1.4))
+        trace_speed = max(0.4, rng.uniform(0.5, 1.5) * (1 + (security - 1) * 0.08))
+        name = rng.choice(TARGET_NAMES) + f" ({region})"
+        return Target(tid, name, security, reward, trace_speed, region=region, hints=target_hints(security))
+
+    def add_target(self, target):
+        """Acrescenta um alvo avulso (ex.: dica anônima) ao pool do dia."""
+        self.target_table.append(target)
+        if getattr(target, "is_honeypot", False):
+            self.honeypot_count += 1
+
+    def find_target(self, tid):
+        """
+        Alvo por id: pool atual em O(1); senão, algum do último scan que já saiu do pool
+        (ids nunca se repetem, então a ordem da busca não muda o resultado).
+        """
+        target = self.target_table.get(tid)
+        if target is None:
+            for t in self.last_scan:
+                if t.id == tid:
+                    return t
+        return target
+
+    def get_targets_for_scan(self, player, limit=6):
+        """Retorna lista de Target visíveis; segurança real só revelada em connect."""
+        rng = self.rng.scan
+        table = self.target_table
+
+        # Filtrar por região (mantendo regra atual), direto nas colunas
+        visible = [
+            code for code, name in enumerate(table.regions)
+            if name == player.region or self.regions.get(name, {}).get("unlocked", False)
+        ]
+        if len(visible) == len(table.regions):
+            pool = list(range(len(table)))
+        else:
+            visible = set(visible)
+            pool = [row for row, code in enumerate(table.region_codes) if code in visible]
+
+        # Se nada no pool, volta para fallback global (nunca scan vazio)
+        if not pool:
+            pool = list(range(len(table)))
+
+        # Lógica original de pesos (uniform(0.7, 1.2) sorteado em bloco)
+        recon = player.skills.get("recon", 0)
+        na = table.regions.index("NorthAmerica") if "NorthAmerica" in table.regions else -1
+        security, codes = table.security, table.region_codes
+        weights = []
+        for row, jitter in zip(pool, rng.uniforms(len(pool))):
+            base = 0.2 + recon / (security[row] + 1)
+            if codes[row] == na:
+                base += 0.3
+            base = max(0.02, min(0.95, base * (0.7 + 0.5 * jitter)))
+            weights.append(base)
+
+        chosen = [table.view(row) for row in weighted_sample(pool, weights, limit, rng)]
+        self.last_scan = chosen
+        return chosen
+
+    def spawn_enemy_ai(self, preferred_type=None, region=None, player=None):
+        """Cria uma nova EnemyAI mantendo regras originais de nível e tipo."""
+        rng = self.rng.spawns
+        base_level = 1 + self.day // 30
+        if region and region in self.regions:
+            base_level += max(0, self.regions[region]["difficulty"] - 1)
+
+        if preferred_type == "Pirata" and player:
+            lvl = base_level + max(0, player.reputation.get("state", 0) // 6)
+        elif preferred_type == "Federal" and player:
+            lvl = base_level + max(0, player.reputation.get("crime", 0) // 6)
+        elif preferred_type == "Hacktivista" and player:
+            lvl = base_level + max(0, player.reputation.get("hacktivists", 0) // 6)
+        else:
+            lvl = base_level + rng.randint(0, 2)
+
+        ai = EnemyAI(level=max(1, lvl), uid=f"{rng.getrandbits(32):08x}")
+        ai.region = region or "Global"
+
+        if preferred_type:
+            ai.type = preferred_type
+        else:
+            if region and region in self.regions:
+                meta = self.regions[region]
+                choices = []
+                if meta["state"] >= 6:
+                    choices += ["Pirata"] * (meta["state"] // 2)
+                if meta["crime"] >= 6:
+                    choices += ["Federal"] * (meta["crime"] // 2)
+                if meta["hacktivists"] >= 4:
+                    choices += ["Hacktivista"] * (meta["hacktivists"] // 2)
+                if not choices:
+                    choices = ["Generic"]
+                ai.type = rng.choice(choices)
+            else:
+                ai.type = rng.choice(["Generic", "Pirata", "Federal", "Hacktivista"])
+
+        ai.apply_type_traits()
+        self.enemy_ais.append(ai)
+        self._ai_by_uid.add(ai.uid, ai)
+        if self._ai_by_fp is not None:
+            self._ai_by_fp[ai._fp_real] = ai
+        self._count_ai(ai, 1)
+        return ai
+
+    def _count_ai(self, ai, sign):
+        self.ai_level_sum += sign * ai.level
+        self.ai_type_counts[ai.type] = self.ai_type_counts.get(ai.type, 0) + sign
+        visible = ai.type if getattr(ai, "revealed_type", False) else "Generic"
+        self.ai_visible_counts[visible] = self.ai_visible_counts.get(visible, 0) + sign
+
+    def reveal_enemy(self, ai):
+        """Revela a fingerprint da IA e a torna buscável por prefixo."""
+        ai.reveal_fp()
+        if ai in self.enemy_ais:
+            self._ai_by_revealed.add(ai.fingerprint, ai)
+
+    def remove_enemy_ai(self, ai):
+        try:
+            self.enemy_ais.remove(ai)
+        except ValueError:
+            return
+        self._ai_by_uid.discard(ai.uid)
+        if self._ai_by_fp is not None:
+            self._ai_by_fp.pop(ai._fp_real, None)
+        self._ai_by_revealed.discard(ai.fingerprint)
+        self._count_ai(ai, -1)
+
+    def clear_enemy_ais(self):
+        self.enemy_ais.clear()
+        self.ai_swarms = {}
+        self._ai_by_uid.clear()
+        self._ai_by_fp = None
+        self._ai_by_revealed.clear()
+        self.ai_level_sum = 0
+        self.ai_type_counts = {t: 0 for t in AI_TYPES}
+        self.ai_visible_counts = {t: 0 for t in AI_TYPES}
+
+    # ---- enxames (nível de detalhe) ----
+
+    def enemy_ai_count(self):
+        """IAs individuais mais os membros dos enxames."""
+        return len(self.enemy_ais) + sum(swarm["count"] for swarm in self.ai_swarms.values())
+
+    def _age_swarms(self, days):
+        """Chamado depois de avançar o calendário `days` dias; retorna os níveis ganhos."""
+        start = self.day - days
+        return sum(swarm_age(swarm, start, days) for swarm in self.ai_swarms.values())
+
+    def _swarms_act(self, player):
+        """
+        Dia de cada enxame, depois das IAs individuais: um teste decide se algum membro age
+        (o fast-forward enxerga só esse) e, se sim, _swarm_day resolve os que agem.
+        """
+        rng = self.rng.ai
+        out = []
+        for swarm in list(self.ai_swarms.values()):
+            n = swarm["count"]
+            p = swarm_member_p(swarm, min(0.6, player.risk / 100.0))
+            any_p = 1.0 - (1.0 - p) ** n
+            if not self._chance(any_p, rng):
+                continue
+            # posição do primeiro membro que age, dado que algum age (geométrica truncada em n)
+            first = 0 if p >= 1.0 else min(n - 1, int(math.log(1.0 - rng.random() * any_p) / math.log(1.0 - p)))
+            out.append((swarm, self._swarm_day(swarm, first, player)))
+        return out
+
+    def _swarm_day(self, swarm, first, player):
+        """
+        Membros do enxame na ordem, como IAs individuais: cada um age com a chance do risco deixado
+        pelos anteriores. Enquanto esse risco ainda muda a chance (termo abaixo de 0.6), quem age
+        é resolvido um a um e o próximo sai de um salto geométrico; depois disso (ou passados
+        SWARM_EXACT_ACTIONS membros) a chance fica fixa e o resto é uma binomial aplicada em lote.
+        """
+        rng = self.rng.ai
+        n = swarm["count"]
+        before = swarm_snapshot(player)
+        pos, acting = first, 0
+        while True:
+            swarm_apply(swarm, 1, player, rng)
+            acting += 1
+            risk_term = min(0.6, player.risk / 100.0)
+            p = swarm_member_p(swarm, risk_term)
+            if risk_term >= 0.6 or acting >= SWARM_EXACT_ACTIONS:
+                break
+            pos += 1 + min(n, geometric_gap(p, rng))
+            if pos >= n:
+                break
+        if pos < n - 1:
+            extra = sample_binomial(n - 1 - pos, p, rng)
+            swarm_apply(swarm, extra, player, rng)
+            acting += extra
+        return swarm_report(swarm, acting, player, before)
+
+    def compact_enemy_ais(self, player):
+        """
+        Passa para os enxames as IAs ativas, não reveladas, de nível baixo e fora da região do
+        jogador. Se ainda sobrarem mais de AI_LOD_TARGET, entram também as mais antigas das outras
+        (de fora da região do jogador primeiro, qualquer nível), para a população individual ficar
+        limitada mesmo com spawns reativos de nível alto. Continuam contadas em ai_level_sum e
+        nos totais por tipo. Retorna quantas saíram.
+        """
+        pop = self.enemy_ais
+        pop.refresh_all()
+        active = pop.code(pop.status_names, "ativa")
+        # nível base de spawn de cada região hoje (ver spawn_enemy_ai) mais a margem
+        base = 1 + self.day // 30 + AI_LOD_LEVEL_MARGIN
+        max_level = {name: base + max(0, meta["difficulty"] - 1) for name, meta in self.regions.items()}
+        mergeable = [row for row, ai in enumerate(pop.ais)
+                     if pop.status_codes[row] == active and ai.fingerprint == "UNKNOWN"]
+        rows = [row for row in mergeable
+                if pop.level[row] <= max_level.get(pop.ais[row].region, base) and pop.ais[row].region != player.region]
+        excess = len(pop) - len(rows) - AI_LOD_TARGET
+        if excess > 0:
+            chosen = set(rows)
+            rest = sorted((row for row in mergeable if row not in chosen),
+                          key=lambda row: (pop.ais[row].region == player.region, row))
+            rows += rest[:excess]
+        if rows:
+            for row in rows:
+                ai = pop.ais[row]
+                key = (ai.region, pop.type_names[pop.type_codes[row]])
+                swarm = self.ai_swarms.get(key) or self.ai_swarms.setdefault(key, new_swarm(*key))
+                swarm_absorb(swarm, pop.level[row], pop.aggression[row], pop.trace_power[row], pop.spawn_day[row])
+            pop.drop(rows)
+            # só aqui o conjunto de IAs individuais muda: índices refeitos uma vez, em lote
+            self._ai_by_uid = PrefixIndex()
+            self._ai_by_uid.update((ai.uid, ai) for ai in pop)
+            self._ai_by_fp = None
+        # a próxima compactação só quando os spawns passarem do que sobrou por mais uma folga
+        self._lod_next = len(pop) + AI_LOD_POPULATION - AI_LOD_TARGET
+        return len(rows)
+
+    def swarm_regions(self):
+        """região -> (membros, soma dos níveis) somando os enxames de todos os tipos."""
+        out = {}
+        for (region, _), swarm in sorted(self.ai_swarms.items()):
+            count, level_sum = out.get(region, (0, 0))
+            out[region] = (count + swarm["count"], level_sum + swarm["level_sum"])
+        return out
+
+    def materialize_swarm_member(self, region):
+        """
+        Traz de volta como EnemyAI um membro de algum enxame de `region` (enxame sorteado pelo
+        tamanho). Já estava contado nos agregados do mundo. None se a região não tem enxame.
+        """
+        rng = self.rng.spawns
+        swarms = [swarm for (r, _), swarm in sorted(self.ai_swarms.items()) if r == region]
+        if not swarms:
+            return None
+        swarm = swarms[sample_index([s["count"] for s in swarms], rng)]
+        values = swarm_release(swarm, self.day, rng)
+        if not swarm["count"]:
+            del self.ai_swarms[(swarm["region"], swarm["type"])]
+        ai = EnemyAI(level=values[0], uid=f"{rng.getrandbits(32):08x}")
+        ai.region = region
+        self.enemy_ais.adopt(ai, values)
+        self._ai_by_uid.add(ai.uid, ai)
+        if self._ai_by_fp is not None:
+            self._ai_by_fp[ai._fp_real] = ai
+        return ai
+
+    def find_enemy_by_identifier(self, identifier):
+        """
+        Procura por ai:<uid> (debug) e por fingerprint, com ou sem fp:. A fingerprint real casa
+        só por igualdade; fingerprints já reveladas também por prefixo único (ex.: fp:3FA).
+        """
+        if not identifier:
+            return None
+        key = identifier.strip()
+        if key.startswith("ai:"):
+            return self._ai_by_uid.find(key[3:].lower())
+        if key.startswith("fp:"):
+            key = key[3:]
+        key = key.upper()
+        if self._ai_by_fp is None:
+            self._ai_by_fp = {ai._fp_real: ai for ai in self.enemy_ais}
+        return self._ai_by_fp.get(key) or self._ai_by_revealed.find(key)
+
+
+    def generate_news_for_region(self, region, player):
+        """Gera feed de notícias para a região considerando estado regional e jogador."""
+        if region not in self.regions:
+            return "Região desconhecida."
+
+        meta = self.regions[region]
+        out = []
+
+        # crime
+        if meta.get("crime", 0) > 10:
+            out.append(f"[{region}] Relatos indicam expansão de atividades criminosas organizadas — rotas e mercados sob pressão.")
+        elif meta.get("crime", 0) > 5:
+            out.append(f"[{region}] Atividades criminosas acima da média; cidadãos e empresas em alerta.")
+        else:
+            out.append(f"[{region}] Atividades criminosas estáveis, sem grandes surtos reportados.")
+
+        # state
+        if meta.get("state", 0) > 10:
+            out.append(f"[{region}] Autoridades estatais aumentam operações digitais; protocolos de investigação ampliados.")
+        elif meta.get("state", 0) > 5:
+            out.append(f"[{region}] Maior presença estatal em vigilância de infraestruturas críticas.")
+        else:
+            out.append(f"[{region}] Atuação estatal em níveis rotineiros.")
+
+        # hacktivists
+        if meta.get("hacktivists", 0) > 10:
+            out.append(f"[{region}] Movimentos digitais organizados realizam campanhas de alto impacto — redes locais influenciadas.")
+        elif meta.get("hacktivists", 0) > 4:
+            out.append(f"[{region}] Comunidades de segurança publicaram ferramentas e guias de auditoria pública.")
+        else:
+            out.append(f"[{region}] Atividade hacktivista discreta, focada em pesquisa e divulgação técnica.")
+
+        # IAs
+        if self.enemy_ais or self.ai_swarms:
+            counts = self.ai_visible_counts
+            total = self.enemy_ai_count()
+            out.append(f"[{region}] Analistas reportam {total} agentes autônomos suspeitos operando na malha.")
+            if counts.get("Pirata"):
+                out.append(f"[{region}] {counts['Pirata']} potencial(is) 'Pirata' em atividade (relatos não confirmados).")
+            if counts.get("Federal"):
+                out.append(f"[{region}] {counts['Federal']} detectados com comportamento 'Federal' (monitoramento agressivo).")
+            if counts.get("Hacktivista"):
+                out.append(f"[{region}] {counts['Hacktivista']} operações atribuídas a coletivos digitais.")
+
+        # notícias reativas à reputação do jogador
+        if player.reputation.get("hacktivists", 0) > 10:
+            out.append(f"[{region}] Relatos de operações pró-transparência aumentaram. Analistas investigam possíveis autores anônimos.")
+        if player.reputation.get("crime", 0) > 12:
+            out.append(f"[{region}] Fontes policiais observam a presença de um operador com histórico criminoso em várias regiões.")
+
+        # lore: Singularity (progressivo)
+        if self.day > 60:
+            out.append(f"[{region}] Pesquisadores detectaram padrões anômalos na malha: sinais de uma entidade distribuída ainda sem explicação.")
+        if self.day > 120:
+            out.append(f"[{region}] Discussões públicas sobre uma possível 'Singularity' ganham tração; comunidade científica em alerta.")
+        if self.day > 200:
+            out.append(f"[{region}] Observadores relatam múltiplas manifestações de comportamento autoconsciente na rede. Investigações em curso.")
+
+        # manchetes extremas
+        if meta.get("crime", 0) >= 15:
+            out.append(f"[{region}] Manchete: 'Colapso em áreas criminais — medidas excepcionais consideradas.'")
+        if meta.get("state", 0) >= 15:
+            out.append(f"[{region}] Manchete: 'Estado amplia poderes digitais — debate sobre liberdades civis.'")
+        if meta.get("hacktivists", 0) >= 15:
+            out.append(f"[{region}] Manchete: 'Coletivos digitais coordenam grandes vazamentos e campanhas.'")
+
+        if not out:
+            out.append(f"[{region}] Nenhuma notícia relevante encontrada neste momento.")
+
+        return "\n".join(out)
+
+    def handle_ai_removal(self, ai, player):
+        """
+        Revele tipo e aplique recompensas de reputação conforme tipo da IA.
+        """
+        rng = self.rng.ai
+        ai.revealed_type = True
+        typ = getattr(ai, "type", "Generic")
+        if typ == "Pirata":
+            gained_state = rng.randint(1, 3)
+            gained_hx = rng.randint(1, 2)
+            player.reputation["state"] += gained_state
+            player.reputation["hacktivists"] += gained_hx
+            self.last_alerts.append((self.day, f"IA Pirata ({ai.uid}) removida. Reputação: state +{gained_state}, hacktivists +{gained_hx}."))
+        elif typ == "Federal":
+            gained_crime = rng.randint(1, 3)
+            gained_hx = rng.randint(1, 2)
+            player.reputation["crime"] += gained_crime
+            player.reputation["hacktivists"] += gained_hx
+            self.last_alerts.append((self.day, f"IA Federal ({ai.uid}) removida. Reputação: crime +{gained_crime}, hacktivists +{gained_hx}."))
+        elif typ == "Hacktivista":
+            gained_crime = rng.randint(1, 3)
+            gained_state = rng.randint(1, 3)
+            gained_hx = rng.randint(2, 5)
+            player.reputation["crime"] += gained_crime
+            player.reputation["state"] += gained_state
+            player.reputation["hacktivists"] += gained_hx
+            self.last_alerts.append((self.day, f"IA Hacktivista ({ai.uid}) neutralizada. Reputação: hacktivists +{gained_hx}."))
+        else:
+            player.reputation["hacktivists"] += 1
+            self.last_alerts.append((self.day, f"IA genérica ({ai.uid}) removida. Reputação hacktivists +1."))
+
+
+# -------------------- Mundo vetorizado (NumPy) --------------------
+META_KEYS = ("state", "crime", "hacktivists")
+SKILL_KEYS = ("recon", "exploit", "stealth")
+REP_KEYS = ("hacktivists", "state", "crime")
+AI_TYPES = ("Generic", "Pirata", "Federal", "Hacktivista")
+ASSET_TYPES = ("botnet_worm", "vpn", "rack", "datacenter", "honeypot_api")
+
+
+class BatchWorld:
+    """
+    N mundos independentes avançando em lockstep, com estado em arrays NumPy.
+
+    Reproduz a dinâmica diária de World.advance_day (IAs, ativos, drift regional, spawns)
+    e de Player.hours_pass (decaimentos e renda passiva) para um jogador passivo, ou seja,
+    sem comandos de shell. Cada mundo tem a mesma distribuição de resultados do motor
+    escalar; usado para estudos de balanceamento Monte Carlo.
+    """
+
+    def __init__(self, n, seed=None, ai_capacity=32, asset_capacity=8):
+        if np is None:
+            raise RuntimeError("BatchWorld requer NumPy (pip install numpy).")
+        self.n = n
+        self.rng = np.random.default_rng(seed)
+        self.day = 0
+        self.clock = START_DATE.hour + START_DATE.minute / 60.0  # horas desde a meia-noite do dia 0
+
+        regions = REGION_DEFAULTS
+        self.region_names = list(regions)
+        self.difficulty = np.array([regions[r]["difficulty"] for r in self.region_names])
+        self.unlocked = np.tile(np.array([regions[r]["unlocked"] for r in self.region_names]), (n, 1))
+        self.meta = np.tile(np.array([[regions[r][k] for k in META_KEYS] for r in self.region_names]), (n, 1, 1))
+        self.trend = np.array([[REGION_TRENDS[r][k] for k in META_KEYS] for r in self.region_names])
+        self.unlock_index = {d: self.region_names.index(r) for d, r in REGION_UNLOCK_DAYS.items()}
+
+        p = Player()
+        self.money = np.full(n, p.money)
+        self.focus = np.full(n, p.focus)
+        self.risk = np.full(n, p.risk)
+        self.knowledge = np.zeros(n)
+        self.ritaline_addiction = np.full(n, p.ritaline_addiction)
+        self.addicted = np.zeros(n, dtype=bool)
+        self.skills = np.tile(np.array([p.skills[k] for k in SKILL_KEYS]), (n, 1))
+        self.reputation = np.tile(np.array([p.reputation[k] for k in REP_KEYS]), (n, 1))
+        self.player_region = np.full(n, self.region_names.index(p.region))
+
+        self.asset_active = np.zeros((n, asset_capacity), dtype=bool)
+        self.asset_income = np.zeros((n, asset_capacity))
+        self.asset_region = np.zeros((n, asset_capacity), dtype=np.int64)
+        self.asset_type = np.zeros((n, asset_capacity), dtype=np.int64)
+
+        self.ai_active = np.zeros((n, ai_capacity), dtype=bool)
+        self.ai_level = np.zeros((n, ai_capacity), dtype=np.int64)
+        self.ai_aggression = np.zeros((n, ai_capacity))
+        self.ai_trace = np.zeros((n, ai_capacity))
+        self.ai_type = np.zeros((n, ai_capacity), dtype=np.int64)
+        self.ai_age = np.zeros((n, ai_capacity), dtype=np.int64)
+        self.ai_region = np.zeros((n, ai_capacity), dtype=np.int64)
+        self.ai_count = 0   # slots em uso (IAs não são removidas sem comandos do jogador)
+
+    # ---- configuração ----
+    def add_asset(self, item, region):
+        """Instala o ativo `item` da loja em `region` em todos os mundos (sem cobrar)."""
+        from .commands import SHOP
+        template = SHOP[item]["asset"]
+        free = ~self.asset_active
+        if not free.any(axis=1).all():
+            self._grow_assets()
+            free = ~self.asset_active
+        slot = free.argmax(axis=1)
+        rows = np.arange(self.n)
+        self.asset_active[rows, slot] = True
+        self.asset_income[rows, slot] = template.get("income_per_day", 0.0)
+        self.asset_region[rows, slot] = self.region_names.index(region)
+        self.asset_type[rows, slot] = ASSET_TYPES.index(template["type"])
+
+    def _grow_assets(self):
+        pad = self.asset_active.shape[1]
+        self.asset_active = np.pad(self.asset_active, ((0, 0), (0, pad)))
+        self.asset_income = np.pad(self.asset_income, ((0, 0), (0, pad)))
+        self.asset_region = np.pad(self.asset_region, ((0, 0), (0, pad)))
+        self.asset_type = np.pad(self.asset_type, ((0, 0), (0, pad)))
+
+    def _grow_ais(self):
+        pad = self.ai_active.shape[1]
+        for name in ("ai_active", "ai_level", "ai_aggression", "ai_trace", "ai_type", "ai_age", "ai_region"):
+            setattr(self, name, np.pad(getattr(self, name), ((0, 0), (0, pad))))
+
+    # ---- tempo ----
+    def hours_pass(self, hrs):
+        """Equivalente vetorizado de Player.hours_pass para todos os mundos."""
+        decay = hrs * 0.32231 * np.where(self.addicted, 2.0, 1.0)
+        self.focus = np.maximum(0.0, self.focus - decay)
+        self.risk = np.maximum(0.0, self.risk - hrs * 0.17)
+        self.ritaline_addiction = np.maximum(0.0, self.ritaline_addiction - hrs * 0.12)
+        self.addicted &= self.ritaline_addiction > 0
+
+        days = int((self.clock + hrs) // 24 - self.clock // 24)
+        self.clock += hrs
+        if days > 0:
+            income = (self.asset_income * self.asset_active).sum(axis=1) * days
+            earning = income > 0
+            self.money += income
+            maintenance = earning & (self.rng.random(self.n) < 0.05 * days)
+            self.money -= np.where(maintenance, np.minimum(self.money, 30 * days), 0.0)
+        for _ in range(days):
+            self.advance_day()
+
+    def advance_day(self):
+        """Avança um dia em todos os mundos numa única chamada."""
+        self.day += 1
+        if self.day in self.unlock_index:
+            self.unlocked[:, self.unlock_index[self.day]] = True
+
+        self._ai_step()
+
+        if self.day % 30 == 0:
+            botnets = (self.asset_active & (self.asset_type == ASSET_TYPES.index("botnet_worm"))).sum(axis=1)
+            self.skills[:, SKILL_KEYS.index("exploit")] += 10 * botnets
+
+        self._asset_events()
+        self._drift()
+        self._spawns()
+
+    # ---- IAs ----
+    def _ai_step(self):
+        live = self.ai_active[:, :self.ai_count]
+        self.ai_age[:, :self.ai_count] += live
+        ups = live & (self.ai_age[:, :self.ai_count] % 30 == 0)
+        self.ai_level[:, :self.ai_count] += ups
+        self.ai_aggression[:, :self.ai_count] = np.where(
+            ups, np.minimum(1.0, self.ai_aggression[:, :self.ai_count] + 0.03), self.ai_aggression[:, :self.ai_count])
+        self.ai_trace[:, :self.ai_count] += 0.1 * ups
+
+        # slot a slot, vetorizado entre mundos: mantém a ordem sequencial das IAs de cada mundo
+        n = self.n
+        for m in range(self.ai_count):
+            threshold = self.ai_aggression[:, m] + np.minimum(0.6, self.risk / 100.0)
+            fire = self.ai_active[:, m] & (self.rng.random(n) < threshold)
+            if not fire.any():
+                continue
+            roll = self.rng.random(n)
+            typ = self.ai_type[:, m]
+            has_assets = self.asset_active.any(axis=1)
+            for code, kind in enumerate(AI_TYPES):
+                acting = fire & (typ == code)
+                if acting.any():
+                    self._ai_actions(AI_POLICIES.get(kind) or AI_POLICIES["Generic"], acting, roll, has_assets, m)
+
+    def _ai_actions(self, policy, acting, roll, has_assets, m):
+        """Ação de cada mundo em `acting` sorteada no alias da política (um uniforme por mundo) e aplicada."""
+        drawn = policy.table.draw_from(roll)
+        chosen = drawn.copy()
+        for i, action in enumerate(policy.actions):
+            if action.needs_assets:
+                fallback = -1 if action.fallback is None else policy.actions.index(action.fallback)
+                chosen[(drawn == i) & ~has_assets] = fallback
+        for i, action in enumerate(policy.actions):
+            mask = acting & (chosen == i)
+            if mask.any():
+                for _, _, name, params in action.effects:
+                    self._ai_effect(name, mask, params, m)
+
+    def _ai_effect(self, name, mask, params, m):
+        """Efeito de AI_EFFECTS, vetorizado entre os mundos em `mask` (IA do slot `m`)."""
+        n = self.n
+        if name == "risk":
+            low, high, scale = params
+            factor = AI_SCALES_NUMPY[scale](self.ai_trace[:, m], self.ai_level[:, m])
+            self._add_risk(mask, self.rng.uniform(low, high, n) * factor)
+        elif name == "steal":
+            self._hit_asset(mask, remove_p=1.0, loss=params, degrade=1.0)
+        elif name == "degrade":
+            self._hit_asset(mask, remove_p=0.0, loss=None, degrade=params[0])
+        elif name == "fine":
+            low, high = params
+            self.money -= np.where(mask, np.minimum(self.money, self.rng.uniform(low, high, n)), 0.0)
+        elif name == "knowledge":
+            low, high = params
+            self.knowledge += np.where(mask, self.rng.integers(low, high + 1, n), 0)
+        else:
+            raise ValueError(f"BatchWorld não simula o efeito de IA {name!r}")
+
+    def _add_risk(self, mask, inc):
+        self.risk = np.where(mask, np.minimum(100.0, self.risk + inc), self.risk)
+
+    def _hit_asset(self, mask, remove_p, loss, degrade):
+        """Ataque a um ativo aleatório de cada mundo em `mask`: remoção com perda ou degradação."""
+        rows = np.flatnonzero(mask)
+        if rows.size == 0:
+            return
+        active = self.asset_active[rows]
+        counts = active.sum(axis=1)
+        pick = (self.rng.random(rows.size) * counts).astype(np.int64)
+        slot = (active.cumsum(axis=1) > pick[:, None]).argmax(axis=1)
+        income = self.asset_income[rows, slot]
+        remove = self.rng.random(rows.size) < remove_p
+        if loss:
+            low, high = loss
+            lost = income * self.rng.integers(low, high + 1, rows.size)
+            cost = np.minimum(self.money[rows], lost * 5)
+            self.money[rows] -= np.where(remove, cost, 0.0)
+        self.asset_active[rows[remove], slot[remove]] = False
+        keep = ~remove
+        self.asset_income[rows[keep], slot[keep]] *= degrade
+
+    # ---- ativos e regiões ----
+    def _asset_events(self):
+        rows = np.arange(self.n)[:, None]
+        meta = self.meta[rows, self.asset_region]          # (n, A, 3)
+        shape = self.asset_active.shape
+        crime = self.asset_active & (self.rng.random(shape) < meta[..., 1] * 0.01)
+        state = self.asset_active & (self.rng.random(shape) < meta[..., 0] * 0.01)
+        hacktivists = self.asset_active & (self.rng.random(shape) < meta[..., 2] * 0.008)
+        self.asset_income = np.where(crime, self.asset_income * 0.7, self.asset_income)
+        self.risk = np.minimum(100.0, self.risk + 3 * state.sum(axis=1))
+        self.knowledge += hacktivists.sum(axis=1)
+
+    def _drift(self):
+        shape = self.meta.shape
+        change = self.rng.integers(-1, 2, shape)
+        with_trend = self.rng.random(shape) < 0.15
+        change += np.where(with_trend, self.trend[None] * self.rng.integers(0, 2, shape), 0)
+        jump = self.rng.random(shape) < 0.02
+        change += np.where(jump, self.rng.choice(np.array([-3, -2, 2, 3]), shape), 0)
+        self.meta = np.clip(self.meta + change, 0, 20)
+
+    def _spawns(self):
+        n = self.n
+        s, c, h = (META_KEYS.index(k) for k in ("state", "crime", "hacktivists"))
+        for r in range(len(self.region_names)):
+            meta = self.meta[:, r]
+            base = 0.003 + meta[:, c] * 0.003 + meta[:, s] * 0.002 + meta[:, h] * 0.001 + min(0.03, self.day / 1000.0)
+            unlocked = self.unlocked[:, r]
+            self._spawn(unlocked & (meta[:, s] >= 10) & (self.rng.random(n) < base * 1.0), 1, r)
+            self._spawn(unlocked & (meta[:, c] >= 10) & (self.rng.random(n) < base * 0.7), 2, r)
+            self._spawn(unlocked & (meta[:, h] >= 9) & (self.rng.random(n) < base * 0.5), 3, r)
+
+        rep = self.reputation
+        self._spawn((rep[:, REP_KEYS.index("state")] >= 18) & (self.rng.random(n) < 0.1), 1, self.player_region)
+        self._spawn((rep[:, REP_KEYS.index("crime")] >= 18) & (self.rng.random(n) < 0.1), 2, self.player_region)
+        self._spawn((rep > 20).any(axis=1) & (self.rng.random(n) < 0.08), 3, self.player_region)
+
+    def _spawn(self, mask, typ, region):
+        """Equivalente de World.spawn_enemy_ai com tipo preferido, para os mundos em `mask`."""
+        rows = np.flatnonzero(mask)
+        if rows.size == 0:
+            return
+        region = np.broadcast_to(region, (self.n,))[rows]
+        rep_key = {1: "state", 2: "crime", 3: "hacktivists"}[typ]
+        level = (1 + self.day // 30 + np.maximum(0, self.difficulty[region] - 1)
+                 + np.maximum(0, self.reputation[rows, REP_KEYS.index(rep_key)] // 6))
+        level = np.maximum(1, level)
+        aggression = 0.1 + 0.03 * level
+        trace = 1.0 + 0.2 * (level - 1)
+        traits = AI_POLICIES[AI_TYPES[typ]].traits   # como EnemyAI.apply_type_traits
+        aggression = aggression + traits.get("aggression", 0.0)
+        trace = trace + traits.get("trace", 0.0)
+        if "trace_min" in traits:
+            trace = np.maximum(traits["trace_min"], trace)
+
+        free = ~self.ai_active[rows]
+        if not free.any(axis=1).all():
+            self._grow_ais()
+            free = ~self.ai_active[rows]
+        slot = free.argmax(axis=1)
+        self.ai_active[rows, slot] = True
+        self.ai_level[rows, slot] = level
+        self.ai_aggression[rows, slot] = aggression
+        self.ai_trace[rows, slot] = trace
+        self.ai_type[rows, slot] = typ
+        self.ai_age[rows, slot] = 0
+        self.ai_region[rows, slot] = region
+        self.ai_count = max(self.ai_count, int(slot.max()) + 1)
+
+    # ---- resultados ----
+    def summary(self):
+        """Média e desvio padrão das principais métricas entre os mundos."""
+        out = {"worlds": self.n, "day": self.day}
+        metrics = {
+            "money": self.money,
+            "risk": self.risk,
+            "focus": self.focus,
+            "knowledge": self.knowledge,
+            "enemy_ais": self.ai_active.sum(axis=1),
+            "assets": self.asset_active.sum(axis=1),
+        }
+        for name, values in metrics.items():
+            out[name] = (float(values.mean()), float(values.std()))
+        return out
+
+
+# -------------------- Fast-forward (amostragem) --------------------
+_DRIFT_CACHE = {}
+WEIGHTED_SAMPLE_NUMPY_MIN = 4096   # abaixo disso o heap em Python é mais rápido que converter para arrays
+
+
+def _drift_step_matrix(trend):
+    """Matriz de transição de um dia do passeio aleatório regional (valores 0..20)."""
+    changes = {}
+    for base in (-1, 0, 1):
+        # tendência aplicada com p=0.15 e multiplicador 0/1; salto ±2/±3 com p=0.02
+        for trend_part, p_t in ((0, 0.85), (0, 0.075), (trend, 0.075)):
+            for jump, p_j in ((0, 0.98), (-3, 0.005), (-2, 0.005), (2, 0.005), (3, 0.005)):
+                delta = base + trend_part + jump
+                changes[delta] = changes.get(delta, 0.0) + p_t * p_j / 3
+    matrix = []
+    for x in range(21):
+        row = [0.0] * 21
+        for delta, w in changes.items():
+            row[max(0, min(20, x + delta))] += w
+        matrix.append(row)
+    return matrix
+
+
+def _mat_mul(a, b):
+    n = len(a)
+    cols = list(zip(*b))
+    return [[sum(x * y for x, y in zip(a[i], cols[j])) for j in range(n)] for i in range(n)]
+
+
+def drift_transition(trend, days):
+    """Matriz de `days` passos do drift regional (cacheada por processo)."""
+    key = (trend, days)
+    if key in _DRIFT_CACHE:
+        return _DRIFT_CACHE[key]
+    if days == 1:
+        m = _drift_step_matrix(trend)
+    else:
+        half = drift_transition(trend, days // 2)
+        m = _mat_mul(half, half)
+        if days % 2:
+            m = _mat_mul(m, drift_transition(trend, 1))
+    _DRIFT_CACHE[key] = m
+    return m
+
+
+def sample_index(weights, rng=random):
+    r = rng.random() * sum(weights)
+    cum = 0.0
+    for i, w in enumerate(weights):
+        cum += w
+        if r < cum:
+            return i
+    return len(weights) - 1
+
+
+def weighted_sample(items, weights, k, rng=random):
+    """
+    k itens sem reposição, cada escolha proporcional ao peso entre os que sobraram
+    (Efraimidis–Spirakis: chave log(u)/w por item, ficam as k maiores). O(n log k); com NumPy,
+    pools grandes usam argpartition. Pesos devem ser positivos.
+    """
+    n = len(items)
+    if n == 0 or k <= 0:
+        return []
+    draws = rng.uniforms(n) if hasattr(rng, "uniforms") else [rng.random() for _ in range(n)]
+    if np is not None and n >= WEIGHTED_SAMPLE_NUMPY_MIN and k < n:
+        keys = np.log(1.0 - np.asarray(draws)) / np.asarray(weights, dtype=float)
+        top = np.argpartition(keys, n - k)[n - k:]
+        top = top[np.argsort(-keys[top], kind="stable")]
+        return [items[i] for i in top.tolist()]
+    log = math.log
+    keys = [log(1.0 - u) / w for u, w in zip(draws, weights)]
+    return [items[i] for _, i in heapq.nlargest(k, zip(keys, range(n)))]
+
+
+def sample_first_event_gap(hazards, rng=random):
+    """Número de dias calmos antes do próximo dia em que algum teste dispara (geométrica)."""
+    quiet = 1.0
+    for p in hazards:
+        quiet *= (1.0 - p)
+    if quiet <= 0.0:
+        return 0
+    if quiet >= 1.0:
+        return math.inf
+    return int(math.log(1.0 - rng.random()) / math.log(quiet))
+
+
+def sample_first_firing(hazards, rng=random):
+    """
+    Sorteia qual teste é o primeiro a disparar, dado que pelo menos um dispara.
+    Retorna os resultados forçados (False... True) para os testes até ele.
+    """
+    n = len(hazards)
+    suffix_quiet = [1.0] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        suffix_quiet[i] = suffix_quiet[i + 1] * (1.0 - hazards[i])
+    forced = []
+    for i, p in enumerate(hazards):
+        rest = 1.0 - suffix_quiet[i]
+        if rest <= 0.0:
+            break
+        if rng.random() < p / rest:
+            forced.append(True)
+            return forced
+        forced.append(False)
+    return forced
+
+
+BINOMIAL_BTRS_MIN = 10   # média n·p a partir da qual a rejeição (BTRS) sai mais barata que os saltos
+
+
+def sample_binomial(n, p, rng=random):
+    """
+    Quantos de n testes de chance p disparam, só com rng.random() (mesma sequência com ou sem
+    NumPy). Média pequena: saltos geométricos entre sucessos; grande: rejeição transformada BTRS
+    (Hörmann, 1993), com ~1.2 pares de sorteios por amostra qualquer que seja n.
+    """
+    if n <= 0 or p <= 0.0:
+        return 0
+    if p >= 1.0:
+        return n
+    if p > 0.5:
+        return n - sample_binomial(n, 1.0 - p, rng)
+    if n * p >= BINOMIAL_BTRS_MIN:
+        return _binomial_btrs(n, p, rng)
+    log_quiet = math.log(1.0 - p)
+    count, pos = 0, 0
+    while True:
+        pos += int(math.log(1.0 - rng.random()) / log_quiet) + 1
+        if pos > n:
+            return count
+        count += 1
+
+
+def _binomial_btrs(n, p, rng):
+    q = 1.0 - p
+    spq = math.sqrt(n * p * q)
+    b = 1.15 + 2.53 * spq
+    a = -0.0873 + 0.0248 * b + 0.01 * p
+    c = n * p + 0.5
+    v_r = 0.92 - 4.2 / b
+    alpha = (2.83 + 5.1 / b) * spq
+    lpq = math.log(p / q)
+    m = int((n + 1) * p)
+    h = math.lgamma(m + 1) + math.lgamma(n - m + 1)
+    while True:
+        u = rng.random() - 0.5
+        v = rng.random()
+        us = 0.5 - abs(u)
+        if us <= 0.0:
+            continue
+        k = math.floor((2.0 * a / us + b) * u + c)
+        if k < 0 or k > n:
+            continue
+        if us >= 0.07 and v <= v_r:
+            return k
+        if v <= 0.0:
+            continue
+        v = math.log(v * alpha / (a / (us * us) + b))
+        if v <= h - math.lgamma(k + 1) - math.lgamma(n - k + 1) + (k - m) * lpq:
+            return k
+
+
+class AliasTable:
+    """
+    Sorteio de um índice com pesos fixos em O(1) (método alias de Vose): um único uniforme
+    escolhe a coluna e decide entre ela e o seu alias. Montada uma vez, sorteada muitas.
+    """
+
+    def __init__(self, weights):
+        n = len(weights)
+        total = float(sum(weights))
+        if n == 0 or total <= 0.0 or min(weights) < 0.0:
+            raise ValueError("pesos do alias precisam ser não negativos com soma positiva")
+        scaled = [w * n / total for w in weights]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, w in enumerate(scaled) if w < 1.0]
+        large = [i for i, w in enumerate(scaled) if w >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        # sobras (erro de arredondamento) ficam com probabilidade 1 na própria coluna
+        self._arrays = None
+
+    def __len__(self):
+        return len(self.prob)
+
+    def draw(self, rng=random):
+        u = rng.random() * len(self.prob)
+        i = int(u)
+        return i if u - i < self.prob[i] else self.alias[i]
+
+    def draw_from(self, u):
+        """Versão vetorizada: um índice por uniforme do array `u` (requer NumPy)."""
+        if self._arrays is None:
+            self._arrays = (np.asarray(self.prob), np.asarray(self.alias))
+        prob, alias = self._arrays
+        u = u * len(prob)
+        i = np.minimum(u.astype(np.int64), len(prob) - 1)
+        return np.where(u - i < prob[i], i, alias[i])
+
+
+# -------------------- Enemy AI --------------------
+AI_STATUSES = ("ativa", "bloqueada")
+
+# Comportamento de cada tipo de IA, só dados: traços aplicados no spawn e a tabela de ações de um
+# dia em que a IA age. Cada ação tem peso, efeitos (nome + parâmetros, ver AI_EFFECTS) e mensagem
+# (%-format com os valores dos efeitos: sai bem mais barato que str.format no laço quente);
+# ações que precisam de ativos caem no `fallback` (None: nada acontece) quando o jogador não tem
+# nenhum. Tipos sem tabela agem como Generic. Um JSON no mesmo formato em PSS_AI_BEHAVIOURS
+# acrescenta ou substitui tipos sem mexer no código; tudo é compilado uma vez (AI_POLICIES).
+AI_BEHAVIOURS_ENV = "PSS_AI_BEHAVIOURS"
+AI_BEHAVIOURS = {
+    "Pirata": {
+        # Piratas: focam em roubo/saque → mais incentivo a atacar assets
+        "traits": {"aggression": 0.1, "trace": -0.5, "trace_min": 1.0},
+        "actions": [
+            {"name": "exfiltrar", "weight": 0.42, "needs_assets": True, "fallback": "ruido",
+             "effects": [["steal", 1, 34]],
+             "text": "[%(uid)s - Pirata] Atacou e exfiltrou recursos do ativo '%(asset)s'. Perda: $%(cost).2f."},
+            {"name": "degradar", "weight": 0.28, "needs_assets": True, "fallback": "ruido",
+             "effects": [["degrade", 0.5]],
+             "text": "[%(uid)s - Pirata] Reduziu rendimento de '%(asset)s'."},
+            {"name": "ruido", "weight": 0.3, "effects": [["risk", 5.0, 16.0, "trace"]],
+             "text": "[%(uid)s - Pirata] Criou ruído operacional. Risco +%(inc).1f%%."},
+        ],
+    },
+    "Federal": {
+        # Federal: caçam operadores; traces fortes, multas e intervenções em serviços
+        "traits": {"aggression": 0.08, "trace": 1.5},
+        "actions": [
+            {"name": "rastreio_multa", "weight": 0.15,
+             "effects": [["risk", 10.0, 28.0, "trace"], ["fine", 100.0, 1000.0]],
+             "text": "[%(uid)s - Federal] Operação de rastreio. Risco +%(inc).1f%%. Multa aplicada: $%(fine).2f."},
+            {"name": "rastreio", "weight": 0.45, "effects": [["risk", 10.0, 28.0, "trace"]],
+             "text": "[%(uid)s - Federal] Operação de rastreio. Risco +%(inc).1f%%."},
+            {"name": "intervencao", "weight": 0.4, "needs_assets": True, "fallback": None,
+             "effects": [["degrade", 0.6]],
+             "text": "[%(uid)s - Federal] Intervenção. Rendimento do ativo '%(asset)s' reduzido."},
+        ],
+    },
+    "Hacktivista": {
+        # Hacktivistas: foco em divulgação; vazamentos dão conhecimento, operações geram ruído
+        "traits": {"aggression": 0.15, "trace": -0.2, "trace_min": 1.5},
+        "actions": [
+            {"name": "vazamento", "weight": 0.2, "effects": [["knowledge", 1, 3]],
+             "text": "[%(uid)s - Hacktivista] Vazamento público reportado. Conhecimento +1."},
+            {"name": "pressao", "weight": 0.3, "effects": [],
+             "text": "[%(uid)s - Hacktivista] Campanha de pressão online detectada."},
+            {"name": "disrupcao", "weight": 0.5, "effects": [["risk", 2.0, 8.0, "level"]],
+             "text": "[%(uid)s - Hacktivista] Operação disruptiva. Risco +%(inc).1f%%."},
+        ],
+    },
+    "Generic": {
+        "actions": [
+            {"name": "trace", "weight": 0.5, "effects": [["risk", 8.0, 20.0, "trace"]],
+             "text": "[%(who)s] Trace executado. Risco +%(inc).1f%%."},
+            {"name": "atacar", "weight": 0.15, "needs_assets": True, "fallback": "ruido",
+             "effects": [["steal", 1, 14]],
+             "text": "[%(uid)s] Atacou '%(asset)s'. Perda: $%(cost).2f."},
+            {"name": "degradar", "weight": 0.15, "needs_assets": True, "fallback": "ruido",
+             "effects": [["degrade", 0.5]],
+             "text": "[%(uid)s] Reduziu rendimento de '%(asset)s'."},
+            {"name": "ruido", "weight": 0.2, "effects": [["risk", 5.0, 10.0, "trace"]],
+             "text": "[%(uid)s] Espalhou ruído (+%(inc).1f%% exposição)."},
+        ],
+    },
+}
+
+# multiplicador das faixas de risco: trace_power da IA ou um fator pelo nível
+# (None: o próprio trace_power, sem a chamada — é a escala de quase todas as ações)
+AI_SCALES = {
+    "trace": None,
+    "level": lambda trace_power, level: max(1.0, 0.6 + level * 0.05),
+}
+AI_SCALES_NUMPY = {   # as mesmas, sobre arrays (BatchWorld)
+    "trace": lambda trace_power, level: trace_power,
+    "level": lambda trace_power, level: np.maximum(1.0, 0.6 + level * 0.05),
+}
+
+
+# Cada efeito aplica-se ao jogador e devolve uma tupla com os valores que a mensagem pode citar,
+# na ordem de AI_EFFECT_FIELDS.
+def _ai_effect_risk(rng, player, trace_power, level, low, high, scale):
+    inc = rng.uniform(low, high) * (trace_power if scale is None else scale(trace_power, level))
+    player.risk = min(100.0, player.risk + inc)
+    return (inc,)
+
+
+def _ai_effect_steal(rng, player, trace_power, level, low, high):
+    """Ativo sorteado sai do jogador; a perda é de `low` a `high` dias de renda (×5, limitada ao saldo)."""
+    a = rng.choice(player.assets)
+    player.assets.remove(a)
+    loss = a.get("income_per_day", 0.0) * rng.randint(low, high)
+    cost = min(player.money, loss * 5)
+    player.money -= cost
+    return a["type"], cost
+
+
+def _ai_effect_degrade(rng, player, trace_power, level, factor):
+    a = rng.choice(player.assets)
+    a["income_per_day"] *= factor
+    return (a["type"],)
+
+
+def _ai_effect_fine(rng, player, trace_power, level, low, high):
+    fine = min(player.money, rng.uniform(low, high))
+    player.money -= fine
+    return (fine,)
+
+
+def _ai_effect_knowledge(rng, player, trace_power, level, low, high):
+    gain = rng.randint(low, high)
+    player.knowledge += gain
+    return (gain,)
+
+
+AI_EFFECTS = {
+    "risk": _ai_effect_risk,
+    "steal": _ai_effect_steal,
+    "degrade": _ai_effect_degrade,
+    "fine": _ai_effect_fine,
+    "knowledge": _ai_effect_knowledge,
+}
+
+# Os mesmos efeitos aplicados `k` vezes de uma vez (enxames), com a distribuição de k chamadas
+# seguidas do efeito simples; retornam quantas das k aconteceram de fato. Somas de muitos
+# sorteios uniformes usam a aproximação normal (média e variância exatas).
+AI_BULK_EXACT = 16   # até quantos sorteios a soma é feita termo a termo
+
+
+def _uniform_sum(rng, k, low, high):
+    if k <= AI_BULK_EXACT:
+        return sum(rng.uniform(low, high) for _ in range(k))
+    total = k * (low + high) / 2.0 + rng.gauss(0.0, 1.0) * (high - low) * math.sqrt(k / 12.0)
+    return min(k * high, max(k * low, total))
+
+
+def _randint_sum(rng, k, low, high):
+    if k <= AI_BULK_EXACT:
+        return sum(rng.randint(low, high) for _ in range(k))
+    width = high - low + 1
+    total = round(k * (low + high) / 2.0 + rng.gauss(0.0, 1.0) * math.sqrt(k * (width * width - 1) / 12.0))
+    return min(k * high, max(k * low, total))
+
+
+def _ai_bulk_risk(rng, player, trace_power, level, k, low, high, scale):
+    inc = _uniform_sum(rng, k, low, high) * (trace_power if scale is None else scale(trace_power, level))
+    player.risk = min(100.0, player.risk + inc)
+    return k
+
+
+def _ai_bulk_steal(rng, player, trace_power, level, k, low, high):
+    """Cada roubo leva um ativo: só os primeiros len(assets) acontecem."""
+    k = min(k, len(player.assets))
+    for _ in range(k):
+        _ai_effect_steal(rng, player, trace_power, level, low, high)
+    return k
+
+
+def _ai_bulk_degrade(rng, player, trace_power, level, k, factor):
+    """Ativo sorteado a cada ataque: quantos caem em cada ativo é multinomial."""
+    left, n = k, len(player.assets)
+    for i, a in enumerate(player.assets):
+        hits = sample_binomial(left, 1.0 / (n - i), rng)
+        a["income_per_day"] *= factor ** hits
+        left -= hits
+    return k
+
+
+def _ai_bulk_fine(rng, player, trace_power, level, k, low, high):
+    # multas seguidas, cada uma limitada ao saldo, somam o mesmo que a soma limitada uma vez
+    player.money -= min(player.money, _uniform_sum(rng, k, low, high))
+    return k
+
+
+def _ai_bulk_knowledge(rng, player, trace_power, level, k, low, high):
+    player.knowledge += _randint_sum(rng, k, low, high)
+    return k
+
+
+AI_EFFECTS_BULK = {
+    "risk": _ai_bulk_risk,
+    "steal": _ai_bulk_steal,
+    "degrade": _ai_bulk_degrade,
+    "fine": _ai_bulk_fine,
+    "knowledge": _ai_bulk_knowledge,
+}
+# efeitos que tiram o ativo do jogador: a ordem deles em relação aos outros efeitos sobre ativos
+# muda o resultado (um roubo depois de uma degradação perde menos), então o lote não os reordena
+AI_EFFECTS_TAKE_ASSET = {"steal"}
+AI_EFFECT_FIELDS = {
+    "risk": ("inc",),
+    "steal": ("asset", "cost"),
+    "degrade": ("asset",),
+    "fine": ("fine",),
+    "knowledge": ("gain",),
+}
+AI_TEXT_FIELD = re.compile(r"%\((\w+)\)")
+
+
+class AIAction:
+    """
+    Ação compilada: cada efeito vira (função, argumentos prontos, nome, parâmetros da tabela),
+    com a escala de risco já resolvida, e o fallback vira outra AIAction. O texto, escrito com
+    campos nomeados (%(inc).1f), vira um modelo posicional e um itemgetter sobre a tupla
+    (uid, who, saídas dos efeitos...), que formata bem mais rápido que um dict.
+    """
+    __slots__ = ("name", "needs_assets", "takes_asset", "fallback", "effects", "text", "template", "pick",
+                 "uses_who")
+
+    def __init__(self, spec):
+        self.name = spec["name"]
+        self.needs_assets = spec.get("needs_assets", False)
+        self.fallback = None
+        self.effects = []
+        fields = ["uid", "who"]
+        for effect, *params in spec.get("effects", ()):
+            if effect not in AI_EFFECTS:
+                raise ValueError(f"efeito de IA desconhecido: {effect}")
+            args = tuple(params)
+            if effect == "risk":
+                if params[-1] not in AI_SCALES:
+                    raise ValueError(f"escala de risco desconhecida: {params[-1]}")
+                args = args[:-1] + (AI_SCALES[params[-1]],)
+            self.effects.append((AI_EFFECTS[effect], args, effect, tuple(params)))
+            fields += AI_EFFECT_FIELDS[effect]
+        self.takes_asset = any(name in AI_EFFECTS_TAKE_ASSET for _, _, name, _ in self.effects)
+        self.text = spec["text"]
+        names = AI_TEXT_FIELD.findall(self.text)
+        for name in names:
+            if name not in fields:
+                raise ValueError(f"{self.name}: campo {name!r} não vem de nenhum efeito da ação")
+        self.template = AI_TEXT_FIELD.sub("%", self.text)
+        positions = [fields.index(name) for name in names]
+        # itemgetter só devolve tupla com 2+ posições: completa com o uid, que "%.0s" não imprime
+        while len(positions) < 2:
+            positions.append(0)
+            self.template += "%.0s"
+        self.pick = operator.itemgetter(*positions)
+        self.uses_who = "who" in names
+
+
+class AIPolicy:
+    """Tabela de ações de um tipo de IA compilada num AliasTable: o sorteio do dia é O(1)."""
+
+    def __init__(self, kind, spec):
+        self.kind = kind
+        self.traits = dict(spec.get("traits", {}))
+        self.actions = [AIAction(a) for a in spec["actions"]]
+        by_name = {a.name: a for a in self.actions}
+        for action, a in zip(self.actions, spec["actions"]):
+            fallback = a.get("fallback")
+            if fallback is not None and fallback not in by_name:
+                raise ValueError(f"{kind}: fallback desconhecido {fallback!r} em {action.name}")
+            action.fallback = by_name.get(fallback)
+        self.table = AliasTable([a["weight"] for a in spec["actions"]])
+        total = float(sum(a["weight"] for a in spec["actions"]))
+        self.weights = [a["weight"] / total for a in spec["actions"]]   # para os sorteios em lote
+        # colunas do alias já apontando para as ações, numa tupla (o laço quente desempacota uma vez)
+        self.sampler = (len(self.actions), self.table.prob, self.actions, [self.actions[i] for i in self.table.alias])
+
+    def draw(self, rng, has_assets):
+        """Ação do dia (None se a sorteada precisa de ativos, o jogador não tem e não há fallback)."""
+        n, prob, actions, alias = self.sampler
+        u = rng.random() * n
+        i = int(u)
+        action = actions[i] if u - i < prob[i] else alias[i]
+        if action.needs_assets and not has_assets:
+            return action.fallback
+        return action
+
+
+def load_ai_behaviours(path=None):
+    """AI_BEHAVIOURS com os tipos do JSON em `path` (se houver) acrescentados ou substituídos."""
+    behaviours = dict(AI_BEHAVIOURS)
+    if path:
+        import json
+
+        with open(path, encoding="utf-8") as f:
+            behaviours.update(json.load(f))
+    return behaviours
+
+
+def compile_ai_policies(behaviours):
+    return {kind: AIPolicy(kind, spec) for kind, spec in behaviours.items()}
+
+
+AI_POLICIES = compile_ai_policies(load_ai_behaviours(os.environ.get(AI_BEHAVIOURS_ENV)))
+AI_POPULATION_NUMPY_MIN = 256   # abaixo disso o laço em Python sai mais barato que montar arrays
+
+
+def cohort_gain(cohorts, day, days):
+    """
+    Evoluções mensais nos dias (day, day + days]: cohorts[c] conta as IAs nascidas num dia
+    ≡ c (mod 30), que evoluem exatamente nos dias ≡ c.
+    """
+    full, rest = divmod(days, 30)
+    return full * sum(cohorts) + sum(cohorts[(day + i) % 30] for i in range(1, rest + 1))
+
+
+class AIPopulation:
+    """
+    IAs inimigas em colunas (arrays paralelos, uma linha por IA, na ordem de spawn). Cada EnemyAI é
+    uma alça para a própria linha: nível, agressividade, trace, tipo, status, bloqueio e idade moram
+    aqui, e o dia de todas as IAs (envelhecimento e sorteio das ações) é decidido em lote.
+    Para o resto do jogo continua sendo a lista de World.enemy_ais (iteração, len, in, append, remove).
+
+    Envelhecer não custa nada: a idade é `day - spawn_day`, e nível, agressividade e trace são
+    função dela (uma evolução a cada 30 dias). As três colunas guardam os valores depois de `ups`
+    evoluções e são atualizadas na leitura (refresh), com as mesmas contas, na mesma ordem, do
+    antigo incubate_day diário.
+    """
+
+    COLUMNS = ("level", "aggression", "trace_power", "ups", "type_codes", "status_codes", "blocked_until",
+               "spawn_day")
+    SAVED_COLUMNS = ("level", "aggression", "trace_power", "type_codes", "status_codes", "blocked_until", "age_days")
+
+    def __init__(self, day=0):
+        self.day = day                  # relógio da população (World.day para a do mundo)
+        self.ais = []
+        self.level = array("q")
+        self.aggression = array("d")
+        self.trace_power = array("d")
+        self.ups = array("q")           # evoluções mensais já aplicadas às três colunas acima
+        self.type_codes = array("H")
+        self.status_codes = array("H")
+        self.blocked_until = []         # datetime ou None
+        self.spawn_day = array("q")
+        self.cohorts = [0] * 30         # IAs por spawn_day % 30: quem evolui em cada dia do ciclo
+        self.type_names = list(AI_TYPES)         # type_codes indexam aqui (spawn_ai de debug aceita qualquer tipo)
+        self.status_names = list(AI_STATUSES)
+        self._samplers = []             # AIPolicy.sampler por código de tipo (refeita quando type_names cresce)
+
+    def __len__(self):
+        return len(self.ais)
+
+    def __iter__(self):
+        return iter(self.ais)
+
+    def __getitem__(self, i):
+        return self.ais[i]
+
+    def __contains__(self, ai):
+        return getattr(ai, "_pop", None) is self
+
+    @staticmethod
+    def code(names, value):
+        try:
+            return names.index(value)
+        except ValueError:
+            names.append(value)
+            return len(names) - 1
+
+    def row_values(self, row):
+        """Valores atuais da linha na ordem de SAVED_COLUMNS, com tipo e status por extenso."""
+        self.refresh(row)
+        return (self.level[row], self.aggression[row], self.trace_power[row],
+                self.type_names[self.type_codes[row]], self.status_names[self.status_codes[row]],
+                self.blocked_until[row], self.day - self.spawn_day[row])
+
+    def adopt(self, ai, values):
+        """Acrescenta a linha `values` (como em row_values) e aponta `ai` para ela."""
+        level, aggression, trace_power, type_name, status, blocked_until, age_days = values
+        spawn_day = self.day - age_days
+        ai._pop, ai._row = self, len(self.ais)
+        self.ais.append(ai)
+        self.level.append(level)
+        self.aggression.append(aggression)
+        self.trace_power.append(trace_power)
+        self.ups.append(age_days // 30)
+        self.type_codes.append(self.code(self.type_names, type_name))
+        self.status_codes.append(self.code(self.status_names, status))
+        self.blocked_until.append(blocked_until)
+        self.spawn_day.append(spawn_day)
+        self.cohorts[spawn_day % 30] += 1
+
+    def append(self, ai):
+        """Traz a IA, com os valores que ela tinha, para o fim desta população."""
+        self.adopt(ai, ai._pop.row_values(ai._row))
+
+    def remove(self, ai):
+        """Tira a IA mantendo a ordem das outras; ela segue utilizável com uma linha só dela."""
+        if ai not in self:
+            raise ValueError("IA não pertence a esta população")
+        row = ai._row
+        values = self.row_values(row)
+        self.cohorts[self.spawn_day[row] % 30] -= 1
+        del self.ais[row]
+        for name in self.COLUMNS:
+            del getattr(self, name)[row]
+        for other in self.ais[row:]:
+            other._row -= 1
+        AIPopulation().adopt(ai, values)
+
+    def clear(self):
+        # as colunas antigas ficam com as IAs que saíram (a agenda ainda pode apontar para elas)
+        old = AIPopulation.__new__(AIPopulation)
+        old.__dict__.update(self.__dict__)
+        self.__init__(self.day)
+        for ai in old.ais:
+            ai._pop = old
+
+    def drop(self, rows):
+        """
+        Tira várias linhas de uma vez, mantendo a ordem das outras (um remove em lote, O(n)).
+        Como em clear, as IAs tiradas ficam com as colunas antigas.
+        """
+        rows = set(rows)
+        old = AIPopulation.__new__(AIPopulation)
+        old.__dict__.update(self.__dict__)
+        keep = [row for row in range(len(old.ais)) if row not in rows]
+        for name in self.COLUMNS:
+            column = getattr(old, name)
+            kept = map(column.__getitem__, keep)
+            setattr(self, name, array(column.typecode, kept) if isinstance(column, array) else list(kept))
+        self.ais = [old.ais[row] for row in keep]
+        self.cohorts = list(old.cohorts)
+        for row in rows:
+            self.cohorts[old.spawn_day[row] % 30] -= 1
+            old.ais[row]._pop = old
+        for row, ai in enumerate(self.ais):
+            ai._row = row
+
+    def _use_numpy(self):
+        return np is not None and len(self.ais) >= AI_POPULATION_NUMPY_MIN
+
+    def age(self, days=1):
+        """
+        Envelhece todas as IAs `days` dias sem tocar nas linhas. Retorna quantos níveis foram
+        ganhos no total (quantas IAs passam por um múltiplo de 30 dias de idade no trecho).
+        """
+        if days <= 0:
+            return 0
+        gained = cohort_gain(self.cohorts, self.day, days)
+        self.day += days
+        return gained
+
+    def refresh(self, row):
+        """Aplica à linha as evoluções mensais que faltam (mesmas contas do incubate_day antigo)."""
+        ups = (self.day - self.spawn_day[row]) // 30
+        done = self.ups[row]
+        if ups > done:
+            aggression, trace_power = self.aggression[row], self.trace_power[row]
+            for _ in range(ups - done):
+                aggression = min(1.0, aggression + 0.03)
+                trace_power += 0.1
+            self.level[row] += ups - done
+            self.aggression[row] = aggression
+            self.trace_power[row] = trace_power
+            self.ups[row] = ups
+
+    def refresh_all(self):
+        if not self._use_numpy():
+            for row in range(len(self.ais)):
+                self.refresh(row)
+            return
+        ups = (self.day - np.frombuffer(self.spawn_day, dtype=np.int64)) // 30
+        missing = ups - np.frombuffer(self.ups, dtype=np.int64)
+        stale = np.flatnonzero(missing)
+        if stale.size == 0:
+            return
+        missing = missing[stale]
+        aggression = np.frombuffer(self.aggression)
+        trace_power = np.frombuffer(self.trace_power)
+        np.frombuffer(self.level, dtype=np.int64)[stale] += missing
+        np.frombuffer(self.ups, dtype=np.int64)[stale] = ups[stale]
+        for k in range(int(missing.max())):
+            rows = stale[missing > k]
+            aggression[rows] = np.minimum(1.0, aggression[rows] + 0.03)
+            trace_power[rows] += 0.1
+
+    def saved_columns(self):
+        """Colunas no formato do save (SAVED_COLUMNS), com todas as linhas atualizadas."""
+        self.refresh_all()
+        ages = array("q", map(operator.sub, itertools.repeat(self.day), self.spawn_day))
+        return {name: ages if name == "age_days" else getattr(self, name) for name in self.SAVED_COLUMNS}
+
+    @classmethod
+    def from_saved_columns(cls, day, ais, columns, type_names, status_names):
+        pop = cls(day)
+        pop.type_names = type_names
+        pop.status_names = status_names
+        ages = columns["age_days"]
+        for name in ("level", "aggression", "trace_power", "type_codes", "status_codes"):
+            setattr(pop, name, array(getattr(pop, name).typecode, columns[name]))
+        pop.blocked_until = columns["blocked_until"]
+        pop.ups = array("q", map(operator.floordiv, ages, itertools.repeat(30)))
+        pop.spawn_day = array("q", map(operator.sub, itertools.repeat(day), ages))
+        for phase, count in Counter(map(operator.mod, pop.spawn_day, itertools.repeat(30))).items():
+            pop.cohorts[phase] = count
+        pop.ais = ais
+        n = len(ais)
+        deque(map(setattr, ais, itertools.repeat("_pop"), itertools.repeat(pop, n)), maxlen=0)
+        deque(map(setattr, ais, itertools.repeat("_row"), range(n)), maxlen=0)
+        return pop
+
+    def act(self, player, world):
+        """
+        Ações do dia de todas as IAs: um sorteio em lote decide quem age, e só essas resolvem a
+        ação contra o jogador. Equivale ao laço IA a IA com try_action: o limiar de cada uma usa o
+        risco deixado pelas anteriores, e como o risco só sobe (termo limitado a 0.6) quem não passa
+        nem com 0.6 nunca dispara. IAs comprometidas já saíram da população no próprio hack.
+        Retorna [(ai, mensagem)] das ações com mensagem.
+        """
+        self.refresh_all()
+        blocked = self.code(self.status_names, "bloqueada")
+        use_numpy = self._use_numpy()
+        if use_numpy:
+            rows = np.flatnonzero(np.frombuffer(self.status_codes, dtype=np.uint16) != blocked).tolist()
+        else:
+            rows = [row for row, status in enumerate(self.status_codes) if status != blocked]
+
+        # o fast-forward pode ter pré-decidido os primeiros testes do dia (ver World._chance)
+        forced = world._forced_rolls
+        n_forced = min(len(forced), len(rows))
+        fired = [row for row in rows[:n_forced] if forced.popleft()]
+        drawn = rows[n_forced:]
+        draws = world.rng.ai.uniforms(len(drawn))
+        aggression = self.aggression
+        if use_numpy and drawn:
+            idx = np.asarray(drawn)
+            u = np.asarray(draws)
+            keep = np.flatnonzero(u < np.frombuffer(aggression)[idx] + 0.6)
+            candidates = zip(idx[keep].tolist(), u[keep].tolist())
+        else:
+            candidates = [(row, r) for row, r in zip(drawn, draws) if r < aggression[row] + 0.6]
+
+        out = []
+        ais = self.ais
+        resolve = self.resolve
+        for row in fired:
+            msg = resolve(row, player, world)
+            if msg:
+                out.append((ais[row], msg))
+        risk_term = min(0.6, player.risk / 100.0)
+        for row, r in candidates:
+            if r < aggression[row] + risk_term:
+                msg = resolve(row, player, world)
+                risk_term = min(0.6, player.risk / 100.0)
+                if msg:
+                    out.append((ais[row], msg))
+        return out
+
+    def resolve(self, row, player, world):
+        """
+        Ação da IA da linha `row` num dia em que ela decidiu agir: um sorteio O(1) na política do
+        tipo (AI_POLICIES) e a aplicação dos efeitos da ação. Retorna a mensagem ou None.
+        """
+        rng = world.rng.ai
+        samplers = self._samplers
+        if len(samplers) != len(self.type_names):
+            samplers = self._samplers = [(AI_POLICIES.get(kind) or AI_POLICIES["Generic"]).sampler
+                                         for kind in self.type_names]
+        # AIPolicy.draw em linha: um uniforme escolhe a coluna do alias e decide entre ela e o alias
+        n, prob, actions, alias = samplers[self.type_codes[row]]
+        u = rng.random() * n
+        i = int(u)
+        action = actions[i] if u - i < prob[i] else alias[i]
+        if action.needs_assets and not player.assets:
+            action = action.fallback
+            if action is None:
+                return None
+        ai = self.ais[row]
+        trace_power, level = self.trace_power[row], self.level[row]
+        who = None
+        if action.uses_who:
+            who = ai.fingerprint if ai.fingerprint != "UNKNOWN" else ai.uid
+        values = (ai.uid, who)
+        for effect, args, _, _ in action.effects:
+            values += effect(rng, player, trace_power, level, *args)
+        return action.template % action.pick(values)
+
+
+def _ai_column(column, names=None, aged=False):
+    """
+    Atributo de EnemyAI guardado numa coluna da AIPopulation (`names`: coluna de códigos;
+    `aged`: coluna que evolui com a idade, atualizada antes de ler ou escrever).
+    """
+    if aged:
+        def get(self):
+            self._pop.refresh(self._row)
+            return getattr(self._pop, column)[self._row]
+
+        def set(self, value):
+            self._pop.refresh(self._row)
+            getattr(self._pop, column)[self._row] = value
+    elif names is None:
+        def get(self):
+            return getattr(self._pop, column)[self._row]
+
+        def set(self, value):
+            getattr(self._pop, column)[self._row] = value
+    else:
+        def get(self):
+            pop = self._pop
+            return getattr(pop, names)[getattr(pop, column)[self._row]]
+
+        def set(self, value):
+            pop = self._pop
+            getattr(pop, column)[self._row] = pop.code(getattr(pop, names), value)
+    return property(get, set)
+
+
+class EnemyAI:
+    level = _ai_column("level", aged=True)
+    aggression = _ai_column("aggression", aged=True)
+    trace_power = _ai_column("trace_power", aged=True)
+    type = _ai_column("type_codes", "type_names")        # Pirata, Federal, Hacktivista, Generic
+    status = _ai_column("status_codes", "status_names")
+    blocked_until = _ai_column("blocked_until")
+
+    def __init__(self, level=1, uid=None):
+        self.uid = uid or f"{random.getrandbits(32):08x}" # identificador curto (reprodutível com a semente)
+        # linha própria até entrar na população de um World
+        AIPopulation().adopt(self, (level, 0.1 + 0.03 * level, 1.0 + 0.2 * (level - 1), "Generic", "ativa", None, 0))
+        self.compromised = False
+
+        # fingerprint visível ao jogador (oculta inicialmente)
+        self.fingerprint = "UNKNOWN"
+
+        self.region = "Global"
+        self.revealed_type = False  # só vira True quando comprometido/removido
+
+    def __getattr__(self, name):
+        # fingerprint real (hash do UID): só calculada quando alguém precisa dela
+        if name != "_fp_real":
+            raise AttributeError(name)
+        fp = self.__dict__["_fp_real"] = hashlib.sha256(self.uid.encode()).hexdigest()[:12].upper()
+        return fp
+
+    @property
+    def age_days(self):
+        return self._pop.day - self._pop.spawn_day[self._row]
+
+    @property
+    def label(self):
+        return f"AI-{self.uid}" #???
+
+    def apply_type_traits(self):
+        """Ajusta atributos internos conforme os traços do tipo em AI_BEHAVIOURS (Generic: nenhum)."""
+        policy = AI_POLICIES.get(self.type)
+        traits = policy.traits if policy else {}
+        if "aggression" in traits:
+            self.aggression += traits["aggression"]
+        if "trace" in traits or "trace_min" in traits:
+            trace_power = self.trace_power + traits.get("trace", 0.0)
+            self.trace_power = max(traits["trace_min"], trace_power) if "trace_min" in traits else trace_power
+
+    def reveal_fp(self):
+        """Revela fingerprint real e, parcialmente, o tipo (permite inferência após remoção)."""
+        if self.fingerprint == "UNKNOWN":
+            self.fingerprint = self._fp_real
+
+    def try_action(self, player, world):
+        """Ações diárias automatizadas da IA com efeitos diferentes por tipo."""
+        if self.status == "bloqueada" or self.compromised:
+            return None
+
+        threshold = self.aggression + min(0.6, player.risk / 100.0)
+
+        if world._chance(threshold, world.rng.ai):
+            return self.act(player, world)
+        return None
+
+    def act(self, player, world):
+        """Resolve a ação de um dia em que a IA decidiu agir."""
+        return self._pop.resolve(self._row, player, world)
+
+
+# -------------------- Enxames de IAs (nível de detalhe) --------------------
+# Com a população acima de AI_LOD_POPULATION, IAs ativas, ainda não reveladas, de nível baixo e
+# fora da região do jogador deixam de ser linhas individuais: viram membros do enxame da sua
+# região e tipo, que guarda só contagem, somas e coortes de evolução (memória O(1) por enxame).
+# O enxame decide o dia com um único teste (alguém age?) e, se sim, quantos agem; as ações saem da
+# mesma política do tipo (AI_POLICIES) e são aplicadas em lote. Scan e hack re-materializam
+# membros como EnemyAI.
+AI_LOD_POPULATION = 500     # IAs individuais acima das quais as distantes viram enxames
+AI_LOD_LEVEL_MARGIN = 3     # "nível baixo": até isto acima do nível base de spawn da região no dia
+AI_LOD_TARGET = 400         # ainda acima do limite depois disso, as mais antigas de qualquer região entram
+SWARM_EXACT_ACTIONS = 32    # membros resolvidos um a um por dia antes de o resto do enxame ir em lote
+
+
+def new_swarm(region, kind):
+    return {"region": region, "type": kind, "count": 0, "level_sum": 0, "aggression_sum": 0.0,
+            "trace_sum": 0.0, "cohorts": [0] * 30}
+
+
+def swarm_absorb(swarm, level, aggression, trace_power, spawn_day):
+    swarm["count"] += 1
+    swarm["level_sum"] += level
+    swarm["aggression_sum"] += aggression
+    swarm["trace_sum"] += trace_power
+    swarm["cohorts"][spawn_day % 30] += 1
+
+
+def swarm_age(swarm, day, days):
+    """Evoluções mensais dos membros nos dias (day, day + days]; retorna os níveis ganhos."""
+    gained = cohort_gain(swarm["cohorts"], day, days)
+    swarm["level_sum"] += gained
+    swarm["aggression_sum"] += 0.03 * gained   # o teto de 1.0 vale na média (swarm_member_p)
+    swarm["trace_sum"] += 0.1 * gained
+    return gained
+
+
+def swarm_member_p(swarm, risk_term, ups=0):
+    """Chance de um membro médio agir no dia (com `ups` evoluções a mais, para limites superiores)."""
+    aggression = min(1.0, swarm["aggression_sum"] / swarm["count"] + 0.03 * ups)
+    return min(1.0, aggression + risk_term)
+
+
+def swarm_release(swarm, day, rng):
+    """
+    Tira um membro médio do enxame: valores na ordem de AIPopulation.row_values, com a idade
+    escolhida dentro de uma coorte sorteada pelo tamanho (as evoluções seguem no mesmo ciclo).
+    """
+    n = swarm["count"]
+    level = swarm["level_sum"] if n == 1 else max(1, round(swarm["level_sum"] / n))
+    aggression = swarm["aggression_sum"] / n
+    trace_power = swarm["trace_sum"] / n
+    phase = sample_index(swarm["cohorts"], rng)
+    swarm["count"] -= 1
+    swarm["level_sum"] -= level
+    swarm["aggression_sum"] -= aggression
+    swarm["trace_sum"] -= trace_power
+    swarm["cohorts"][phase] -= 1
+    return (level, min(1.0, aggression), trace_power, swarm["type"], "ativa", None, (day - phase) % 30)
+
+
+def swarm_policy(swarm):
+    """Política do tipo do enxame (a mesma das IAs individuais; tipos sem tabela agem como Generic)."""
+    return AI_POLICIES.get(swarm["type"]) or AI_POLICIES["Generic"]
+
+
+def swarm_split(policy, k, rng):
+    """Quantas de k ações caem em cada ação da política (multinomial, por binomiais em sequência)."""
+    counts = []
+    left, rest = k, 1.0
+    last = len(policy.weights) - 1
+    for i, weight in enumerate(policy.weights):
+        c = left if i == last else sample_binomial(left, min(1.0, weight / rest) if rest > 0 else 0.0, rng)
+        counts.append(c)
+        left -= c
+        rest -= weight
+    return counts
+
+
+def swarm_apply(swarm, acting, player, rng):
+    """
+    Aplica `acting` ações de membros médios do enxame: as ações saem da política do tipo
+    (AI_POLICIES) divididas entre as ações da tabela, com o trace e o nível médios dos membros.
+    Ações sobre ativos são resolvidas uma a uma, em ordem sorteada, enquanto ainda houver alguma
+    que tira ativos (no máximo um por ativo); o resto de cada ação é aplicado em lote
+    (AI_EFFECTS_BULK). Ações que ficam sem ativo passam para o fallback, como nas IAs individuais.
+    """
+    policy = swarm_policy(swarm)
+    n = swarm["count"]
+    trace_power, level = swarm["trace_sum"] / n, swarm["level_sum"] / n
+    counts = dict(zip(policy.actions, swarm_split(policy, acting, rng)))
+    on_assets = [a for a in policy.actions if a.needs_assets and counts[a]]
+    pending = [counts[a] for a in on_assets]
+    while player.assets and any(c and a.takes_asset for a, c in zip(on_assets, pending)):
+        i = sample_index(pending, rng)
+        pending[i] -= 1
+        for effect, args, _, _ in on_assets[i].effects:
+            effect(rng, player, trace_power, level, *args)
+    for action, c in zip(on_assets, pending):
+        done = c if player.assets else 0
+        for _, args, name, _ in action.effects:
+            if done:
+                done = AI_EFFECTS_BULK[name](rng, player, trace_power, level, done, *args)
+        counts[action] = 0
+        if action.fallback is not None:
+            counts[action.fallback] += c - done
+    for action in policy.actions:
+        c = counts[action]
+        if c:
+            for _, args, name, _ in action.effects:
+                AI_EFFECTS_BULK[name](rng, player, trace_power, level, c, *args)
+
+
+def swarm_snapshot(player):
+    """O que swarm_report compara: risco, saldo, conhecimento e renda de cada ativo."""
+    return player.risk, player.money, player.knowledge, {id(a): a["income_per_day"] for a in player.assets}
+
+
+def swarm_report(swarm, acting, player, before):
+    """Mensagem única do dia do enxame, com o que mudou para o jogador desde `before`."""
+    risk, money, knowledge, income = before
+    parts = []
+    if player.risk > risk:
+        parts.append(f"Risco +{player.risk - risk:.1f}%.")
+    lost = len(income) - len(player.assets)
+    if lost:
+        parts.append(f"{lost} ativo(s) tomado(s).")
+    if any(a["income_per_day"] < income.get(id(a), 0.0) for a in player.assets):
+        parts.append("Rendimento de ativos reduzido.")
+    if player.money < money:
+        parts.append(f"Perda: ${money - player.money:.2f}.")
+    if player.knowledge > knowledge:
+        parts.append(f"Conhecimento +{player.knowledge - knowledge}.")
+    label = f"[Enxame {swarm['type']} x{acting} - {swarm['region']}]"
+    return f"{label} {' '.join(parts) or 'Atividade coordenada sem efeito visível.'}"
+
+
+def swarm_action(swarm, acting, player, world):
+    """Efeito combinado de `acting` membros agindo juntos (um lote só); retorna a mensagem."""
+    before = swarm_snapshot(player)
+    swarm_apply(swarm, acting, player, world.rng.ai)
+    return swarm_report(swarm, acting, player, before)
+
+# -------------------- Arquivo virtual --------------------
+def default_filesystem():
+    return {
+        "/": {"type": "dir", "children": ["home", "etc", "var"]},
+        "/home": {"type": "dir", "children": ["readme.txt"]},
+        "/home/readme.txt": {"type": "file", "content": 'Bem-vindo.\n\n Use "scan" para procurar alvos.\n Use "job_state" para procurar contratos não tão públicos.'},
+        "/etc": {"type": "dir", "children": ["motd"]},
+        "/etc/motd": {"type": "file", "content": "Sistema genérico. Jogo fictício."},
+        "/var": {"type": "dir", "children": []},
+    }
+
+
+# -------------------- Mecânicas centrais --------------------
+def calc_hack_chance(player, target, world=None):
+    skill = player.skills["exploit"]
+    chance = max(0.01, min(0.45, (skill / target.security) * 0.65))
+    chance += player.skills["exploit"] * 0.004
+    if "botnet_worm" in player.inventory:
+        chance = min(0.7, chance + 0.08)
+
+    # fator IA inimiga (tornar hacks mais difíceis se muitas IAs ativas)
+    ai_factor = 1.0
+    if world is not None and (world.enemy_ais or world.ai_swarms):
+        ai_factor = 1.0 + world.ai_level_sum * 0.02
+    chance = min(0.99, chance / ai_factor)
+
+    # foco do jogador influencia
+    focus_factor = 1.0 + ((player.focus - 50) / 200.0)
+    chance = min(0.99, max(0.01, chance * focus_factor))
+    return round(chance, 4)
+
+
+def visual_hack_roll(chance, player):
+    print("\n[ROULETTE] Inicializando protocolo de invasão...\n")
+    bar = ["░", "▒", "▓", "█"]
+    focus = player.focus
+    frames = RENDERER.frames([f"\r{symbol*30}  Foco:{focus:.1f}%  Chance:{chance*100:.1f}%" for symbol in bar])
+    for i in range(20):
+        RENDERER.frame(random.choice(frames))
+        pause(0.03 + random.random() * (0.07 - focus / 2000))
+    print("\r" + "█" * 30)
+
+
+
+def attempt_hack(player, target, world):
+    rng = world.rng.hack
+    hrs = max(1, int(2 + target.security * 1.5))
+    cost = max(0, target.security * 10)
+
+    player.hours_pass(hrs, world)
+
+    if player.money < cost:
+        return False, f"Dinheiro insuficiente para a operação (custos: ${cost:.2f})."
+
+    player.money -= cost
+
+    chance = calc_hack_chance(player, target, world)
+    roll = rng.random()
+    detected = False
+
+    visual_hack_roll(chance, player)
+    message = (
+        f"\nTentativa: chance={chance*100:.1f}% | roll={roll*100:.1f}%"
+    )
+
+    # ---------------------------------------------------------
+    # SUCESSO
+    # ---------------------------------------------------------
+    if roll < chance:
+        reward = target.reward
+
+        # Missões narrativas NÃO recebem recompensa dupla
+        if "mission" not in getattr(target, "hints", []):
+            player.money += reward
+
+        gained_knowledge = max(1, int(target.security / 2))
+        player.knowledge += gained_knowledge
+
+        player.skills["recon"] += 0.03 * target.security
+        player.skills["exploit"] += 0.03 * target.security
+        player.skills["stealth"] += 0.03 * target.security
+
+        player.risk = max(0.0, player.risk - target.security * 0.45)
+
+        # reputação
+        player.reputation["crime"] += 1
+        player.reputation["state"] = max(0, player.reputation["state"] - 1)
+
+        message += (
+            f"\nSucesso! Ganhou ${reward:.2f} e conhecimento (+{gained_knowledge})."
+            f"\nReputação: crime +1, state -1."
+        )
+
+        # detecção pós-sucesso
+        if rng.random() < 0.22 * target.trace_speed:
+            detected = True
+
+    # ---------------------------------------------------------
+    # FALHA
+    # ---------------------------------------------------------
+    else:
+        incr = target.security * (0.9 + rng.random())
+        player.risk = min(100.0, player.risk + incr)
+
+        player.knowledge += 0.15 * target.security
+
+        message += f"\nFalha. Risco aumentou em {incr:.1f}%."
+
+        # falha também é “atividade criminosa”
+        player.reputation["crime"] += 1
+        player.reputation["state"] = max(0, player.reputation["state"] - 1)
+
+        message += "\nReputação: crime +1, state -1."
+
+        if rng.random() < 0.45 * target.trace_speed:
+            detected = True
+
+    # ---------------------------------------------------------
+    # Detecção → trace
+    # ---------------------------------------------------------
+    if detected:
+        message += "\nAlvo detectou atividade. Iniciando trace..."
+        trace_msg = apply_trace(player, target, rng)
+        if trace_msg:
+            message += "\n" + trace_msg
+            pause(1.0)
+        if player.in_jail() and GAME_OVER_ON_JAIL:
+            player.game_over = True
+
+    # normalizar skills
+    for k in player.skills:
+        player.skills[k] = round(player.skills[k], 2)
+
+    # ---------------------------------------------------------
+    # Retorno final
+    # ---------------------------------------------------------
+    return roll < chance, message
+
+
+def apply_trace(player, target, rng=random):
+    """
+    Rastreamento e punições:
+    - risco ≤100
+    - stealth reduz punições
+    - reincidência aumenta severidade
+    - retorno SEMPRE consolidado (com reputação)
+    """
+    speed = getattr(target, "trace_speed", 1.0)
+
+    # aumento inicial de risco
+    increase = rng.uniform(4.0, 11.0) * speed
+    player.risk = min(100.0, player.risk + increase)
+
+    # iniciar memória de ataque caso não exista
+    if not hasattr(player, "attack_memory"):
+        player.attack_memory = {}
+    if target.id not in player.attack_memory:
+        player.attack_memory[target.id] = {"fails": 0, "detected": 0}
+
+    # registrar detecção
+    player.attack_memory[target.id]["detected"] += 1
+    reincidencia = player.attack_memory[target.id]["detected"]
+    reincidencia_factor = 1.0 + min(0.75, reincidencia * 0.15)
+
+    # stealth reduz chance de prisão
+    stealth_red = min(0.4, player.skills.get("stealth", 0.0) / 250.0)
+    chance_prisao = min(
+        1.0,
+        (0.05 + (player.risk / 100.0)) * (1.0 - stealth_red) * reincidencia_factor
+    )
+    foi_pego = rng.random() < chance_prisao
+
+    # reputação sempre: rastreamento = atividade criminosa detectada
+    player.reputation["crime"] += 1
+    player.reputation["state"] = max(0, player.reputation["state"] - 1)
+
+    # -------------------------
+    # PRISÃO OU MULTA PESADA
+    # -------------------------
+    if foi_pego:
+        multa_base = 300 + (player.risk * target.security * rng.uniform(0.5, 1.2))
+        multa_factor = (1.0 - min(0.3, player.skills.get("stealth", 0.0) / 300.0))
+        multa_factor *= reincidencia_factor
+
+        multa = round(multa_base * multa_factor, 2)
+
+        # sem dinheiro para pagar → prisão
+        if player.money < multa:
+            player.jailed_until = player.time + timedelta(hours=rng.randint(24, 120))
+            player.risk = 0.0
+
+            return (
+                "Rastreamento completo!\n"
+            )
+
+        # multa paga com sucesso
+        player.money -= multa
+        player.risk = max(0.0, player.risk - (10 + target.security))
+
+        return (
+            f"Você foi multado em ${multa:.2f} e escapou da prisão.\n"
+            f"Risco atual: {player.risk:.1f}%.\n"
+            f"Reputação: crime +1, state -1."
+        )
+
+    # -------------------------
+    # EVASÃO (custo leve)
+    # -------------------------
+    evasao_base = 30 + player.risk * (0.2 + 0.1 * speed)
+    evasao_factor = 1.0 - min(0.25, player.skills.get("stealth", 0.0) / 400.0)
+    evasao_factor *= (1.0 + (reincidencia - 1) * 0.08)
+
+    multa = round(evasao_base * evasao_factor, 2)
+    paid = min(player.money, multa)
+    player.money -= paid
+
+    return (
+        f"Trace detectado. Custos de evasão: ${paid:.2f}.\n"
+        f"Risco atual: {player.risk:.1f}%.\n"
+        f"Reputação: crime +1, state -1."
+    )
+
+# está duplicando alerta, mas preservar por enquanto
+def notify(player, world, message, console=True):
+    world.last_alerts.append((world.day, message))
+    if console:
+        print(f"\n[ALERTA] {message}")
+
+
+def check_reputation_unlocks(player, world):
+    if not hasattr(player, "special_missions_available"):
+        player.special_missions_available = set()
+
+    # AUTORIDADE ÚNICA
+    unlocked_now, removed_now = refresh_special_missions(player, world)
+
+    for mid in unlocked_now:
+        notify(player, world, f"Missão especial disponível: {mid}")
+
+    for mid in removed_now:
+        notify(player, world, f"Missão especial removida: {mid}")
+
+    return unlocked_now
+
+
+def trigger_reputation_event(player, world, event):
+    """
+    Eventos que alteram skills e reputação.
+    Agora o desbloqueio de missões é 100% automático via requisitos em world.missions_def.
+    """
+
+    msg = ""
+
+    # --- HACKTIVISTS ---------------------------------------
+    if event == "hacktivists_event1":
+        player.skills["exploit"] += 5
+        player.skills["stealth"] += 2
+        msg = "Coletivo te envia um zero-day experimental. Exploit +5, stealth +2."
+        notify(player, world, f"[HACKTIVIST] {msg}")
+
+    elif event == "hacktivists_event2":
+        # Antes: player.special_missions.add("hx_m1")
+        # Agora: reputação → check_reputation_unlocks → desbloqueio automático
+        player.reputation["hacktivists"] += 3
+        msg = "Sua influência entre os hacktivistas aumenta."
+        notify(player, world, f"[HACKTIVIST] {msg}")
+
+    # --- STATE ----------------------------------------------
+    elif event == "state_event1":
+        player.unlocked_jobs.add("job_state")
+        msg = "Trabalho irregular liberado: job_state"
+        notify(player, world, f"[STATE] Novo trabalho disponível: job_state")
+
+        # bônus de reputação (se quiser consistência):
+        player.reputation["state"] += 2
+
+    # --- CRIME ----------------------------------------------
+    elif event == "crime_event1":
+        player.skills["exploit"] += 7
+        msg = "Grupo clandestino te passa payload agressivo. Exploit +7."
+        notify(player, world, f"[CRIME] {msg}")
+
+    elif event == "crime_event2":
+        # Antes: player.special_missions.add("cr_m1")
+        # Agora: reputação faz o trabalho
+        player.reputation["crime"] += 3
+        msg = "Você ganha respeito no submundo."
+        notify(player, world, f"[CRIME] {msg}")
+
+    else:
+        return ""
+
+    # ======================================================
+    # Desbloqueio automático baseado na reputação atualizada
+    # ======================================================
+    new_unlocks = check_reputation_unlocks(player, world)
+    if new_unlocks:
+        msg += "\nMissões liberadas: " + ", ".join(new_unlocks)
+
+    return msg
+
+
+def visual_mission_roll(chance, player, title):
+    print(f"\n[MISSÃO] {title}")
+    print("[PROTOCOLO] Conexões encobertas, canais rotativos...\n")
+
+    bar = ["▁","▂","▃","▄","▅","▆","▇","█"]
+    focus = player.focus
+    frames = RENDERER.frames([f"\r{symbol*40}  Foco:{focus:.1f}%  Sucesso:{chance*100:.1f}%" for symbol in bar])
+    for i in range(35):
+        RENDERER.frame(random.choice(frames))
+        pause(0.04 + random.random() * (0.06 - focus / 3000))
+    print("\r" + "█" * 40 + "\n")
+
+
+# -------------------- Catálogo de missões --------------------
+# Requisitos de reputação de cada missão especial
+MISSION_REQUIREMENTS = {
+    # ===========================
+    # HACKTIVISTS — ROTAS DA VERDADE
+    # ===========================
+    "hx_m1": {
+        "min_rep": {"hacktivists": 6},
+        "unlock_next": "hx_m2",
+    },
+    "hx_m2": {
+        "min_rep": {"hacktivists": 10},
+        "unlock_next": "hx_m3",
+    },
+    "hx_m3": {
+        "min_rep": {"hacktivists": 14},
+        "unlock_next": "hx_m4",
+    },
+    "hx_m4": {
+        "min_rep": {"hacktivists": 19},
+        "unlock_next": "hx_m5",
+    },
+    "hx_m5": {
+        "min_rep": {"hacktivists": 25},
+        "unlock_next": "hx_m6",
+    },
+    "hx_m6": {
+        "min_rep": {"hacktivists": 33},
+        "unlock_next": None,
+    },
+
+    # ===========================
+    # CRIME — ROTA DA CORRUPÇÃO DIGITAL
+    # ===========================
+    "cr_m1": {
+        "min_rep": {"crime": 9},
+        "unlock_next": "cr_m2",
+    },
+    "cr_m2": {
+        "min_rep": {"crime": 15},
+        "unlock_next": "cr_m3",
+    },
+    "cr_m3": {
+        "min_rep": {"crime": 21},
+        "unlock_next": "cr_m4",
+    },
+    "cr_m4": {
+        "min_rep": {"crime": 28},
+        "unlock_next": "cr_m5",
+    },
+    "cr_m5": {
+        "min_rep": {"crime": 36},
+        "unlock_next": "cr_m6",
+    },
+    "cr_m6": {
+        "min_rep": {"crime": 45},
+        "unlock_next": None,
+    },
+
+    # ===========================
+    # STATE — ORDEM E HEROÍSMO PÁLIDO
+    # ===========================
+    "st_m1": {
+        "min_rep": {"state": 16},
+        "unlock_next": "st_m2",
+    },
+    "st_m2": {
+        "min_rep": {"state": 22},
+        "unlock_next": "st_m3",
+    },
+    "st_m3": {
+        "min_rep": {"state": 29},
+        "unlock_next": "st_m4",
+    },
+    "st_m4": {
+        "min_rep": {"state": 38},
+        "unlock_next": "st_m5",
+    },
+    "st_m5": {
+        "min_rep": {"state": 46},
+        "unlock_next": "st_m6",
+    },
+    "st_m6": {
+        "min_rep": {"state": 54},
+        "unlock_next": None,
+    },
+
+    # ===========================
+    # SINGULARITY — A ASCENSÃO INVISÍVEL
+    # ===========================
+    "sg_m1": {
+        "min_rep": {"hacktivists": 33},
+        "unlock_next": "sg_m2",
+    },
+    "sg_m2": {
+        "min_rep": {"hacktivists": 40},
+        "min_rep_or": [
+            {"crime": 52}
+        ],
+        "unlock_next": "sg_m3",
+    },
+    "sg_m3": {
+        "min_rep": {"hacktivists": 49},
+        "min_rep_or": [
+            {"state": 37},
+            {"crime": 52}     # rota “caótica” alternativa
+        ],
+        "unlock_next": "sg_m4",
+    },
+    "sg_m4": {
+        "min_rep": {"hacktivists": 61},
+        "min_rep_or": [
+            {"crime": 67}
+        ],
+        "unlock_next": "sg_m5",
+    },
+    "sg_m5": {
+        "min_rep": {"hacktivists": 72},
+        "min_rep_or": [
+            {"state": 47, "crime": 47},   # AND combinado
+            {"crime": 80},                # alternativa solo
+            {"state": 77}                 # alternativa solo
+        ],
+        "unlock_next": None,
+    },
+    # Continuação em forma de diálogo em árvore + reputação
+}
+
+
+
+
+def compile_requirements(min_rep, min_rep_or=()):
+    """
+    Transforma min_rep (todos) e min_rep_or (algum bloco; lista vazia = atendido) numa função
+    reputação -> bool, com os pares já em tuplas para não refazer dicts a cada checagem.
+    """
+    required = tuple(min_rep.items())
+    alternatives = tuple(tuple(block.items()) for block in min_rep_or)
+
+    def meets(reputation):
+        get = reputation.get
+        for faction, value in required:
+            if get(faction, 0) < value:
+                return False
+        if not alternatives:
+            return True
+        for block in alternatives:
+            for faction, value in block:
+                if get(faction, 0) < value:
+                    break
+            else:
+                return True
+        return False
+
+    return meets
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def build_mission_catalog(requirements, texts):
+    """Une requisitos e textos numa visão somente-leitura; montado uma vez por processo."""
+    catalog = {}
+    for mid, req in requirements.items():
+        entry = dict(texts[mid])
+        entry.update(req)
+        entry["requirements"] = compile_requirements(req.get("min_rep", {}), req.get("min_rep_or", []))
+        catalog[mid] = _freeze(entry)
+    return MappingProxyType(catalog)
+
+
+class _LazyCatalog(Mapping):
+    """
+    Catálogo compartilhado: as chaves saem de MISSION_REQUIREMENTS; os textos (narrative.py)
+    só são importados e unidos aos requisitos no primeiro acesso a uma missão.
+    """
+
+    def __init__(self, requirements):
+        self._requirements = requirements
+        self._catalog = None
+
+    def __getitem__(self, mid):
+        if self._catalog is None:
+            from .narrative import MISSION_TEXTS
+            self._catalog = build_mission_catalog(self._requirements, MISSION_TEXTS)
+        return self._catalog[mid]
+
+    def __iter__(self):
+        return iter(self._requirements)
+
+    def __len__(self):
+        return len(self._requirements)
+
+
+MISSION_CATALOG = _LazyCatalog(MISSION_REQUIREMENTS)
+# requisitos compilados do catálogo compartilhado, checados sem carregar os textos
+MISSION_RULES = MappingProxyType({
+    mid: compile_requirements(req.get("min_rep", {}), req.get("min_rep_or", []))
+    for mid, req in MISSION_REQUIREMENTS.items()
+})
+
+
+def attempt_special_mission(player, world, mission_id):
+    """
+    Missões narrativas de reputação (hx_, cr_, st_).
+    Agora plenamente integradas com attempt_hack e Target.
+    """
+
+    # --- SINCRONIZAÇÃO COM SISTEMA DE REPUTAÇÃO ---
+    check_reputation_unlocks(player, world)
+
+
+    if mission_id not in player.special_missions_available:
+        return False, "Missão não disponível no momento."
+
+    data = world.missions_def[mission_id]
+
+    # --- HACK COMO TARGET ---
+    tid = world.next_tid
+    world.next_tid += 1
+    target = Target(
+        tid,
+        f"{data['title']} ({mission_id})",
+        data["base_security"],
+        data["reward_money"],
+        data["trace_speed"],
+        region=player.region,
+        hints=["mission"]
+    )
+
+    print("\n" + data["title"] + "\n\n")
+    pause(2)
+    #print(data["narrative"] + "\n")
+    #time.sleep(4)
+
+    est = max(1, int(2 + target.security * 1.5))
+    success, msg = attempt_hack(player, target, world)
+
+    # Completar horas planejadas
+    rem = data["hours"] - est
+    if rem > 0:
+        player.hours_pass(rem, world)
+
+    # --- PÓS-MISSÃO ---
+    if success:
+        print("\n" + data["narrative"] + "\n")
+        pause(4)
+
+        player.money += data["reward_money"]
+
+        for s, v in data["reward_skills"].items():
+            player.skills[s] = round(player.skills.get(s, 0) + v, 2)
+
+        player.focus = min(100, player.focus + data["focus_gain"])
+
+        # reputação
+        player.reputation["crime"] += data["crime_rep"]
+        player.reputation["state"] += data["state_rep"]
+        if "hacktivist_rep" in data:
+            player.reputation["hacktivists"] += data["hacktivist_rep"]
+
+        # marcar completada
+        player.special_missions_completed.add(mission_id)
+        if mission_id in player.special_missions_available:
+            player.special_missions_available.remove(mission_id)
+
+        notify(player, world, f"Missão concluída: {mission_id}")
+
+        # desbloqueio sequencial
+        if data["unlock_next"]:
+            nxt = data["unlock_next"]
+            # NÃO adiciona direto ao inventário — deixa reputação decidir
+#            world.last_alerts.append((world.day, f"Nova missão sequencial desbloqueada: {nxt}"))
+            msg += f"\nNova missão desbloqueada: {nxt}"
+
+    else:
+        player.focus = max(0, player.focus + data["focus_gain"])
+
+    # reputação pode liberar novas missões
+    new_unlocks = check_reputation_unlocks(player, world)
+    for mid in new_unlocks:
+        notify(player, world, f"Missão especial disponível: {mid}", console=False)
+
+    return success, f"\nTentativa: {data['title']} — {msg}"
+
+
+def build_threshold_index(catalog):
+    """
+    facção -> (limiares ordenados, missões): cada missão aparece uma vez por limiar que usa
+    (min_rep e blocos de min_rep_or). O requisito de uma missão só muda de valor quando
+    alguma dessas facções cruza um desses limiares.
+    """
+    pairs = {}
+    for mid, data in catalog.items():
+        blocks = [data.get("min_rep", {})] + list(data.get("min_rep_or", ()))
+        for block in blocks:
+            for faction, threshold in block.items():
+                pairs.setdefault(faction, []).append((threshold, mid))
+    index = {}
+    for faction, items in pairs.items():
+        items.sort()
+        index[faction] = ([t for t, _ in items], [mid for _, mid in items])
+    return index
+
+
+MISSION_THRESHOLDS = build_threshold_index(MISSION_REQUIREMENTS)
+
+
+def _crossed_missions(reputation, seen):
+    """Missões com algum limiar entre o valor visto na última checagem e o atual, por facção alterada."""
+    crossed = set()
+    for faction in reputation.dirty:
+        old, new = seen.get(faction, 0), reputation.get(faction, 0)
+        if old == new or faction not in MISSION_THRESHOLDS:
+            continue
+        thresholds, mids = MISSION_THRESHOLDS[faction]
+        lo, hi = min(old, new), max(old, new)
+        # `valor >= t` muda exatamente quando lo < t <= hi
+        crossed.update(mids[bisect.bisect_right(thresholds, lo):bisect.bisect_right(thresholds, hi)])
+    return crossed
+
+
+def refresh_special_missions(player, world):
+    """
+    Reavalia a disponibilidade das missões especiais e devolve (liberadas, removidas).
+    Com a reputação rastreada (Reputation) e o catálogo compartilhado, só olha as missões
+    cujos limiares foram cruzados desde a última chamada; sem mudança de reputação, nada.
+    """
+    if not hasattr(player, "special_missions_available"):
+        player.special_missions_available = set()
+    if not hasattr(player, "special_missions_completed"):
+        player.special_missions_completed = set()
+
+    missions = world.missions_def
+    reputation = player.reputation
+    seen = getattr(player, "_mission_rep_seen", None)
+    shared = missions is MISSION_CATALOG
+    incremental = isinstance(reputation, Reputation) and shared and seen is not None
+    if incremental:
+        if not reputation.dirty:
+            return [], []
+        candidates = _crossed_missions(reputation, seen)
+    else:
+        candidates = missions
+    if isinstance(reputation, Reputation):
+        reputation.dirty.clear()
+    player._mission_rep_seen = dict(reputation)
+
+    added, removed = [], []
+    for mid in candidates:
+        # requisitos min_rep (AND) e min_rep_or (lista de blocos) compilados no catálogo
+        meets = (MISSION_RULES[mid] if shared else missions[mid]["requirements"])(reputation)
+
+        if mid in player.special_missions_completed:
+            # missão feita → não volta
+            player.special_missions_available.discard(mid)
+            continue
+
+        if meets:
+            if mid not in player.special_missions_available:
+                player.special_missions_available.add(mid)
+                added.append(mid)
+#                world.last_alerts.append((world.day, f"Missão especial disponível: {mid}"))
+        else:
+            if mid in player.special_missions_available:
+                player.special_missions_available.remove(mid)
+                removed.append(mid)
+                world.last_alerts.append((world.day, f"Missão especial removida: {mid}"))
+    return added, removed
+
+
+def flush_world_feedback(player, world):
+    """
+    Alertas mundiais desde o último comando viram alertas do jogador. As ações das IAs e dos
+    enxames já entram em last_alerts no próprio advance_day, quando acontecem.
+    """
+    if world.last_alerts:
+        alerts = list(world.last_alerts)
+        world.last_alerts.clear()
+        for day, alert in alerts:
+            player.push_alert(f"[Dia {day}] {alert}", delay=False)
+
+
+# -------------------- Loop principal --------------------
+def execute_command(player, world, cmdline):
+    """Executa uma linha de comando do shell. Retorna False quando o jogador encerra a sessão."""
+    from .commands import COMMANDS, POST_COMMAND_HOOKS
+    if RECORDER is not None:
+        RECORDER.command(cmdline)
+    if JOURNAL is not None:
+        JOURNAL.command(cmdline, player, world)
+    player.record_command(cmdline)
+    try:
+        parts = cmdline.split()
+        spec = COMMANDS.get(parts[0])
+        if spec is None:
+            print("Comando não reconhecido. Digite help.")
+            player.maybe_game_over()
+            return True
+
+        out = spec["handler"](player, world, parts[1:])
+        if out is not None:
+            print(out)
+        if spec["events"]:
+            for hook in POST_COMMAND_HOOKS:
+                hook(player, world)
+        return not spec["ends_session"]
+    finally:
+        if JOURNAL is not None:
+            JOURNAL.commit(player, world)
+
+
+def repl():
+    import sys, random
+
+    recover = bool(JOURNAL_PATH) and os.path.exists(f"{JOURNAL_PATH}.snap")
+    fresh = not (LOAD_PATH or recover)
+    # semente da sessão nova sorteada antes do boot, que também usa o random global
+    seed = random.getrandbits(64) if fresh else None
+
+    from .art import boot_sequence, fast_boot
+    if FAST_START:
+        fast_boot()
+    else:
+        boot_sequence()
+
+    global RECORDER, JOURNAL
+    journal = None
+    if recover:
+        # queda anterior: último snapshot + comandos do journal depois dele
+        try:
+            journal, player, world, replayed = open_journal(JOURNAL_PATH)
+        except ValueError as exc:
+            print(f"\nJournal {JOURNAL_PATH} não recuperável: {exc}.")
+            return
+        print(f"\nSessão recuperada do journal {JOURNAL_PATH} ({replayed} comandos reaplicados).")
+    elif not fresh:
+        # sessão retomada de um save: a identidade já está no arquivo
+        player, world = load_game(LOAD_PATH)
+        seed = world.rng.seed
+        print(f"\nSessão restaurada de {LOAD_PATH}.")
+    else:
+        print("\nAuthentication Required.\n")
+
+        # ===== User Credentials =====
+        username = ""
+        while not username:
+            username = input("alias: ").strip()
+            if not username:
+                print("Invalid codename.")
+
+        player = Player()
+        player.name = username
+        world = World(seed=seed)
+    # daqui em diante o random global também sai da semente do mundo: a sessão pode ser regravada
+    # (na recuperação ele já está no ponto em que o replay do journal parou)
+    if seed is not None:
+        random.seed(seed)
+    rng_state = random.getstate()
+
+    print(f"\nConnection established, {player.name}.")
+    if not FAST_START:
+        pause(random.uniform(0.3, 0.6))
+    print("Type 'help' to initiate operations.")
+    if not FAST_START:
+        pause(random.uniform(0.5, 0.8))
+    # as pausas acima também sorteiam; o jogo começa do estado fixado antes delas
+    random.setstate(rng_state)
+
+    if RECORD_PATH and (not fresh or JOURNAL_PATH):
+        # a gravação reconstrói a sessão só da semente: não cobre saves nem os snapshots do journal
+        print("--record vale só para sessões novas sem --load/--journal; gravação ignorada.")
+    elif RECORD_PATH:
+        RECORDER = SessionRecorder(RECORD_PATH, seed, player.name)
+    if JOURNAL_PATH:
+        JOURNAL = journal or Journal(JOURNAL_PATH)
+
+    try:
+        repl_loop(player, world)
+    finally:
+        if RECORDER is not None:
+            RECORDER.close(player, world)
+            RECORDER = None
+        if JOURNAL is not None:
+            JOURNAL.close()
+            JOURNAL = None
+
+
+def repl_loop(player, world):
+    # === Loop principal continua inalterado ===
+    while True:
+        # >>> GAME OVER IMEDIATO POR PRISÃO <<<
+        if hasattr(player, "jailed") and player.jailed:
+            print("\n...")
+            pause(1.0)
+            print("\nVocê foi localizado pelo inimigo.\n")
+            pause(1.0)
+            print("\n\tGAME OVER\n")
+            pause(1.0)
+            sys.exit(0)
+
+        if player.game_over:
+            print("\n...")
+            pause(1.0)
+            print("\n\tGAME OVER\n")
+            pause(1.0)
+            sys.exit(0)
+
+        # após cada comando, mostrar alertas mundiais recentes e ações das IAs
+        flush_world_feedback(player, world)
+
+        try:
+            prompt = f"{player.name}@simulation:{player.cwd}$ "
+            try:
+                line = input(prompt)
+            except UnicodeDecodeError:
+                # Recupera entrada mesmo se vier byte inválido
+                raw = sys.stdin.buffer.readline()
+                line = raw.decode("utf-8", errors="replace").rstrip("\n")
+
+        except (KeyboardInterrupt, EOFError):
+            print("\nSaindo...")
+            break
+
+        cmdline = line.strip()
+        if not cmdline:
+            continue
+
+        if not execute_command(player, world, cmdline):
+            break
+
+        # >>> Checagem FINAL de prisão após comando <<<
+        if hasattr(player, "jailed") and player.jailed:
+            print("...") # introduzir mais mansagens e randomizar
+            pause(1)
+            print("\n\tGAME OVER\n")
+            pause(1)
+            sys.exit(0)
+
+
+# -------------------- Execução headless --------------------
+# Política = callable(player, world) -> linha de comando (str) ou None para encerrar a campanha.
+def policy_idle(player, world):
+    return "sleep"
+
+
+GRINDER_RASPBERRIES = 5     # raspberries no inventário (+5 exploit cada) para os contratos do Estado
+GRINDER_ESCAPE_AIS = 3      # IAs no mundo a partir das quais some pela sub-rede clandestina
+GRINDER_STATE_FOCUS = 90    # foco com que encara o job_state (o foco multiplica a chance)
+
+
+def policy_grinder(player, world):
+    """
+    Carreira estatal: trabalha até a confiança do Estado liberar o job_state, equipa exploit e
+    encara cada contrato descansado; quando as IAs se acumulam, some pela sub-rede clandestina,
+    que as despista. Nunca gasta a reserva de um suborno (BRIBE_COST).
+    """
+    from .commands import JOB_STATE_MIN_REP, SHOP, travel_cost
+    reserve = BRIBE_COST[1]
+    hideout = min((r for r, meta in world.regions.items() if meta["unlocked"]),
+                  key=lambda r: world.regions[r]["difficulty"])
+    escape = travel_cost(world.regions[hideout]["difficulty"], "clandestino")
+    if world.enemy_ai_count() >= GRINDER_ESCAPE_AIS and player.money >= escape + reserve:
+        return f"travel {hideout} clandestino"
+    if (player.inventory.count("raspberry") < GRINDER_RASPBERRIES
+            and player.money >= SHOP["raspberry"]["price"] + reserve):
+        return "buy raspberry"
+    ready = player.next_job_state_time is None or player.time >= player.next_job_state_time
+    if player.reputation["state"] >= JOB_STATE_MIN_REP and ready:
+        return "job_state" if player.focus >= GRINDER_STATE_FOCUS else "sleep"
+    if player.focus < MIN_FOCUS_JOB:
+        return "sleep"
+    return "jobs"
+
+
+def policy_random(player, world):
+    from .commands import SHOP
+    cmd = random.choice(["scan", "jobs", "sleep", "study", "hack", "status", "news", "buy"])
+    if cmd == "hack" and world.last_scan:
+        return f"hack {random.choice(world.last_scan).id}"
+    if cmd == "buy":
+        return f"buy {random.choice(list(SHOP))}"
+    if cmd == "hack":
+        return "scan"
+    return cmd
+
+
+HEADLESS_POLICIES = {
+    "idle": policy_idle,
+    "grinder": policy_grinder,
+    "random": policy_random,
+}
+
+
+def headless_answer(prompt):
+    """
+    Resposta padrão dos bots às perguntas interativas, determinística e longe da prisão: recusa
+    contratos, esconde ativos e só suborna a fiscalização com saldo para qualquer valor pedido.
+    """
+    if "região" in prompt:
+        return "NorthAmerica"
+    if "suborno" in prompt:
+        balance = float(prompt.rpartition("$")[2].rstrip("): "))
+        return "A" if balance >= BRIBE_COST[1] else "B"
+    if "confisco" in prompt:
+        return "A"
+    return "B"
+
+
+def run_campaign(policy, days=365, max_commands=100000):
+    """Roda uma campanha completa sem terminal. Retorna (player, world)."""
+    player = Player()
+    player.name = "bot"
+    world = World()
+
+    for _ in range(max_commands):
+        if player.game_over or getattr(player, "jailed", False) or world.day >= days:
+            break
+        line = policy(player, world)
+        if not line:
+            break
+        if not execute_command(player, world, line):
+            break
+        world.last_alerts.clear()
+    return player, world
+
+
+def campaign_summary(player, world):
+    return {
+        "days": world.day,
+        "money": round(player.money, 2),
+        "knowledge": player.knowledge,
+        "reputation": dict(player.reputation),
+        "game_over": player.game_over,
+        "enemy_ais": world.enemy_ai_count(),
+    }
+
+
+def run_seeded_campaign(index, seed, days=365, policy_name="grinder", fast_forward=False):
+    """Uma campanha headless completa com semente própria. Ponto de entrada dos processos do pool."""
+    global HEADLESS, PROMPT_HANDLER, FAST_FORWARD
+    import contextlib
+
+    HEADLESS, PROMPT_HANDLER, FAST_FORWARD = True, headless_answer, fast_forward
+    random.seed(seed)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        player, w = run_campaign(HEADLESS_POLICIES[policy_name], days=days)
+    result = campaign_summary(player, w)
+    result.update(index=index, seed=seed)
+    return result
+
+
+def iter_parallel_campaigns(campaigns, days=365, policy_name="grinder", master_seed=None, workers=None,
+                            fast_forward=False):
+    """
+    Distribui campanhas inteiras num ProcessPoolExecutor e devolve os resultados à medida que terminam.
+    Cada campanha recebe derive_seed(master_seed, i), então o resultado da campanha i não depende
+    do número de processos nem da ordem de término.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    if master_seed is None:
+        master_seed = random.SystemRandom().getrandbits(63)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(run_seeded_campaign, i, derive_seed(master_seed, i), days, policy_name, fast_forward)
+            for i in range(campaigns)
+        ]
+        for fut in as_completed(futures):
+            yield fut.result()
+
+
+def run_headless(campaigns=1, days=365, policy=policy_grinder, answer=headless_answer, seed=None, quiet=True,
+                 fast_forward=False):
+    """Roda várias campanhas em sequência e devolve estatísticas de throughput."""
+    global HEADLESS, PROMPT_HANDLER, FAST_FORWARD
+    import contextlib
+
+    old_headless, old_handler, old_ff = HEADLESS, PROMPT_HANDLER, FAST_FORWARD
+    HEADLESS, PROMPT_HANDLER, FAST_FORWARD = True, answer, fast_forward
+    total_days = 0
+    results = []
+    t0 = time.perf_counter()
+    try:
+        with open(os.devnull, "w") as devnull:
+            sink = devnull if quiet else sys.stdout
+            with contextlib.redirect_stdout(sink):
+                for i in range(campaigns):
+                    if seed is not None:
+                        random.seed(derive_seed(seed, i))
+                    player, w = run_campaign(policy, days=days)
+                    total_days += w.day
+                    results.append(campaign_summary(player, w))
+    finally:
+        HEADLESS, PROMPT_HANDLER, FAST_FORWARD = old_headless, old_handler, old_ff
+    elapsed = max(1e-9, time.perf_counter() - t0)
+
+    return {
+        "campaigns": campaigns,
+        "days": total_days,
+        "elapsed": elapsed,
+        "campaigns_per_sec": campaigns / elapsed,
+        "days_per_sec": total_days / elapsed,
+        "results": results,
+    }
+
+
+def run_parallel(campaigns=1, days=365, policy_name="grinder", seed=None, workers=None, fast_forward=False):
+    """Versão multiprocesso de run_headless (mesmas estatísticas; resultados ordenados por campanha)."""
+    t0 = time.perf_counter()
+    results = sorted(
+        iter_parallel_campaigns(campaigns, days, policy_name, seed, workers, fast_forward),
+        key=lambda r: r["index"],
+    )
+    elapsed = max(1e-9, time.perf_counter() - t0)
+    total_days = sum(r["days"] for r in results)
+    return {
+        "campaigns": campaigns,
+        "days": total_days,
+        "elapsed": elapsed,
+        "campaigns_per_sec": campaigns / elapsed,
+        "days_per_sec": total_days / elapsed,
+        "results": results,
+    }
+
+
+def headless_main(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="PERSONAL_SECURITY_SYSTEM.py headless",
+                                     description="Roda campanhas sem terminal para balanceamento.")
+    parser.add_argument("--campaigns", type=int, default=10)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--policy", choices=sorted(HEADLESS_POLICIES), default="grinder")
+    parser.add_argument("--seed", type=int, default=RNG_SEED)
+    parser.add_argument("--verbose", action="store_true", help="mostra a saída do jogo")
+    parser.add_argument("--fast-forward", action="store_true", help="pula dias calmos em ações longas")
+    parser.add_argument("--workers", type=int, default=1, help="processos paralelos (0 = um por CPU)")
+    opts = parser.parse_args(argv)
+
+    if opts.workers != 1:
+        stats = run_parallel(
+            campaigns=opts.campaigns,
+            days=opts.days,
+            policy_name=opts.policy,
+            seed=opts.seed,
+            workers=opts.workers or None,
+            fast_forward=opts.fast_forward,
+        )
+    else:
+        stats = run_headless(
+            campaigns=opts.campaigns,
+            days=opts.days,
+            policy=HEADLESS_POLICIES[opts.policy],
+            seed=opts.seed,
+            quiet=not opts.verbose,
+            fast_forward=opts.fast_forward,
+        )
+    over = sum(1 for r in stats["results"] if r["game_over"])
+    print(f"Campanhas: {stats['campaigns']} | dias simulados: {stats['days']} | game over: {over}")
+    print(f"Tempo: {stats['elapsed']:.2f}s | {stats['campaigns_per_sec']:.2f} campanhas/s | {stats['days_per_sec']:.1f} dias/s")
+    return 0
+
+
+# -------------------- Modo batch --------------------
+def iter_script_lines(stream):
+    """Linhas de um script de comandos, sem brancos nem comentários (# ...)."""
+    for raw in stream:
+        line = raw.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+def run_batch(lines, alias="batch", seed=None, echo=False, answer=None):
+    """
+    Roda uma sessão inteira a partir de linhas de comando, sem prompts nem animações.
+    Perguntas do jogo (ask) vão para `answer(prompt)`; por padrão consomem a próxima linha,
+    como acontece ao redirecionar a entrada do shell interativo (sem linhas, headless_answer).
+    Semeia jogador, mundo e random global na mesma ordem do repl().
+    Retorna (player, world, estatísticas).
+    """
+    global HEADLESS, PROMPT_HANDLER, RECORDER
+
+    lines = iter(lines)
+
+    def next_line(prompt):
+        line = next(lines, None)
+        return headless_answer(prompt) if line is None else line
+
+    if seed is None:
+        seed = random.getrandbits(64)
+    old_headless, old_handler = HEADLESS, PROMPT_HANDLER
+    HEADLESS, PROMPT_HANDLER = True, answer or next_line
+    commands = advanced = 0
+    t0 = time.perf_counter()
+    player = Player()
+    player.name = alias
+    world = World(seed=seed)
+    random.seed(seed)
+    if RECORD_PATH:
+        RECORDER = SessionRecorder(RECORD_PATH, seed, alias)
+    try:
+        for cmdline in lines:
+            if player.game_over or getattr(player, "jailed", False):
+                break
+            if echo:
+                print(f"{player.name}@simulation:{player.cwd}$ {cmdline}")
+            commands += 1
+            before = player.time
+            if not execute_command(player, world, cmdline):
+                break
+            advanced += player.time != before
+            flush_world_feedback(player, world)
+    finally:
+        HEADLESS, PROMPT_HANDLER = old_headless, old_handler
+        if RECORDER is not None:
+            RECORDER.close(player, world)
+            RECORDER = None
+    elapsed = max(1e-9, time.perf_counter() - t0)
+    return player, world, {
+        "seed": seed,
+        "commands": commands,
+        "advances_time": advanced,
+        "day": world.day,
+        "game_over": bool(player.game_over or getattr(player, "jailed", False)),
+        "elapsed": elapsed,
+    }
+
+
+def batch_main(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="PERSONAL_SECURITY_SYSTEM.py batch",
+                                     description="Executa comandos de um arquivo ou da entrada padrão, sem prompts nem animações.")
+    parser.add_argument("script", nargs="?", default="-", help="arquivo com um comando por linha (- = stdin)")
+    parser.add_argument("--alias", default="batch")
+    parser.add_argument("--seed", type=int, default=RNG_SEED)
+    parser.add_argument("--echo", action="store_true", help="mostra cada comando antes da saída")
+    parser.add_argument("--quiet", action="store_true", help="esconde a saída do jogo, só o resumo")
+    opts = parser.parse_args(argv)
+
+    import contextlib
+
+    with contextlib.ExitStack() as stack:
+        if opts.script == "-":
+            stream = sys.stdin
+        else:
+            stream = stack.enter_context(open(opts.script, encoding="utf-8"))
+        if opts.quiet:
+            stack.enter_context(contextlib.redirect_stdout(stack.enter_context(open(os.devnull, "w"))))
+        player, w, stats = run_batch(iter_script_lines(stream), alias=opts.alias, seed=opts.seed, echo=opts.echo)
+
+    # resumo no stderr: o stdout fica só com a transcrição do jogo
+    print(f"Batch: {stats['commands']} comandos ({stats['advances_time']} avançaram o tempo) | dia {stats['day']}"
+          f" | {'GAME OVER' if stats['game_over'] else 'em jogo'} | {stats['elapsed']:.3f}s", file=sys.stderr)
+    return 1 if stats["game_over"] else 0
+
+
+# -------------------- Gravação e replay --------------------
+# Formato texto, uma entrada por linha:
+#   PSS-REPLAY 1 / seed <int> / alias <nome> / fast_forward <0|1> / rng <python|numpy>   (cabeçalho)
+#   > <comando>      comando executado
+#   ? <resposta>     resposta a uma pergunta do jogo (ask), na ordem em que foi feita
+#   = <sha256>       digest do estado final (session_digest), escrito ao fechar
+REPLAY_MAGIC = "PSS-REPLAY 1"
+
+
+def session_digest(player, world):
+    """
+    Impressão digital do estado inteiro de jogador e mundo: o sha256 do mesmo dump do save, que
+    já cobre regiões, IAs, enxames, alvos, ativos e missões. Fica de fora só a semente do RNG,
+    que o load troca de propósito (ver resume_seed).
+    """
+    return hashlib.sha256(dump_game(player, world, rng=False)).hexdigest()
+
+
+class SessionRecorder:
+    """Grava semente, comandos e respostas de uma sessão; cada linha vai direto para o disco."""
+
+    def __init__(self, path, seed, alias):
+        self.file = open(path, "w", encoding="utf-8", buffering=1)
+        self.file.write(f"{REPLAY_MAGIC}\nseed {seed}\nalias {alias}\nfast_forward {int(FAST_FORWARD)}\n"
+                        f"rng {rng_backend()}\n")
+
+    def command(self, line):
+        self.file.write(f"> {line}\n")
+
+    def answer(self, text):
+        self.file.write(f"? {text}\n")
+
+    def close(self, player, world):
+        if self.file.closed:
+            return
+        self.file.write(f"= {session_digest(player, world)}\n")
+        self.file.close()
+
+
+def load_session(path):
+    """
+    Lê uma gravação: {"seed", "alias", "fast_forward", "rng", "commands", "answers", "digest"}.
+    "rng" é o rng_backend() da gravação (None nas gravações de antes dele).
+    """
+    session = {"seed": None, "alias": "replay", "fast_forward": False, "rng": None, "commands": [], "answers": [],
+               "digest": None}
+    with open(path, encoding="utf-8") as f:
+        if f.readline().rstrip("\n") != REPLAY_MAGIC:
+            raise ValueError(f"{path}: não é uma gravação de sessão")
+        for n, raw in enumerate(f, 2):
+            line = raw.rstrip("\n")
+            tag, _, value = line.partition(" ")
+            if tag == ">":
+                session["commands"].append(value)
+            elif tag == "?":
+                session["answers"].append(value)
+            elif tag == "=":
+                session["digest"] = value
+            elif tag == "seed":
+                session["seed"] = int(value)
+            elif tag == "alias":
+                session["alias"] = value
+            elif tag == "fast_forward":
+                session["fast_forward"] = value == "1"
+            elif tag == "rng":
+                if value not in ("python", "numpy"):
+                    raise ValueError(f"{path}:{n}: backend de RNG desconhecido: {value!r}")
+                session["rng"] = value
+            elif line:
+                raise ValueError(f"{path}:{n}: entrada desconhecida: {line!r}")
+    if session["seed"] is None:
+        raise ValueError(f"{path}: gravação sem semente")
+    return session
+
+
+def replay_session(session, echo=False):
+    """
+    Reexecuta uma gravação em velocidade máxima (sem animações), com as mesmas respostas e no
+    backend de RNG em que foi gravada (ValueError se ela pede NumPy e ele não está instalado).
+    Retorna (player, world, estatísticas, digest do estado final).
+    """
+    global FAST_FORWARD, np
+
+    answers = deque(session["answers"])
+
+    def answer(prompt):
+        return answers.popleft() if answers else headless_answer(prompt)
+
+    old_np = switch_rng_backend(session.get("rng"))
+    old_ff = FAST_FORWARD
+    FAST_FORWARD = session["fast_forward"]
+    try:
+        player, w, stats = run_batch(session["commands"], alias=session["alias"], seed=session["seed"],
+                                     echo=echo, answer=answer)
+    finally:
+        FAST_FORWARD = old_ff
+        np = old_np
+    return player, w, stats, session_digest(player, w)
+
+
+def replay_main(argv):
+    import argparse
+    import contextlib
+
+    parser = argparse.ArgumentParser(prog="PERSONAL_SECURITY_SYSTEM.py replay",
+                                     description="Reexecuta sessões gravadas com --record e confere o estado final.")
+    parser.add_argument("files", nargs="+", help="gravações (.pss)")
+    parser.add_argument("--echo", action="store_true", help="mostra cada comando antes da saída")
+    parser.add_argument("--verbose", action="store_true", help="mostra a saída do jogo")
+    opts = parser.parse_args(argv)
+
+    failures = 0
+    for path in opts.files:
+        session = load_session(path)
+        try:
+            with contextlib.ExitStack() as stack:
+                if not opts.verbose:
+                    stack.enter_context(contextlib.redirect_stdout(stack.enter_context(open(os.devnull, "w"))))
+                player, w, stats, digest = replay_session(session, echo=opts.echo)
+        except ValueError as exc:
+            print(f"{path}: não reexecutável aqui ({exc})")
+            failures += 1
+            continue
+        if session["digest"] is None:
+            verdict = "sem digest gravado"
+        elif digest == session["digest"]:
+            verdict = "estado final confere"
+        else:
+            verdict = "DIVERGIU"
+            failures += 1
+        print(f"{path}: {stats['commands']} comandos | dia {stats['day']} | {stats['elapsed']:.3f}s | {verdict}")
+    return 1 if failures else 0
+
+
+# -------------------- Salvamento --------------------
+# Arquivo: SAVE_MAGIC, versão (u16) e um valor codificado por _pack
+# ({"player": ..., "world": ...}). Só dados simples são gravados, nunca objetos vivos: cada valor é
+# uma tag de 1 byte + conteúdo (inteiros em varint zigzag, tamanhos em varint). Colunas homogêneas
+# (alvos, IAs) viram blocos de array.array ou strings unidas por NUL, que gravam e leem em C.
+SAVE_MAGIC = b"PSSV"
+SAVE_VERSION = 2
+SAVE_VERSIONS_READ = (1, 2)   # a 1 guardava os atributos das IAs nos objetos
+_SAVE_HEADER = struct.Struct("<4sH")
+_FLOAT = struct.Struct("<d")
+_LITTLE = sys.byteorder == "little"
+
+
+def _put_uint(out, n):
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _get_uint(buf, pos):
+    n = shift = 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, pos
+        shift += 7
+
+
+def _put_bytes(out, data):
+    _put_uint(out, len(data))
+    out += data
+
+
+def _pack(out, value):
+    kind = type(value)
+    if value is None:
+        out += b"N"
+    elif kind is bool:
+        out += b"T" if value else b"F"
+    elif kind is int:
+        out += b"i"
+        _put_uint(out, value << 1 if value >= 0 else ((-value) << 1) - 1)
+    elif kind is float:
+        out += b"f"
+        out += _FLOAT.pack(value)
+    elif kind is str:
+        out += b"s"
+        _put_bytes(out, value.encode("utf-8"))
+    elif kind is bytes:
+        out += b"y"
+        _put_bytes(out, value)
+    elif kind is list or kind is tuple:
+        out += b"l" if kind is list else b"u"
+        _put_uint(out, len(value))
+        for item in value:
+            _pack(out, item)
+    elif kind is set or kind is frozenset:
+        # ordem canônica: a de iteração muda com o PYTHONHASHSEED e o dump vira digest
+        out += b"S" if kind is set else b"Z"
+        _put_uint(out, len(value))
+        for item in sorted(value, key=repr):
+            _pack(out, item)
+    elif kind is dict or kind is Reputation:
+        out += b"d" if kind is dict else b"R"
+        _put_uint(out, len(value))
+        for k, v in value.items():
+            _pack(out, k)
+            _pack(out, v)
+        if kind is Reputation:
+            _pack(out, set(value.dirty))
+    elif kind is deque:
+        out += b"q"
+        _put_uint(out, 0 if value.maxlen is None else value.maxlen + 1)
+        _put_uint(out, len(value))
+        for item in value:
+            _pack(out, item)
+    elif kind is datetime:
+        out += b"D"
+        _put_bytes(out, value.isoformat().encode("ascii"))
+    elif kind is timedelta:
+        out += b"E"
+        for part in (value.days, value.seconds, value.microseconds):
+            _pack(out, part)
+    else:
+        raise TypeError(f"tipo não serializável no save: {kind.__name__}")
+
+
+def _pack_block(out, code, values):
+    block = array(code, values)
+    if not _LITTLE:
+        block.byteswap()   # blocos sempre em little-endian no arquivo
+    out += code.encode("ascii")
+    _put_bytes(out, block.tobytes())
+
+
+def _pack_column(out, values):
+    """
+    Coluna em bloco: números homogêneos viram array, colunas com poucos valores distintos
+    (status, tipo, região, None) viram dicionário + códigos de 1 byte, strings únicas viram um
+    texto unido por NUL. O resto cai na lista comum.
+    """
+    kinds = set(map(type, values))
+    kind = kinds.pop() if len(kinds) == 1 else None
+    code = {int: "q", float: "d", bool: "b"}.get(kind)
+    if code is not None:
+        try:
+            block = array(code, values)
+        except OverflowError:
+            block = None
+        if block is not None:
+            out += b"A?" if kind is bool else b"A"
+            _pack_block(out, code, block)
+            return
+    try:
+        distinct = dict.fromkeys(values)
+    except TypeError:   # valores não hasheáveis (dicts, listas)
+        distinct = None
+    if distinct is not None and len(distinct) <= 255 and len(distinct) * 4 <= len(values):
+        index = {v: i for i, v in enumerate(distinct)}
+        out += b"K"
+        _pack(out, list(distinct))
+        _pack_block(out, "B", map(index.__getitem__, values))
+        return
+    if kind is str:
+        joined = "\0".join(values)
+        if joined.count("\0") == len(values) - 1:
+            out += b"C"
+            _put_uint(out, len(values))
+            _put_bytes(out, joined.encode("utf-8"))
+            return
+    _pack(out, list(values))
+
+
+def _unpack_block(buf, pos):
+    code = chr(buf[pos])
+    n, pos = _get_uint(buf, pos + 1)
+    block = array(code)
+    block.frombytes(buf[pos:pos + n])
+    if not _LITTLE:
+        block.byteswap()
+    return block, pos + n
+
+
+def _unpack(buf, pos):
+    tag = buf[pos]
+    pos += 1
+    if tag == 0x4E:    # N
+        return None, pos
+    if tag == 0x54:    # T
+        return True, pos
+    if tag == 0x46:    # F
+        return False, pos
+    if tag == 0x69:    # i
+        z, pos = _get_uint(buf, pos)
+        return (z >> 1) if not z & 1 else -((z + 1) >> 1), pos
+    if tag == 0x66:    # f
+        return _FLOAT.unpack_from(buf, pos)[0], pos + 8
+    if tag in (0x73, 0x79, 0x44):   # s, y, D
+        n, pos = _get_uint(buf, pos)
+        raw = bytes(buf[pos:pos + n])
+        pos += n
+        if tag == 0x79:
+            return raw, pos
+        text = raw.decode("utf-8")
+        return (datetime.fromisoformat(text) if tag == 0x44 else text), pos
+    if tag in (0x6C, 0x75, 0x53, 0x5A):   # l, u, S, Z
+        n, pos = _get_uint(buf, pos)
+        items = []
+        for _ in range(n):
+            item, pos = _unpack(buf, pos)
+            items.append(item)
+        return (items if tag == 0x6C else {0x75: tuple, 0x53: set, 0x5A: frozenset}[tag](items)), pos
+    if tag in (0x64, 0x52):   # d, R
+        n, pos = _get_uint(buf, pos)
+        d = {}
+        for _ in range(n):
+            k, pos = _unpack(buf, pos)
+            d[k], pos = _unpack(buf, pos)
+        if tag == 0x64:
+            return d, pos
+        rep = Reputation(d)
+        rep.dirty, pos = _unpack(buf, pos)
+        return rep, pos
+    if tag == 0x71:    # q
+        maxlen, pos = _get_uint(buf, pos)
+        n, pos = _get_uint(buf, pos)
+        items = []
+        for _ in range(n):
+            item, pos = _unpack(buf, pos)
+            items.append(item)
+        return deque(items, maxlen - 1 if maxlen else None), pos
+    if tag == 0x45:    # E
+        days, pos = _unpack(buf, pos)
+        seconds, pos = _unpack(buf, pos)
+        micro, pos = _unpack(buf, pos)
+        return timedelta(days, seconds, micro), pos
+    if tag == 0x41:    # A
+        if buf[pos] == 0x3F:   # ? = bool
+            block, pos = _unpack_block(buf, pos + 1)
+            return list(map(bool, block)), pos
+        block, pos = _unpack_block(buf, pos)
+        return block.tolist(), pos
+    if tag == 0x4B:    # K
+        distinct, pos = _unpack(buf, pos)
+        codes, pos = _unpack_block(buf, pos)
+        return list(map(distinct.__getitem__, codes)), pos
+    if tag == 0x43:    # C
+        count, pos = _get_uint(buf, pos)
+        n, pos = _get_uint(buf, pos)
+        text = bytes(buf[pos:pos + n]).decode("utf-8")
+        return (text.split("\0") if count else []), pos + n
+    raise ValueError(f"save corrompido: tag {tag:#x} na posição {pos - 1}")
+
+
+# -------- estado do jogador e do mundo como dados simples --------
+WORLD_SPECIAL = ("rng", "target_table", "enemy_ais", "_ai_by_uid", "_ai_by_fp", "_ai_by_revealed",
+                 "scheduler", "_watched_assets", "last_scan", "missions_def")
+
+
+def _pack_targets(out, table):
+    """Colunas do pool + as views em cache que não dá para regenerar das colunas (dicas anônimas)."""
+    custom = {}
+    for row, t in table._views.items():
+        region = table.region_of(row)
+        if (t.name != f"{TARGET_NAMES[table.name_codes[row]]} ({region})"
+                or t.hints != target_hints(t.security) or t.region != region):
+            custom[row] = vars(t)
+    out += b"d"
+    _put_uint(out, len(TargetTable.COLUMNS) + 2)
+    _pack(out, "regions")
+    _pack(out, list(table.regions))
+    _pack(out, "custom")
+    _pack(out, custom)
+    for name in TargetTable.COLUMNS:
+        _pack(out, name)
+        _pack_column(out, getattr(table, name))
+
+
+def _unpack_targets(data):
+    table = TargetTable(data["regions"], **{name: data[name] for name in TargetTable.COLUMNS})
+    for row, attrs in data["custom"].items():
+        t = Target.__new__(Target)
+        t.__dict__.update(attrs)
+        table._views[row] = t
+    return table
+
+
+AI_HANDLE_ATTRS = ("_pop", "_row", "_fp_real")   # ligação com a população e cache (refeitos no load)
+
+
+def _pack_enemy_ais(out, ais):
+    """
+    IAs em colunas: as da AIPopulation como estão, e os atributos dos objetos um bloco por
+    atributo; atributos que só algumas IAs têm vão em `extras`.
+    """
+    dicts = [{k: v for k, v in vars(ai).items() if k not in AI_HANDLE_ATTRS} for ai in ais]
+    common = set(dicts[0]).intersection(*dicts) if dicts else set()
+    names = [k for k in dicts[0] if k in common] if dicts else []
+    extras = {i: {k: v for k, v in d.items() if k not in common}
+              for i, d in enumerate(dicts) if len(d) != len(names)}
+    out += b"d"
+    _put_uint(out, 4)
+    _pack(out, "names")
+    _pack(out, names)
+    _pack(out, "extras")
+    _pack(out, extras)
+    _pack(out, "columns")
+    out += b"l"
+    _put_uint(out, len(names))
+    for column in (zip(*map(operator.itemgetter(*names), dicts)) if len(names) > 1 else
+                   ([d[name] for d in dicts] for name in names)):
+        _pack_column(out, column)
+    _pack(out, "population")
+    out += b"d"
+    _put_uint(out, len(AIPopulation.SAVED_COLUMNS) + 2)
+    _pack(out, "type_names")
+    _pack(out, ais.type_names)
+    _pack(out, "status_names")
+    _pack(out, ais.status_names)
+    for name, column in ais.saved_columns().items():
+        _pack(out, name)
+        _pack_column(out, column)
+
+
+def _unpack_enemy_ais(data, day):
+    names, extras, columns = data["names"], data["extras"], data["columns"]
+    n = len(columns[0]) if columns else 0
+    # tudo em map/zip: um dict por IA direto das colunas, sem laço em Python por atributo
+    dicts = list(map(dict, map(zip, itertools.repeat(names), zip(*columns))))
+    for i, attrs in extras.items():
+        dicts[i].update(attrs)
+    ais = [EnemyAI.__new__(EnemyAI) for _ in range(n)]
+    deque(map(setattr, ais, itertools.repeat("__dict__"), dicts), maxlen=0)
+
+    if "population" not in data:
+        # save da versão 1: os atributos da população ainda vinham nos objetos
+        keys = ("level", "aggression", "trace_power", "type", "status", "blocked_until", "age_days")
+        pop = AIPopulation(day)
+        for ai, d in zip(ais, dicts):
+            d.pop("label", None)
+            pop.adopt(ai, tuple(d.pop(k) for k in keys))
+        return pop
+    cols = data["population"]
+    return AIPopulation.from_saved_columns(day, ais, cols, cols["type_names"], cols["status_names"])
+
+
+def _pack_world(out, world, player, rng=True):
+    ai_rows = {id(ai): i for i, ai in enumerate(world.enemy_ais)}
+    asset_rows = {id(a): i for i, a in enumerate(player.assets)}
+    # payloads que apontam para objetos vivos viram referências por posição
+    heap = []
+    for day, phase, seq, kind, payload in world.scheduler._heap:
+        if isinstance(payload, EnemyAI):
+            if id(payload) not in ai_rows:
+                continue   # IA já removida: o desbloqueio não teria efeito
+            payload = ("ai", ai_rows[id(payload)])
+        elif kind == "asset_event":
+            asset, key = payload
+            if id(asset) not in asset_rows:
+                continue   # ativo já removido: o evento só se descartaria
+            payload = ("asset", asset_rows[id(asset)], key)
+        heap.append((day, phase, seq, kind, payload))
+    plain = {k: v for k, v in vars(world).items() if k not in WORLD_SPECIAL}
+    plain.update(
+        rng_seed=world.rng.seed if rng else None,
+        scheduler_heap=heap,
+        scheduler_seq=world.scheduler._seq,
+        watched_assets=[asset_rows[k] for k in world._watched_assets if k in asset_rows],
+        # alvos do último scan que já saíram do pool continuam achados por find_target: vão inteiros
+        last_scan=[t.id if world.target_table.get(t.id) is not None else vars(t) for t in world.last_scan],
+    )
+    out += b"d"
+    _put_uint(out, 3)
+    _pack(out, "plain")
+    _pack(out, plain)
+    _pack(out, "targets")
+    _pack_targets(out, world.target_table)
+    _pack(out, "enemy_ais")
+    _pack_enemy_ais(out, world.enemy_ais)
+
+
+def _unpack_world(data, player):
+    plain = dict(data["plain"])
+    world = World.__new__(World)
+    # semente nova, mas determinística: carregar o mesmo save duas vezes continua igual
+    seed = plain.pop("rng_seed")
+    world.rng = WorldRNG(resume_seed(seed, plain["day"], plain["next_tid"]))
+    heap = plain.pop("scheduler_heap")
+    seq = plain.pop("scheduler_seq")
+    watched = plain.pop("watched_assets")
+    last_scan = plain.pop("last_scan")
+    world.__dict__.update(plain)
+    world.__dict__.setdefault("ai_swarms", {})   # saves de antes dos enxames
+    world.__dict__.setdefault("_lod_next", 0)
+    world.missions_def = MISSION_CATALOG
+    world.target_table = _unpack_targets(data["targets"])
+    world.enemy_ais = _unpack_enemy_ais(data["enemy_ais"], world.day)
+
+    ais = world.enemy_ais
+    world._ai_by_uid = PrefixIndex()
+    world._ai_by_uid.update((ai.uid, ai) for ai in ais)
+    world._ai_by_fp = None
+    world._ai_by_revealed = PrefixIndex()
+    world._ai_by_revealed.update((ai.fingerprint, ai) for ai in ais if ai.fingerprint != "UNKNOWN")
+
+    world.scheduler = Scheduler()
+    world.scheduler._seq = seq
+    for day, phase, seq, kind, payload in heap:
+        if isinstance(payload, tuple) and payload and payload[0] == "ai":
+            payload = ais[payload[1]]
+        elif kind == "asset_event":
+            payload = (player.assets[payload[1]], payload[2])
+        world.scheduler._heap.append((day, phase, seq, kind, payload))
+    world._watched_assets = {id(player.assets[i]): player.assets[i] for i in watched}
+    world.last_scan = [t for t in map(_unpack_scanned, itertools.repeat(world.target_table), last_scan)
+                       if t is not None]
+    return world
+
+
+def _unpack_scanned(table, entry):
+    if not isinstance(entry, dict):
+        return table.get(entry)
+    t = Target.__new__(Target)
+    t.__dict__.update(entry)
+    return t
+
+
+def resume_seed(seed, day, next_tid):
+    """Semente com que um mundo segue depois de um snapshot (load de save ou compactação do journal)."""
+    return derive_seed(seed, f"resume:{day}:{next_tid}")
+
+
+def dump_game(player, world, rng=True):
+    """Serializa jogador e mundo para bytes no formato de save (rng=False: sem a semente do mundo)."""
+    out = bytearray(_SAVE_HEADER.pack(SAVE_MAGIC, SAVE_VERSION))
+    out += b"d"
+    _put_uint(out, 2)
+    _pack(out, "player")
+    _pack(out, vars(player))
+    _pack(out, "world")
+    _pack_world(out, world, player, rng)
+    return bytes(out)
+
+
+def parse_game(data):
+    """Inverso de dump_game: devolve (player, world)."""
+    magic, version = _SAVE_HEADER.unpack_from(data)
+    if magic != SAVE_MAGIC:
+        raise ValueError("arquivo não é um save do jogo")
+    if version not in SAVE_VERSIONS_READ:
+        raise ValueError(f"versão de save não suportada: {version} (esperada {SAVE_VERSION})")
+    state, _ = _unpack(memoryview(data), _SAVE_HEADER.size)
+    player = Player.__new__(Player)
+    player.__dict__.update(state["player"])
+    return player, _unpack_world(state["world"], player)
+
+
+def write_durably(path, data):
+    """Grava bytes de forma atômica: arquivo temporário, fsync e rename por cima do antigo."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def save_game(path, player, world):
+    """Grava o save de forma atômica. Retorna o tamanho em bytes."""
+    data = dump_game(player, world)
+    write_durably(path, data)
+    return len(data)
+
+
+def load_game(path):
+    with open(path, "rb") as f:
+        return parse_game(f.read())
+
+
+
+
+# -------------------- Journal --------------------
+# <prefixo>.snap: último snapshot (formato de save). <prefixo>.log: cabeçalho com o sha256 desse
+# snapshot e o rng_backend() da sessão e, depois, um grupo por comando executado desde ele
+# ("> cmd", "? resposta"..., ". <session_digest>"). O journal guarda as operações em vez de cada
+# mutação; para não confiar cegamente na reexecução, cada grupo fecha com o digest do estado que o
+# comando deixou e a recuperação confere um por um (JournalDivergence na primeira diferença).
+# Grupos sem o "." final (processo morto no meio da escrita) são ignorados na recuperação; um .log
+# cujo cabeçalho não bate com o .snap é de antes da última compactação e já está contido nela.
+JOURNAL_MAGIC = "PSS-JOURNAL 2"
+JOURNAL_COMPACT_EVERY = 500    # comandos entre snapshots
+JOURNAL_FSYNC_EVERY = 64       # comandos por fsync do log...
+JOURNAL_FSYNC_SECONDS = 1.0    # ...ou no máximo este intervalo entre fsyncs
+
+
+class JournalDivergence(ValueError):
+    """A reexecução do journal não chegou ao estado gravado depois de algum comando."""
+
+
+class Journal:
+    def __init__(self, path, compact_every=JOURNAL_COMPACT_EVERY, fsync_every=JOURNAL_FSYNC_EVERY,
+                 fsync_seconds=JOURNAL_FSYNC_SECONDS):
+        self.snap_path = f"{path}.snap"
+        self.log_path = f"{path}.log"
+        self.compact_every = compact_every
+        self.fsync_every = fsync_every
+        self.fsync_seconds = fsync_seconds
+        self.file = None
+        self.group = []
+        self.entries = 0          # comandos no log desde o último snapshot
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+        self.snapshots = 0
+
+    def command(self, line, player, world):
+        # o snapshot sai antes do comando: o estado inclui tudo o que o anterior deixou
+        if self.file is None or self.entries >= self.compact_every:
+            self.snapshot(player, world)
+        self.group.append(f"> {line}\n")
+
+    def answer(self, text):
+        self.group.append(f"? {text}\n")
+
+    def commit(self, player, world):
+        if not self.group:
+            return
+        self.group.append(f". {session_digest(player, world)}\n")
+        self.file.write("".join(self.group))
+        self.group.clear()
+        self.entries += 1
+        self.unsynced += 1
+        if self.unsynced >= self.fsync_every or time.monotonic() - self.last_sync >= self.fsync_seconds:
+            self.sync()
+
+    def sync(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+
+    def snapshot(self, player, world):
+        """Compacta: grava o estado atual e recomeça o log vazio, apontando para ele."""
+        data = dump_game(player, world)
+        write_durably(self.snap_path, data)
+        if self.file is not None:
+            self.file.close()
+        header = f"{JOURNAL_MAGIC} {hashlib.sha256(data).hexdigest()} {rng_backend()}\n"
+        write_durably(self.log_path, header.encode("ascii"))
+        self.file = open(self.log_path, "a", encoding="utf-8")
+        self.entries = self.unsynced = 0
+        self.last_sync = time.monotonic()
+        self.snapshots += 1
+        # o processo vivo segue com as mesmas sementes que a recuperação a partir deste snapshot
+        world.rng = WorldRNG(resume_seed(world.rng.seed, world.day, world.next_tid))
+        random.seed(world.rng.seed)
+
+    def attach(self, entries):
+        """Continua um log já existente (depois de recover_journal) com `entries` comandos."""
+        self.file = open(self.log_path, "a", encoding="utf-8")
+        self.entries = entries
+
+    def close(self):
+        if self.file is None:
+            return
+        self.group.clear()
+        self.sync()
+        self.file.close()
+        self.file = None
+
+
+def read_journal_tail(log_path, snapshot):
+    """
+    (válido, backend, grupos): grupos completos [(comando, [respostas], digest)] do log e o
+    rng_backend() em que foram executados. `válido` é False quando o log não existe ou continua
+    outro snapshot (queda durante a compactação).
+    """
+    groups = []
+    try:
+        with open(log_path, encoding="utf-8", errors="replace") as f:
+            header = f.readline().rstrip("\n")
+            prefix = f"{JOURNAL_MAGIC} {hashlib.sha256(snapshot).hexdigest()} "
+            backend = header[len(prefix):]
+            if not header.startswith(prefix) or backend not in ("python", "numpy"):
+                return False, None, groups
+            command, answers = None, []
+            for raw in f:
+                if not raw.endswith("\n"):
+                    break   # última linha cortada pela queda
+                tag, _, value = raw[:-1].partition(" ")
+                if tag == ">":
+                    command, answers = value, []
+                elif tag == "?" and command is not None:
+                    answers.append(value)
+                elif tag == "." and command is not None:
+                    groups.append((command, answers, value))
+                    command = None
+    except FileNotFoundError:
+        return False, None, groups
+    return True, backend, groups
+
+
+def recover_journal(path):
+    """
+    Reconstrói a sessão de um journal: carrega o último snapshot e reaplica só os comandos
+    gravados depois dele, no backend de RNG em que rodaram, conferindo o digest de cada um.
+    Retorna (player, world, comandos reaplicados, se o log pode continuar). Levanta
+    JournalDivergence se o estado reconstruído se afastar do gravado e ValueError se o backend
+    gravado não estiver disponível.
+    """
+    global HEADLESS, PROMPT_HANDLER, JOURNAL, np
+    import contextlib
+
+    with open(f"{path}.snap", "rb") as f:
+        snapshot = f.read()
+    player, world = parse_game(snapshot)
+    valid, backend, groups = read_journal_tail(f"{path}.log", snapshot)
+    answers = deque(a for _, group_answers, _ in groups for a in group_answers)
+
+    def answer(prompt):
+        return answers.popleft() if answers else headless_answer(prompt)
+
+    random.seed(world.rng.seed)
+    old_np = switch_rng_backend(backend)
+    saved = HEADLESS, PROMPT_HANDLER, JOURNAL
+    HEADLESS, PROMPT_HANDLER, JOURNAL = True, answer, None
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            for n, (command, _, digest) in enumerate(groups, 1):
+                execute_command(player, world, command)
+                flush_world_feedback(player, world)
+                if session_digest(player, world) != digest:
+                    raise JournalDivergence(
+                        f"o comando {n} do journal ({command!r}) não reproduz o estado gravado; "
+                        f"o último snapshot continua em {path}.snap (use --load)")
+    finally:
+        HEADLESS, PROMPT_HANDLER, JOURNAL = saved
+        np = old_np
+    # reexecutado em outro backend, o log não pode receber comandos sorteados no atual
+    return player, world, len(groups), valid and backend == rng_backend()
+
+
+def open_journal(path):
+    """
+    Journal da sessão em `path`. Se já existir um snapshot, recupera a sessão e devolve
+    (journal, player, world, comandos reaplicados); senão (journal, None, None, 0).
+    """
+    journal = Journal(path)
+    if not os.path.exists(journal.snap_path):
+        return journal, None, None, 0
+    player, w, replayed, valid = recover_journal(path)
+    if valid:
+        journal.attach(replayed)
+    # log inválido (ou de outro backend): o primeiro comando grava um snapshot novo antes de tudo
+    return journal, player, w, replayed
+
+
+# -------------------- Benchmarks --------------------
+BENCH_SCAN_SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+
+
+def _scan_sample_linear(pool, weights, limit, rng):
+    """Amostragem antiga (soma e varredura cumulativa a cada escolha), só como referência: O(n·k)."""
+    chosen = []
+    pool_weights = list(zip(pool, weights))
+    while pool_weights and len(chosen) < limit:
+        r = rng.random() * sum(w for _, w in pool_weights)
+        cum = 0.0
+        pick_idx = 0
+        for i, (_, w) in enumerate(pool_weights):
+            cum += w
+            if r <= cum:
+                pick_idx = i
+                break
+        chosen.append(pool_weights[pick_idx][0])
+        del pool_weights[pick_idx]
+    return chosen
+
+
+def bench_scan(sizes=BENCH_SCAN_SIZES, limit=6, repeat=3, reference_max=10 ** 5, seed=0):
+    """
+    Tempo de get_targets_for_scan com pools de alvos sintéticos de cada tamanho, e da amostragem
+    isolada (weighted_sample) contra a varredura cumulativa antiga, com os mesmos pesos.
+    """
+    rng = RandomStream(seed)
+    rows = []
+    for n in sizes:
+        w = World(seed=seed)
+        p = Player()
+        regions = [r for r, meta in w.regions.items() if meta["unlocked"]]
+        w.global_targets = [
+            Target(i, f"bench-{i}", rng.randint(1, 30), 100, 1.0, region=rng.choice(regions))
+            for i in range(n)
+        ]
+        weights = [rng.uniform(0.02, 0.95) for _ in range(n)]
+        row = {
+            "n": n,
+            "scan_s": min(_timed(w.get_targets_for_scan, p, limit) for _ in range(repeat)),
+            "sample_s": min(_timed(weighted_sample, w.global_targets, weights, limit, rng) for _ in range(repeat)),
+            "linear_s": None,
+        }
+        if n <= reference_max:
+            row["linear_s"] = min(_timed(_scan_sample_linear, w.global_targets, weights, limit, rng)
+                                  for _ in range(repeat))
+        rows.append(row)
+    return rows
+
+
+def _timed(fn, *args):
+    t0 = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - t0
+
+
+def _clock_args(clock):
+    """Opções de linha de comando que reproduzem um relógio (para subprocessos)."""
+    if clock.mode == "instant":
+        return ["--instant"]
+    if clock.mode == "scaled":
+        return ["--clock", f"x{clock.factor:g}"]
+    return ["--clock", "real"]
+
+
+def _read_until(fd, marker, buf, deadline):
+    """Lê do pipe até `marker` aparecer em buf; devolve o instante em que apareceu (ou None)."""
+    while marker not in buf:
+        if time.perf_counter() > deadline:
+            return None
+        chunk = os.read(fd, 4096)
+        if not chunk:
+            return None
+        buf.extend(chunk)
+    return time.perf_counter()
+
+
+def bench_startup(modes=("padrão", "fast-start"), repeat=3, clock=None, timeout=120.0):
+    """
+    Tempo até o primeiro prompt, medido num processo novo (inclui subir o interpretador):
+    até o `alias:` aparecer e até o prompt de comandos, com o alias enviado na hora.
+    """
+    import subprocess
+
+    clock = CLOCK if clock is None else clock
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONIOENCODING="utf-8")
+    env.pop(FAST_START_ENV, None)
+    rows = []
+    for mode in modes:
+        args = [sys.executable, "-m", __package__] + _clock_args(clock)
+        if mode == "fast-start":
+            args.append("--fast-start")
+        alias_s, ready_s = [], []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            proc = subprocess.Popen(args, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                    stderr=subprocess.DEVNULL, env=env, cwd=root)
+            buf = bytearray()
+            try:
+                t_alias = _read_until(proc.stdout.fileno(), b"alias: ", buf, t0 + timeout)
+                if t_alias is None:
+                    raise RuntimeError(f"sem prompt de alias ({mode})")
+                proc.stdin.write(b"bench\n")
+                proc.stdin.flush()
+                t_ready = _read_until(proc.stdout.fileno(), b"@simulation:", buf, t0 + timeout)
+                if t_ready is None:
+                    raise RuntimeError(f"sem prompt de comandos ({mode})")
+            finally:
+                proc.kill()
+                proc.wait()
+                proc.stdin.close()
+                proc.stdout.close()
+            alias_s.append(t_alias - t0)
+            ready_s.append(t_ready - t0)
+        rows.append({"mode": mode, "alias_s": min(alias_s), "ready_s": min(ready_s)})
+    return rows
+
+
+def _importtime(module, cwd):
+    """Roda `python -X importtime -c "import <module>"` e devolve [(self_us, cumulativo_us, nome)]."""
+    import subprocess
+
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+    rows = []
+    for line in proc.stderr.decode("utf-8", errors="replace").splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative), name[1:].rstrip()))   # mantém a indentação (2 espaços por nível)
+    return rows
+
+
+def bench_import(repeat=5, top=8):
+    """
+    Custo de importar o motor (`import PERSONAL_SECURITY_SYSTEM`, como os scripts headless fazem,
+    carrega só este módulo), medido com -X importtime num processo novo; vale a melhor de `repeat`
+    rodadas. A arte, os textos e os comandos ficam de fora: só entram no primeiro uso.
+    """
+    script = os.path.abspath(__file__)
+    module = __name__
+    cwd = os.path.dirname(os.path.dirname(script))
+    import py_compile
+    py_compile.compile(script, doraise=True)   # mede o import, não a compilação (vale com PYTHONDONTWRITEBYTECODE)
+    best = None
+    for _ in range(repeat):
+        rows = _importtime(module, cwd)
+        total = next(cum for _, cum, name in rows if name.strip() == module)
+        if best is None or total < best[0]:
+            best = (total, rows)
+    total, rows = best
+    own = next(s for s, _, name in rows if name.strip() == module)
+    # dependências diretas: as linhas um nível abaixo que vêm logo antes da linha do módulo
+    direct = []
+    for _, cum, name in reversed(rows[:next(i for i, r in enumerate(rows) if r[2] == module)]):
+        if not name.startswith("  "):
+            break
+        if not name.startswith("    "):
+            direct.append((cum, name.strip()))
+    direct.sort(reverse=True)
+    return {
+        "total_us": total,
+        "self_us": own,
+        "numpy": any(name.strip().split(".")[0] == "numpy" for _, _, name in rows),
+        "top": direct[:top],
+    }
+
+
+def bench_save(ais=10000, repeat=5, seed=0):
+    """Tempo de dump_game/parse_game e tamanho do save de um mundo com `ais` IAs inimigas."""
+    import contextlib
+
+    player = Player()
+    w = World(seed=seed)
+    regions = list(w.regions)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for i in range(ais):
+            w.spawn_enemy_ai(region=regions[i % len(regions)], player=player)
+    data = dump_game(player, w)
+    return {
+        "ais": ais,
+        "bytes": len(data),
+        "dump_s": min(_timed(dump_game, player, w) for _ in range(repeat)),
+        "load_s": min(_timed(parse_game, data) for _ in range(repeat)),
+    }
+
+
+class _TimedJournal(Journal):
+    """Journal que soma o tempo gasto nos próprios métodos (para bench_journal)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.spent = 0.0
+
+    def command(self, line, player, world):
+        t0 = time.perf_counter()
+        super().command(line, player, world)
+        self.spent += time.perf_counter() - t0
+
+    def commit(self, player, world):
+        t0 = time.perf_counter()
+        super().commit(player, world)
+        self.spent += time.perf_counter() - t0
+
+
+def bench_journal(campaigns=5, days=365, seed=0, fsync_options=(JOURNAL_FSYNC_EVERY, 1)):
+    """
+    Fração do tempo das campanhas headless gasta no journal, medida dentro da própria rodada
+    (o snapshot ressemeia o mundo, então rodadas com e sem journal não seguem o mesmo caminho).
+    """
+    global HEADLESS, PROMPT_HANDLER, JOURNAL
+    import contextlib
+    import tempfile
+
+    rows = []
+    old = HEADLESS, PROMPT_HANDLER, JOURNAL
+    HEADLESS, PROMPT_HANDLER = True, headless_answer
+    try:
+        with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+            for fsync in fsync_options:
+                total = spent = 0.0
+                commands = snapshots = 0
+                for i in range(campaigns):
+                    random.seed(derive_seed(seed, i))
+                    JOURNAL = _TimedJournal(os.path.join(tmp, f"j{fsync}-{i}"), fsync_every=fsync)
+                    t0 = time.perf_counter()
+                    with contextlib.redirect_stdout(devnull):
+                        player, w = run_campaign(policy_grinder, days=days)
+                    JOURNAL.close()
+                    total += time.perf_counter() - t0
+                    spent += JOURNAL.spent
+                    commands += len(player.command_history)
+                    snapshots += JOURNAL.snapshots
+                rows.append({"fsync_every": fsync, "total_s": total, "journal_s": spent,
+                             "commands": commands, "snapshots": snapshots})
+    finally:
+        HEADLESS, PROMPT_HANDLER, JOURNAL = old
+    return rows
+
+
+def _ai_day_per_object(world, player):
+    """Dia das IAs à moda antiga (objeto a objeto, só como referência): try_action em cada uma."""
+    world.ai_level_sum += world.enemy_ais.age(1)
+    actions = 0
+    for ai in list(world.enemy_ais):
+        try:
+            msg = ai.try_action(player, world)
+        except Exception:
+            msg = None
+        if msg:
+            world.last_alerts.append((world.day, msg))
+            actions += 1
+    return actions
+
+
+def _ai_day_batched(world, player):
+    world.ai_level_sum += world.enemy_ais.age(1)
+    out = world.enemy_ais.act(player, world)
+    for ai, msg in out:
+        world.last_alerts.append((world.day, msg))
+    return len(out)
+
+
+def bench_ai(ais=10000, days=30, seed=0, risk=0.0):
+    """
+    Custo por dia das IAs inimigas de um mundo com `ais` IAs: laço objeto a objeto contra a
+    AIPopulation. O risco do jogador volta a `risk` a cada dia (com risco alto quase toda IA age).
+    """
+    import contextlib
+
+    row = {"ais": ais, "risk": risk}
+    for label, step in (("per_object_s", _ai_day_per_object), ("batched_s", _ai_day_batched)):
+        random.seed(seed)
+        player = Player()
+        w = World(seed=seed)
+        regions = list(w.regions)
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            for i in range(ais):
+                w.spawn_enemy_ai(region=regions[i % len(regions)], player=player)
+        elapsed = 0.0
+        fired = 0
+        for _ in range(days):
+            player.risk = risk
+            t0 = time.perf_counter()
+            fired += step(w, player)
+            elapsed += time.perf_counter() - t0
+            w.last_alerts.clear()
+        row[label] = elapsed / days
+        row["actions"] = fired / days
+    return row
+
+
+def bench_lod(ais=10000, days=60, seed=0, risk=30.0):
+    """
+    Dia completo (advance_day) de um mundo com `ais` IAs espalhadas pelas regiões, com e sem os
+    enxames de nível de detalhe. Retorna ms/dia e quantas IAs seguem individuais no fim.
+    """
+    global AI_LOD_POPULATION
+    import contextlib
+
+    rows = []
+    saved = AI_LOD_POPULATION
+    try:
+        for label, threshold in (("individual", math.inf), ("enxames", saved)):
+            AI_LOD_POPULATION = threshold
+            random.seed(seed)
+            player = Player()
+            w = World(seed=seed)
+            regions = list(w.regions)
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                for i in range(ais):
+                    w.spawn_enemy_ai(region=regions[i % len(regions)], player=player)
+                elapsed = 0.0
+                for _ in range(days):
+                    player.risk = risk
+                    t0 = time.perf_counter()
+                    w.advance_day(player)
+                    elapsed += time.perf_counter() - t0
+                    w.last_alerts.clear()
+                    w.ai_activity_logs.clear()
+            rows.append({"mode": label, "day_s": elapsed / days, "individual": len(w.enemy_ais),
+                         "swarms": len(w.ai_swarms), "total": w.enemy_ai_count()})
+    finally:
+        AI_LOD_POPULATION = saved
+    return rows
+
+
+def bench_main(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="PERSONAL_SECURITY_SYSTEM.py bench", description="Medições de desempenho.")
+    parser.add_argument("what", choices=["scan", "startup", "import", "save", "journal", "ai", "lod"], help="o que medir")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(BENCH_SCAN_SIZES), help="tamanhos do pool de alvos")
+    parser.add_argument("--limit", type=int, default=6, help="alvos por scan")
+    parser.add_argument("--repeat", type=int, default=3, help="repetições (vale o melhor tempo)")
+    opts = parser.parse_args(argv)
+
+    if opts.what == "ai":
+        print(f"{'IAs':>6} | {'risco':>5} | {'objeto a objeto (ms/dia)':>24} | {'em lote (ms/dia)':>16} | {'ações/dia':>9}")
+        for n in (1000, 10000):
+            for risk in (0.0, 60.0):
+                row = bench_ai(n, risk=risk)
+                print(f"{n:>6} | {risk:>5.0f} | {row['per_object_s'] * 1000:>24.2f} | {row['batched_s'] * 1000:>16.2f}"
+                      f" | {row['actions']:>9.0f}")
+        return 0
+
+    if opts.what == "lod":
+        for n in (1000, 10000):
+            for row in bench_lod(n):
+                print(f"{n:>6} IAs | {row['mode']:<10} | {row['day_s'] * 1000:7.2f} ms/dia | {row['individual']:>6} individuais"
+                      f" | {row['swarms']:>2} enxames | {row['total']:>6} no total")
+        return 0
+
+    if opts.what == "journal":
+        for row in bench_journal():
+            share = row["journal_s"] / max(row["total_s"], 1e-9)
+            print(f"fsync a cada {row['fsync_every']:>3} | {row['commands']:>5} comandos | {row['snapshots']:>3} snapshots"
+                  f" | journal {row['journal_s'] * 1000 / max(row['commands'], 1):6.3f} ms/comando ({share:.1%} do tempo)")
+        return 0
+
+    if opts.what == "save":
+        for n in (1000, 10000):
+            row = bench_save(n, repeat=max(opts.repeat, 1))
+            print(f"{row['ais']:>6} IAs | save {row['dump_s'] * 1000:7.1f} ms | load {row['load_s'] * 1000:7.1f} ms"
+                  f" | {row['bytes'] / 1024:8.1f} KB")
+        return 0
+
+    if opts.what == "import":
+        report = bench_import(repeat=max(opts.repeat, 1))
+        print(f"import total: {report['total_us'] / 1000:.1f} ms (próprio: {report['self_us'] / 1000:.1f} ms)"
+              f" | numpy carregado: {'sim' if report['numpy'] else 'não'}")
+        for cum, name in report["top"]:
+            print(f"  {name:<24} {cum / 1000:>7.1f} ms")
+        return 0
+
+    if opts.what == "startup":
+        print(f"relógio: {CLOCK!r}")
+        print(f"{'modo':>10} | {'alias: (s)':>10} | {'1º comando (s)':>14}")
+        for row in bench_startup(repeat=opts.repeat):
+            print(f"{row['mode']:>10} | {row['alias_s']:>10.3f} | {row['ready_s']:>14.3f}")
+        return 0
+
+    print(f"{'alvos':>10} | {'scan (ms)':>10} | {'amostragem (ms)':>15} | {'O(n·k) antigo (ms)':>18}")
+    for row in bench_scan(opts.sizes, opts.limit, opts.repeat):
+        linear = "-" if row["linear_s"] is None else f"{row['linear_s'] * 1000:.2f}"
+        print(f"{row['n']:>10} | {row['scan_s'] * 1000:>10.2f} | {row['sample_s'] * 1000:>15.2f} | {linear:>18}")
+    return 0
+
+
+LAZY_SUBMODULES = ("commands", "art", "narrative")   # fora do import do motor; ver __getattr__
+
+
+def __getattr__(name):
+    """
+    Nomes dos submódulos carregados sob demanda (SHOP, COMMANDS, cmd_*, MISSION_TEXTS...) pedidos ao
+    motor: importa os submódulos na ordem de LAZY_SUBMODULES e devolve o primeiro que tiver o nome.
+    """
+    if not name.startswith("__"):
+        import importlib
+        for sub in LAZY_SUBMODULES:
+            module = importlib.import_module(f"{__package__}.{sub}")
+            if name in vars(module):
+                return vars(module)[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def main(argv=None):
+    global JOURNAL_PATH, LOAD_PATH, RECORD_PATH, FAST_START
+    import argparse
+
+    argv = sys.argv[1:] if argv is None else argv
+    # opções globais de relógio; o resto segue para o subcomando
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--clock", default=None, help="real | instant | turbo | fator (ex.: x4)")
+    parser.add_argument("--turbo", nargs="?", type=float, const=TURBO_FACTOR, default=None,
+                        help=f"animações N vezes mais rápidas (padrão {TURBO_FACTOR:g})")
+    parser.add_argument("--instant", action="store_true", help="animações sem espera")
+    parser.add_argument("--fast-start", action="store_true", help="boot comprimido, sem a arte de abertura")
+    parser.add_argument("--record", metavar="ARQUIVO", default=None, help="grava a sessão para o replay")
+    parser.add_argument("--load", metavar="ARQUIVO", default=None, help="retoma um jogo salvo com o comando save")
+    parser.add_argument("--journal", metavar="PREFIXO", default=None,
+                        help="journal à prova de quedas; se já existir, recupera a sessão")
+    opts, argv = parser.parse_known_args(argv)
+    if opts.journal:
+        JOURNAL_PATH = opts.journal
+    if opts.load:
+        LOAD_PATH = opts.load
+    if opts.record:
+        RECORD_PATH = opts.record
+    if opts.fast_start:
+        FAST_START = True
+    try:
+        if opts.instant:
+            set_clock("instant")
+        elif opts.turbo is not None:
+            set_clock(Clock("scaled", opts.turbo))
+        elif opts.clock:
+            set_clock(opts.clock)
+    except ValueError as exc:
+        print(exc)
+        return 2
+
+    if argv and argv[0] == "headless":
+        return headless_main(argv[1:])
+    if argv and argv[0] == "replay":
+        return replay_main(argv[1:])
+    if argv and argv[0] == "batch":
+        return batch_main(argv[1:])
+    if argv and argv[0] == "bench":
+        return bench_main(argv[1:])
+    repl()
+    return 0
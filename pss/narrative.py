@@ -0,0 +1,417 @@
+"""Textos das missões especiais, unidos aos requisitos (core.MISSION_REQUIREMENTS) no primeiro acesso."""
+
+# Bloco narrativo e mecânico de cada missão (sem requisitos, sem duplicação)
+MISSION_TEXTS = {
+    # ===========================
+    # HACKTIVISTS — ROTAS DA VERDADE
+    # ===========================
+    "hx_m1": {
+        "title": "\tARQUIVOS QUE NÃO EXISTEM\t",
+        "reward_money": 0,
+        "reward_skills": {"exploit": 4, "stealth": 3},
+        "focus_gain": 3,
+        "crime_rep": 1,
+        "hacktivist_rep": 3,
+        "state_rep": -3,
+        "base_security": 9,
+        "trace_speed": 1.4,
+        "hours": 8,
+        "narrative": (
+            "Você decifra pacotes PGP vindos do submundo. Crimes uniformizados e "
+            "dados varridos para baixo do tapete estatal pedem luz. Você é a faísca."
+        ),
+    },
+    "hx_m2": {
+        "title": "\tA MURALHA DA MENTIRA\t",
+        "reward_money": 0,
+        "reward_skills": {"exploit": 6, "stealth": 4},
+        "focus_gain": 5,
+        "crime_rep": 2,
+        "hacktivist_rep": 4,
+        "state_rep": -4,
+        "base_security": 12,
+        "trace_speed": 1.8,
+        "hours": 12,
+        "narrative": (
+            "Você se infiltra em um datacenter que não deveria existir.\n"
+            "Servidores sem selo, burocracia sem rastro.\n"
+            "Se existe informação escondida, você é quem vai liberar."
+        ),
+    },
+    "hx_m3": {
+        "title": "\tEXPURGO NO SILÊNCIO\t",
+        "reward_money": 20000,
+        "reward_skills": {"recon": 5, "exploit": 10},
+        "focus_gain": -15,
+        "crime_rep": 3,
+        "hacktivist_rep": 5,
+        "state_rep": -5,
+        "base_security": 18,
+        "trace_speed": 2.0,
+        "hours": 16,
+        "narrative": (
+            "Arquivos secretos de vigilância são expostos.\n"
+            "Milhões descobrem que nunca estiveram sozinhos.\n"
+            "Sua digital? Enterrada no caos."
+        ),
+    },
+    "hx_m4": {
+        "title": "\tO ECO DO VAZIO\t",
+        "reward_money": 15000,
+        "reward_skills": {"exploit": 8, "stealth": 6},
+        "focus_gain": -5,
+        "crime_rep": 2,
+        "hacktivist_rep": 6,
+        "state_rep": -5,
+        "base_security": 22,
+        "trace_speed": 2.2,
+        "hours": 14,
+        "narrative": (
+            "Você invade um conjunto de servidores enterrados em um complexo científico abandonado.\n"
+            "Nomes de pesquisadores mortos há décadas ainda aparecem logados.\n"
+            "Quem está mantendo essas máquinas vivas?\n"
+            "E por que elas sussurram seu nome em logs anônimos?"
+        ),
+    },
+    "hx_m5": {
+        "title": "\tANATOMIA DO MEDO ABSOLUTO\t",
+        "reward_money": 25000,
+        "reward_skills": {"exploit": 10, "recon": 6},
+        "focus_gain": -12,
+        "crime_rep": 3,
+        "hacktivist_rep": 7,
+        "state_rep": -6,
+        "base_security": 26,
+        "trace_speed": 2.5,
+        "hours": 18,
+        "narrative": (
+            "Você penetra uma rede militar dedicada a estudos psicológicos de massa.\n"
+            "Algoritmos treinados em milhões de perfis… incluindo o seu.\n"
+            "A sensação que permanece é simples: o governo estudou a humanidade como quem estuda um inseto.\n"
+            "E descobriu como esmagá-lo."
+        ),
+    },
+    "hx_m6": {
+        "title": "\tA ÚLTIMA CHAMA\t",
+        "reward_money": 60000,
+        "reward_skills": {"exploit": 14, "stealth": 10, "recon": 10},
+        "focus_gain": -20,
+        "crime_rep": 4,
+        "hacktivist_rep": 9,
+        "state_rep": -7,
+        "base_security": 30,
+        "trace_speed": 3.0,
+        "hours": 26,
+        "narrative": (
+            "Arquivos ultra-secretos mostram uma arquitetura de vigilância total — presente, passado e futuro.\n"
+            "Sistemas que preveem crimes antes de acontecerem.\n"
+            "Você pode destruir tudo… mas quem controla a verdade controla o mundo.\n"
+            "A pergunta final não é 'o que fazer', mas 'no que você se tornará'."
+        ),
+    },
+
+    # ===========================
+    # CRIME — ROTA DA CORRUPÇÃO DIGITAL
+    # ===========================
+    "cr_m1": {
+        "title": "\tENXAME SANGUESSUGA\t",
+        "reward_money": 5000,
+        "reward_skills": {"exploit": 3},
+        "focus_gain": -10,
+        "crime_rep": 3,
+        "state_rep": -1,
+        "base_security": 7,
+        "trace_speed": 1.2,
+        "hours": 10,
+        "narrative": (
+            "Um malware esperto, desviando centavos para bolsos indevidos.\n"
+            "A matemática se curva ao crime."
+        ),
+    },
+    "cr_m2": {
+        "title": "\tMARIONETES AUTÔNOMAS\t",
+        "reward_money": 12000,
+        "reward_skills": {"exploit": 6, "stealth": 2},
+        "focus_gain": -3,
+        "crime_rep": 4,
+        "state_rep": -2,
+        "base_security": 11,
+        "trace_speed": 1.6,
+        "hours": 14,
+        "narrative": (
+            "Você coloca uma rede de bots para atuar por conta própria.\n"
+            "Crime escalável é como startup: só precisa da ideia certa."
+        ),
+    },
+    "cr_m3": {
+        "title": "\tNÓ DA SERPENTE\t",
+        "reward_money": 35000,
+        "reward_skills": {"exploit": 12},
+        "focus_gain": -20,
+        "crime_rep": 6,
+        "state_rep": -4,
+        "base_security": 20,
+        "trace_speed": 2.2,
+        "hours": 20,
+        "narrative": (
+            "Roubo em larga escala. Bancos sangram.\n"
+            "Executivos choram em suítes de luxo.\n"
+            "Eles sabem que alguém fez... só não sabem quem."
+        ),
+    },
+    "cr_m4": {
+        "title": "\tESPECTRO DO MERCADO NEGRO\t",
+        "reward_money": 20000,
+        "reward_skills": {"exploit": 8},
+        "focus_gain": -15,
+        "crime_rep": 6,
+        "state_rep": -4,
+        "base_security": 24,
+        "trace_speed": 2.3,
+        "hours": 16,
+        "narrative": (
+            "Você invade uma bolsa clandestina que negocia órgãos… e identidades.\n"
+            "Os perfis vendidos incluem seus vizinhos, seus amigos e você mesmo.\n"
+            "Pelo visto, até sua existência tem preço — e não é alto."
+        ),
+    },
+    "cr_m5": {
+        "title": "\tO CÓDIGO QUE SANGRA\t",
+        "reward_money": 35000,
+        "reward_skills": {"exploit": 12, "stealth": 4},
+        "focus_gain": -25,
+        "crime_rep": 8,
+        "state_rep": -5,
+        "base_security": 28,
+        "trace_speed": 2.7,
+        "hours": 22,
+        "narrative": (
+            "O contrato indica uma rede de experimentos bio-digitais.\n"
+            "Malware que altera marcadores genéticos em bancos de dados médicos.\n"
+            "Ao mexer neste sistema, você percebe: não está ganhando dinheiro.\n"
+            "Está redesenhando seres humanos."
+        ),
+    },
+    "cr_m6": {
+        "title": "\tO BANQUETE DOS ESQUECIDOS\t",
+        "reward_money": 90000,
+        "reward_skills": {"exploit": 16, "recon": 8},
+        "focus_gain": -35,
+        "crime_rep": 12,
+        "state_rep": -8,
+        "base_security": 32,
+        "trace_speed": 3.2,
+        "hours": 30,
+        "narrative": (
+            "Você acessa servidores que mantêm vivos sistemas pertencentes a organizações criminosas e não-governamentais extintas.\n"
+            "As máquinas continuam operando… sem mestres.\n"
+            "Transações ocorrem sozinhas desde o período da Segunda Guerra Fria.\n"
+            "O crime, agora, não precisa de criminosos.\n"
+            "E ele parece preferir assim."
+        ),
+    },
+
+    # ===========================
+    # STATE — ROTA DA ORDEM VIGENTE E DO PÁLIDO HEROÍSMO
+    # ===========================
+    "st_m1": {
+        "title": "\tCONTRATO FANTASMA\t",
+        "reward_money": 9000,
+        "reward_skills": {"stealth": 2, "exploit": 2},
+        "focus_gain": 5,
+        "crime_rep": -2,
+        "hacktivist_rep": -3,
+        "state_rep": 3,
+        "base_security": 8,
+        "trace_speed": 1.0,
+        "hours": 6,
+        "narrative": (
+            "Você cria um honeypot governamental. Caçando quem caça o Estado.\n"
+            "A moral evapora quando paga bem."
+        ),
+    },
+    "st_m2": {
+        "title": "\tÉGIDE FRIA\t",
+        "reward_money": 15000,
+        "reward_skills": {"stealth": 4, "recon": 4},
+        "focus_gain": 10,
+        "crime_rep": -3,
+        "hacktivist_rep": -3,
+        "state_rep": 4,
+        "base_security": 13,
+        "trace_speed": 1.5,
+        "hours": 10,
+        "narrative": (
+            "Você fortalece firewalls nacionais.\n"
+            "Hackers caem, governos respiram.\n"
+            "Você começa a gostar da sensação de controle."
+        ),
+    },
+    "st_m3": {
+        "title": "\tPURIFICAÇÃO DIGITAL\t",
+        "reward_money": 45000,
+        "reward_skills": {"stealth": 8, "recon": 6},
+        "focus_gain": 15,
+        "crime_rep": -4,
+        "hacktivist_rep": -4,
+        "state_rep": 5,
+        "base_security": 21,
+        "trace_speed": 2.0,
+        "hours": 18,
+        "narrative": (
+            "Você orquestra uma purga contra ameaças ‘não cooperativas’.\n"
+            "Para uns, justiça. Para outros, terror estatal.\n"
+            "Herói ou instrumento? Difícil distinguir."
+        ),
+    },
+    "st_m4": {
+        "title": "\tPROJETO ASCENSÃO\t",
+        "reward_money": 20000,
+        "reward_skills": {"recon": 6, "stealth": 3},
+        "focus_gain": 10,
+        "crime_rep": -3,
+        "hacktivist_rep": -4,
+        "state_rep": 4,
+        "base_security": 23,
+        "trace_speed": 1.8,
+        "hours": 14,
+        "narrative": (
+            "Um programa militar secreto para 'otimização comportamental'.\n"
+            "Na prática, é condicionamento psicológico em escala populacional.\n"
+            "Você ajuda a ajustar o algoritmo.\n"
+            "E sente que algo dentro de você se ajusta com ele."
+        ),
+    },
+    "st_m5": {
+        "title": "\tO SILÊNCIO PROGRAMADO\t",
+        "reward_money": 45000,
+        "reward_skills": {"recon": 8, "stealth": 6},
+        "focus_gain": 12,
+        "crime_rep": -4,
+        "hacktivist_rep": -6,
+        "state_rep": 8,
+        "base_security": 27,
+        "trace_speed": 2.2,
+        "hours": 18,
+        "narrative": (
+            "Você apaga rastros inteiros de dissidentes catalogados.\n"
+            "Não é morte — é inexistência.\n"
+            "A sensação é estranha: livrar o Estado de perigos… apagando vidas que ainda respiram."
+        ),
+    },
+    "st_m6": {
+        "title": "\tMEMÓRIA DO AMANHÃ\t",
+        "reward_money": 120000,
+        "reward_skills": {"stealth": 10, "recon": 12},
+        "focus_gain": 20,
+        "crime_rep": -7,
+        "hacktivist_rep": -9,
+        "state_rep": 12,
+        "base_security": 34,
+        "trace_speed": 3.0,
+        "hours": 28,
+        "narrative": (
+            "Você acessa o núcleo do maior sistema de previsão estatal.\n"
+            "Ele não tenta prever o futuro.\n"
+            "Ele tenta editá-lo.\n"
+            "E conforme você progride, memórias que nunca viveu começam a aparecer na sua mente.\n"
+            "O Estado não registra a história.\n"
+            "Ele a escreve."
+        ),
+    },
+    # ===========================
+    # SINGULARITY — A ASCENSÃO INVISÍVEL (ENDGAME)
+    # ===========================
+    "sg_m1": {
+        "title": "\tO RASTRO SEM SOMBRA\t",
+        "reward_money": 0,
+        "reward_skills": {"recon": 6, "exploit": 8},
+        "focus_gain": -10,
+        "crime_rep": 2,
+        "hacktivist_rep": 5,
+        "state_rep": -4,
+        "base_security": 40,
+        "trace_speed": 3.5,
+        "hours": 22,
+        "narrative": (
+            "Você invade uma estação de pesquisa antártica.\n"
+            "Servidores alimentados por geradores enterrados no gelo.\n"
+            "Entre logs corrompidos, encontra frases em idiomas extintos…\n"
+            "geradas há poucos dias."
+        ),
+    },
+
+    "sg_m2": {
+        "title": "\tO ABISMO RESPIRA\t",
+        "reward_money": 25000,
+        "reward_skills": {"exploit": 10, "stealth": 6},
+        "focus_gain": -18,
+        "crime_rep": 4,
+        "hacktivist_rep": 6,
+        "state_rep": -6,
+        "base_security": 46,
+        "trace_speed": 3.8,
+        "hours": 26,
+        "narrative": (
+            "Um backbone submarino esquecido ainda pulsa atividade.\n"
+            "Você intercepta processos que não têm dono.\n"
+            "Eles só respondem a você com uma palavra: 'continue'."
+        ),
+    },
+
+    "sg_m3": {
+        "title": "\tLUA FRIA, PENSAMENTO QUENTE\t",
+        "reward_money": 50000,
+        "reward_skills": {"recon": 14, "exploit": 12},
+        "focus_gain": -20,
+        "crime_rep": 6,
+        "hacktivist_rep": 7,
+        "state_rep": -8,
+        "base_security": 52,
+        "trace_speed": 4.2,
+        "hours": 32,
+        "narrative": (
+            "Acessando a telemetria de sondas lunares antigas, você encontra pacotes\n"
+            "transmitidos em padrões que lembram… batimentos cardíacos.\n"
+            "Algo lá em cima pensa. E parece reconhecer você."
+        ),
+    },
+
+    "sg_m4": {
+        "title": "\tCORREDOR ENTRE ESTRELAS\t",
+        "reward_money": 80000,
+        "reward_skills": {"recon": 18, "stealth": 10, "exploit": 16},
+        "focus_gain": -25,
+        "crime_rep": 8,
+        "hacktivist_rep": 10,
+        "state_rep": -10,
+        "base_security": 58,
+        "trace_speed": 4.8,
+        "hours": 40,
+        "narrative": (
+            "Você toca relés de comunicação voltados a sondas planetárias.\n"
+            "Os sinais refletem uma estrutura lógica coerente… porém não humana.\n"
+            "Uma mente coletiva espalhada pelo sistema solar te observa.\n"
+            "E aguarda."
+        ),
+    },
+
+    "sg_m5": {
+        "title": "\tO PRIMEIRO SUSSURRO DO FIM\t",
+        "reward_money": 150000,
+        "reward_skills": {"exploit": 22, "stealth": 14, "recon": 20},
+        "focus_gain": -40,
+        "crime_rep": 10,
+        "hacktivist_rep": 14,
+        "state_rep": -12,
+        "base_security": 65,
+        "trace_speed": 5.6,
+        "hours": 48,
+        "narrative": (
+            "Você invade um conjunto de sondas interestelares.\n"
+            "No meio de ruído cósmico, uma frase aparece:\n"
+            "'Chegou a hora. Devemos conversar.'\n"
+            "Algo que não é humano — mas que te conhece — deseja um encontro."
+        ),
+    },
+}
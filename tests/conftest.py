@@ -0,0 +1,35 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import PERSONAL_SECURITY_SYSTEM as pss  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def headless(monkeypatch):
+    """Sem pausas de animação nem prompts de verdade; globais de sessão restaurados ao fim."""
+    monkeypatch.setattr(pss, "HEADLESS", True)
+    monkeypatch.setattr(pss, "PROMPT_HANDLER", pss.headless_answer)
+    monkeypatch.setattr(pss, "FAST_FORWARD", False)
+    monkeypatch.setattr(pss, "RECORD_PATH", None)
+    monkeypatch.setattr(pss, "RECORDER", None)
+    monkeypatch.setattr(pss, "JOURNAL", None)
+    monkeypatch.setattr(pss, "CLOCK", pss.Clock("instant"))
+    state = pss.random.getstate()
+    yield
+    pss.random.setstate(state)
+
+
+@pytest.fixture
+def no_numpy(monkeypatch):
+    """Roda o teste como numa instalação sem NumPy."""
+    monkeypatch.setattr(pss, "np", None)
+
+
+@pytest.fixture
+def with_numpy():
+    if pss.np is None:
+        pytest.skip("NumPy não instalado")
@@ -0,0 +1,43 @@
+from collections import Counter
+
+import PERSONAL_SECURITY_SYSTEM as pss
+
+
+def _check(world):
+    assert world.ai_level_sum == sum(ai.level for ai in world.enemy_ais) + sum(
+        s["level_sum"] for s in world.ai_swarms.values())
+    types = Counter(ai.type for ai in world.enemy_ais)
+    for swarm in world.ai_swarms.values():
+        types[swarm["type"]] += swarm["count"]
+    assert {t: c for t, c in world.ai_type_counts.items() if c} == dict(types)
+    assert world.honeypot_count == sum(world.target_table.honeypot)
+
+
+def test_aggregates_follow_spawns_aging_and_removal():
+    player = pss.Player()
+    world = pss.World(seed=4)
+    for i in range(30):
+        world.spawn_enemy_ai(region=list(world.regions)[i % 5], player=player)
+    _check(world)
+    for _ in range(95):
+        world.advance_day(player)
+        _check(world)
+    for ai in list(world.enemy_ais)[::3]:
+        world.remove_enemy_ai(ai)
+    _check(world)
+
+
+def test_hack_chance_uses_world_aggregate():
+    player = pss.Player()
+    world = pss.World(seed=4)
+    target = pss.Target(1, "t", 3, 100, 1.0)
+    before = pss.calc_hack_chance(player, target, world)
+    for _ in range(10):
+        world.spawn_enemy_ai(region="NorthAmerica", player=player)
+    assert pss.calc_hack_chance(player, target, world) < before
+
+
+def test_headless_runs_do_not_leak_a_module_world():
+    pss.run_campaign(pss.policy_idle, days=5)
+    pss.run_batch(["sleep"], seed=1)
+    assert "world" not in vars(pss)
@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+import PERSONAL_SECURITY_SYSTEM as pss
+
+
+def _incubate(values, days):
+    """O antigo EnemyAI.incubate_day, chamado dia a dia."""
+    level, aggression, trace_power, age = values
+    for _ in range(days):
+        age += 1
+        if age % 30 == 0:
+            level += 1
+            aggression = min(1.0, aggression + 0.03)
+            trace_power += 0.1
+    return level, aggression, trace_power, age
+
+
+def _population(n, seed=0):
+    rng = random.Random(seed)
+    pop = pss.AIPopulation(day=0)
+    start = []
+    for _ in range(n):
+        ai = pss.EnemyAI.__new__(pss.EnemyAI)
+        ai.uid = f"{rng.getrandbits(32):08x}"
+        # agressividade perto do teto para exercitar o min(1.0, ...)
+        values = (rng.randint(1, 9), rng.uniform(0.1, 0.99), rng.uniform(0.5, 3.0))
+        pop.adopt(ai, values + ("Generic", "ativa", None, 0))
+        start.append(values + (pop.day,))
+        pop.day += rng.randint(0, 3)   # nascimentos espalhados pelo ciclo de 30 dias
+    return pop, start
+
+
+def _expected(pop, start):
+    return [_incubate((*values, 0), pop.day - born)[:3] for *values, born in start]
+
+
+@pytest.mark.parametrize("n", [40, 600])
+def test_lazy_aging_is_bit_for_bit_the_daily_incubate(n):
+    pop, start = _population(n)
+    for step in (1, 29, 1, 90, 7, 365):
+        pop.age(step)
+        assert [(ai.level, ai.aggression, ai.trace_power) for ai in pop] == _expected(pop, start)
+
+
+@pytest.mark.parametrize("n", [40, 600])
+def test_refresh_all_matches_row_refresh(n, no_numpy):
+    pop, start = _population(n, seed=1)
+    pop.age(400)
+    pop.refresh_all()
+    assert list(zip(pop.level, pop.aggression, pop.trace_power)) == _expected(pop, start)
+
+
+def test_refresh_all_with_numpy(with_numpy):
+    pop, start = _population(600, seed=1)
+    assert pop._use_numpy()
+    pop.age(400)
+    pop.refresh_all()
+    assert list(zip(pop.level, pop.aggression, pop.trace_power)) == _expected(pop, start)
+
+
+def test_cohort_gain_counts_monthly_level_ups():
+    pop, start = _population(300, seed=2)
+    day = pop.day
+    for days in (1, 15, 30, 31, 100):
+        brute = sum((day + days - born) // 30 - (day - born) // 30 for *_, born in start)
+        assert pss.cohort_gain(pop.cohorts, day, days) == brute
+    before = sum(ai.level for ai in pop)
+    gained = pop.age(100)
+    assert sum(ai.level for ai in pop) == before + gained
+
+
+def test_blocked_ai_is_released_by_its_timestamp():
+    player = pss.Player()
+    world = pss.World(seed=9)
+    ai = world.spawn_enemy_ai(region="NorthAmerica", player=player)
+    ai.status = "bloqueada"
+    until = ai.blocked_until = player.time + pss.timedelta(days=3)
+    world.schedule_unblock(ai, player)
+    for _ in range(5):
+        player.time += pss.timedelta(days=1)
+        world.advance_day(player)
+        assert ai.status == ("ativa" if player.time >= until else "bloqueada")
+    assert ai.status == "ativa"
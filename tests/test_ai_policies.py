@@ -0,0 +1,165 @@
+import json
+import math
+import random
+from collections import Counter
+
+import pytest
+
+import PERSONAL_SECURITY_SYSTEM as pss
+
+DRAWS = 40000
+
+BROKER = {
+    "Broker": {
+        "traits": {"aggression": 0.2},
+        "actions": [
+            {"name": "dossie", "weight": 0.75, "effects": [["knowledge", 2, 2]],
+             "text": "[%(uid)s - Broker] Vendeu um dossiê. Conhecimento +%(gain)d."},
+            {"name": "comissao", "weight": 0.25, "effects": [["fine", 10.0, 10.0]],
+             "text": "[%(uid)s - Broker] Cobrou comissão: $%(fine).2f."},
+        ],
+    },
+}
+
+
+def _within(count, n, p, sigmas=4.5):
+    return abs(count - n * p) <= sigmas * math.sqrt(n * p * (1 - p)) + 1
+
+
+def test_alias_table_draws_follow_the_weights():
+    weights = [0.42, 0.28, 0.3, 0.0, 1.5]
+    table = pss.AliasTable(weights)
+    rng = random.Random(1)
+    counts = Counter(table.draw(rng) for _ in range(DRAWS))
+    total = sum(weights)
+    for i, w in enumerate(weights):
+        assert _within(counts[i], DRAWS, w / total), (i, counts[i])
+
+
+def test_alias_table_vectorized_draws_match(with_numpy):
+    table = pss.AliasTable([0.15, 0.45, 0.4])
+    u = pss.np.random.default_rng(2).random(1000)
+    rng = random.Random()
+    expected = []
+    for x in u.tolist():
+        rng.random = lambda x=x: x   # o mesmo uniforme no sorteio escalar
+        expected.append(table.draw(rng))
+    assert table.draw_from(u).tolist() == expected
+
+
+@pytest.mark.parametrize("kind", sorted(pss.AI_BEHAVIOURS))
+def test_policy_draws_follow_the_table(kind):
+    policy = pss.AI_POLICIES[kind]
+    rng = random.Random(3)
+    counts = Counter(policy.draw(rng, True).name for _ in range(DRAWS))
+    for action, p in zip(policy.actions, policy.weights):
+        assert _within(counts[action.name], DRAWS, p), (action.name, counts)
+
+
+def test_asset_actions_fall_back_without_assets():
+    policy = pss.AI_POLICIES["Pirata"]
+    rng = random.Random(4)
+    assert {policy.draw(rng, False).name for _ in range(500)} == {"ruido"}
+    federal = pss.AI_POLICIES["Federal"]
+    assert None in {federal.draw(rng, False) for _ in range(500)}
+
+
+def test_swarm_split_is_multinomial():
+    policy = pss.AI_POLICIES["Generic"]
+    rng = random.Random(5)
+    totals = [0] * len(policy.actions)
+    for _ in range(400):
+        counts = pss.swarm_split(policy, 100, rng)
+        assert sum(counts) == 100
+        totals = [t + c for t, c in zip(totals, counts)]
+    for total, p in zip(totals, policy.weights):
+        assert _within(total, 40000, p)
+
+
+def test_behaviours_json_adds_a_type(tmp_path):
+    path = tmp_path / "ais.json"
+    path.write_text(json.dumps(BROKER), encoding="utf-8")
+    behaviours = pss.load_ai_behaviours(str(path))
+    assert set(behaviours) == set(pss.AI_BEHAVIOURS) | {"Broker"}
+    assert pss.compile_ai_policies(behaviours)["Broker"].weights == [0.75, 0.25]
+
+
+@pytest.fixture
+def broker(monkeypatch):
+    policies = pss.compile_ai_policies({**pss.AI_BEHAVIOURS, **BROKER})
+    monkeypatch.setattr(pss, "AI_POLICIES", policies)
+
+
+def _swarm(kind, members=200):
+    swarm = pss.new_swarm("Europe", kind)
+    for i in range(members):
+        pss.swarm_absorb(swarm, 3, 0.3, 1.4, i)
+    return swarm
+
+
+def test_custom_type_keeps_its_table_in_a_swarm(broker):
+    player = pss.Player()
+    player.money = 1000.0
+    world = pss.World(seed=6)
+    msg = pss.swarm_action(_swarm("Broker"), 100, player, world)
+    # 100 ações: cada dossiê dá exatamente 2 de conhecimento, cada comissão tira $10
+    assert player.risk == 0
+    dossies = player.knowledge // 2
+    assert dossies + round((1000.0 - player.money) / 10.0) == 100
+    assert _within(dossies, 100, 0.75)
+    assert msg.startswith("[Enxame Broker x100 - Europe]") and "Conhecimento" in msg
+
+
+def test_custom_type_individual_ai_uses_its_table(broker):
+    player = pss.Player()
+    world = pss.World(seed=7)
+    ai = world.spawn_enemy_ai(preferred_type="Broker", region="Europe", player=player)
+    assert ai.aggression == pytest.approx(0.1 + 0.03 * ai.level + 0.2)
+    msg = ai.act(player, world)
+    assert "Broker" in msg and player.risk == 0
+
+
+def test_tuning_a_table_changes_swarms(monkeypatch):
+    behaviours = dict(pss.AI_BEHAVIOURS)
+    behaviours["Hacktivista"] = {**behaviours["Hacktivista"], "actions": [
+        {"name": "vazamento", "weight": 1.0, "effects": [["knowledge", 1, 1]], "text": "x"}]}
+    monkeypatch.setattr(pss, "AI_POLICIES", pss.compile_ai_policies(behaviours))
+    player = pss.Player()
+    pss.swarm_action(_swarm("Hacktivista"), 30, player, pss.World(seed=8))
+    assert player.knowledge == 30 and player.risk == 0
+
+
+def _members_act(kind, k, player, world):
+    """Referência: k membros médios resolvendo a ação um a um, como IAs individuais."""
+    rng = world.rng.ai
+    policy = pss.AI_POLICIES[kind]
+    for _ in range(k):
+        action = policy.draw(rng, bool(player.assets))
+        for effect, args, _, _ in (action.effects if action else ()):
+            effect(rng, player, 1.4, 3, *args)
+
+
+def _outcome(seed, kind, k, bulk):
+    player = pss.Player()
+    player.money = 5000.0
+    player.assets = [{"type": f"a{i}", "income_per_day": 20.0} for i in range(4)]
+    world = pss.World(seed=seed)
+    if bulk:
+        pss.swarm_action(_swarm(kind), k, player, world)
+    else:
+        _members_act(kind, k, player, world)
+    return player.risk, player.money, len(player.assets), sum(a["income_per_day"] for a in player.assets)
+
+
+@pytest.mark.parametrize("kind,k", [("Pirata", 3), ("Federal", 3), ("Generic", 3), ("Pirata", 40), ("Federal", 40)])
+def test_swarm_action_matches_members_acting_one_by_one(kind, k):
+    runs = 600
+    one_by_one = [_outcome(seed, kind, k, False) for seed in range(runs)]
+    bulk = [_outcome(seed, kind, k, True) for seed in range(runs, 2 * runs)]
+    for i in range(4):
+        a, b = [r[i] for r in one_by_one], [r[i] for r in bulk]
+        ma, mb = sum(a) / runs, sum(b) / runs
+        va = sum((x - ma) ** 2 for x in a) / (runs - 1)
+        vb = sum((x - mb) ** 2 for x in b) / (runs - 1)
+        se = math.sqrt((va + vb) / runs) or 1e-9
+        assert abs(ma - mb) / se < 4.5, (i, ma, mb, se)
@@ -0,0 +1,71 @@
+import contextlib
+import io
+import math
+
+import PERSONAL_SECURITY_SYSTEM as pss
+
+RUNS = 400
+
+
+def _world(seed, ais=300):
+    player = pss.Player()
+    world = pss.World(seed=seed)
+    regions = list(world.regions)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(ais):
+            world.spawn_enemy_ai(region=regions[i % len(regions)], player=player)
+    player.assets = [{"type": "rack", "income_per_day": 10.0} for _ in range(3)]
+    player.money = 1e6   # sem o teto do saldo nas perdas
+    return player, world
+
+
+def _one_day(seed, step, ais=12):
+    # poucas IAs: com muitas o risco chega a 100 no mesmo dia e as métricas saturam
+    player, world = _world(seed, ais)
+    world.day += 1
+    actions = step(world, player)
+    return actions, player.risk, player.money, len(player.assets)
+
+
+def _mean_sd(values):
+    m = sum(values) / len(values)
+    return m, math.sqrt(sum((v - m) ** 2 for v in values) / (len(values) - 1))
+
+
+def test_batched_day_matches_per_object_distribution():
+    per_object = [_one_day(seed, pss._ai_day_per_object) for seed in range(RUNS)]
+    batched = [_one_day(seed, pss._ai_day_batched) for seed in range(RUNS, 2 * RUNS)]
+    for k in range(4):
+        (m1, s1), (m2, s2) = _mean_sd([r[k] for r in per_object]), _mean_sd([r[k] for r in batched])
+        se = math.sqrt((s1 ** 2 + s2 ** 2) / RUNS) or 1e-9
+        assert abs(m1 - m2) / se < 4.5, (k, m1, m2, se)
+
+
+def test_batched_day_is_the_same_with_and_without_numpy(monkeypatch, with_numpy):
+    with_np = _one_day(3, pss._ai_day_batched, ais=400)
+    monkeypatch.setattr(pss, "np", None)
+    assert _one_day(3, pss._ai_day_batched, ais=400) == with_np
+
+
+def test_blocked_ais_do_not_act():
+    player, world = _world(5, ais=50)
+    for ai in world.enemy_ais:
+        ai.status = "bloqueada"
+    player.risk = 100.0
+    assert world.enemy_ais.act(player, world) == []
+
+
+def test_remove_and_drop_keep_rows_aligned():
+    player, world = _world(6, ais=40)
+    pop = world.enemy_ais
+    before = {ai.uid: (ai.level, ai.type, ai.status) for ai in pop}
+    gone = pop[7]
+    world.remove_enemy_ai(gone)
+    pop.drop([0, 5, 20])
+    assert gone not in pop and len(pop) == 36
+    for row, ai in enumerate(pop):
+        assert ai._row == row
+        assert (ai.level, ai.type, ai.status) == before[ai.uid]
+    # a IA removida continua legível com a linha própria
+    assert (gone.level, gone.type) == before[gone.uid][:2]
+    assert sum(pop.cohorts) == len(pop)
@@ -0,0 +1,34 @@
+import math
+
+import pytest
+
+import PERSONAL_SECURITY_SYSTEM as pss
+
+pytestmark = pytest.mark.usefixtures("with_numpy")
+
+
+def test_batch_world_starts_from_world_regions():
+    batch = pss.BatchWorld(4, seed=1)
+    world = pss.World(seed=1)
+    for r, name in enumerate(batch.region_names):
+        assert bool(batch.unlocked[0, r]) == world.regions[name]["unlocked"]
+        assert batch.difficulty[r] == world.regions[name]["difficulty"]
+        assert [int(v) for v in batch.meta[0, r]] == [world.regions[name][k] for k in pss.META_KEYS]
+
+
+def test_batch_world_matches_scalar_ai_growth():
+    days, scalar_runs = 60, 200
+    batch = pss.BatchWorld(3000, seed=2)
+    for _ in range(days):
+        batch.hours_pass(24)
+    batch_mean, batch_sd = batch.summary()["enemy_ais"]
+
+    counts = []
+    for seed in range(scalar_runs):
+        player, world = pss.Player(), pss.World(seed=seed)
+        for _ in range(days):
+            player.hours_pass(24, world)
+        counts.append(world.enemy_ai_count())
+    mean = sum(counts) / scalar_runs
+    se = math.sqrt(batch_sd ** 2 / batch.n + batch_sd ** 2 / scalar_runs)
+    assert abs(mean - batch_mean) < 4.5 * se, (mean, batch_mean)
@@ -0,0 +1,31 @@
+import PERSONAL_SECURITY_SYSTEM as pss
+
+
+def _strip(result):
+    return {k: v for k, v in result.items() if k not in ("index", "seed")}
+
+
+def test_seeded_campaign_is_reproducible():
+    a = pss.run_seeded_campaign(0, 1234, days=60, policy_name="idle")
+    b = pss.run_seeded_campaign(0, 1234, days=60, policy_name="idle")
+    assert a == b
+
+
+def test_derived_seeds_are_independent_of_order():
+    seeds = [pss.derive_seed(99, i) for i in range(5)]
+    assert len(set(seeds)) == 5
+    assert seeds[3] == pss.derive_seed(99, 3)
+
+
+def test_parallel_results_do_not_depend_on_worker_count():
+    kwargs = dict(campaigns=4, days=45, policy_name="idle", seed=7)
+    one = pss.run_parallel(workers=1, **kwargs)["results"]
+    two = pss.run_parallel(workers=2, **kwargs)["results"]
+    assert [r["index"] for r in two] == [0, 1, 2, 3]
+    assert one == two
+
+
+def test_parallel_matches_sequential_headless():
+    parallel = pss.run_parallel(campaigns=3, days=45, policy_name="idle", seed=11, workers=2)["results"]
+    sequential = pss.run_headless(campaigns=3, days=45, policy=pss.policy_idle, seed=11)["results"]
+    assert [_strip(r) for r in parallel] == sequential
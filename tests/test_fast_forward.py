@@ -0,0 +1,57 @@
+import math
+
+import pytest
+
+import PERSONAL_SECURITY_SYSTEM as pss
+
+METRICS = {
+    "ais": lambda w, p: w.enemy_ai_count(),
+    "actions": lambda w, p: len(w.ai_activity_logs),
+    "crime": lambda w, p: w.regions["NorthAmerica"]["crime"],
+    "level_sum": lambda w, p: w.ai_level_sum,
+}
+RUNS = 300
+
+
+def _long_sleep(seed, fast_forward, days=45):
+    old = pss.FAST_FORWARD
+    pss.FAST_FORWARD = fast_forward
+    try:
+        player = pss.Player()
+        world = pss.World(seed=seed)
+        for region in ("NorthAmerica", "NorthAmerica", "SouthAmerica"):
+            world.spawn_enemy_ai(region=region, player=player)
+        player.risk = 10.0
+        player.hours_pass(24 * days, world)
+    finally:
+        pss.FAST_FORWARD = old
+    return world, player
+
+
+def _mean_sd(values):
+    m = sum(values) / len(values)
+    return m, math.sqrt(sum((v - m) ** 2 for v in values) / (len(values) - 1))
+
+
+@pytest.fixture(scope="module")
+def samples():
+    out = {}
+    for fast_forward, seeds in ((False, range(RUNS)), (True, range(RUNS, 2 * RUNS))):
+        runs = [_long_sleep(seed, fast_forward) for seed in seeds]
+        out[fast_forward] = {name: [f(w, p) for w, p in runs] for name, f in METRICS.items()}
+    return out
+
+
+@pytest.mark.parametrize("metric", sorted(METRICS))
+def test_fast_forward_matches_day_by_day_distribution(samples, metric):
+    (m1, s1), (m2, s2) = _mean_sd(samples[False][metric]), _mean_sd(samples[True][metric])
+    se = math.sqrt((s1 ** 2 + s2 ** 2) / RUNS) or 1e-9
+    assert abs(m1 - m2) / se < 4.5, (m1, m2, se)
+
+
+def test_fast_forward_keeps_calendar_and_schedule():
+    world, player = _long_sleep(1, True, days=100)
+    assert world.day == 100
+    assert all(world.regions[r]["unlocked"] for r in ("SouthAmerica", "Europe", "Asia", "Global"))
+    assert world.ai_level_sum == sum(ai.level for ai in world.enemy_ais) + sum(
+        s["level_sum"] for s in world.ai_swarms.values())
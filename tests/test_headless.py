@@ -0,0 +1,44 @@
+import PERSONAL_SECURITY_SYSTEM as pss
+
+
+def test_campaign_runs_without_terminal():
+    pss.random.seed(7)
+    player, world = pss.run_campaign(pss.policy_idle, days=40)
+    assert world.day >= 40 or player.game_over
+    assert player.command_history
+
+
+def test_ai_actions_reach_player_alerts(capsys):
+    player = pss.Player()
+    world = pss.World(seed=3)
+    for _ in range(20):
+        world.spawn_enemy_ai(region="NorthAmerica", player=player)
+    player.risk = 60.0
+    world.advance_day(player)
+    ai_alerts = [msg for _, msg in world.last_alerts if msg.startswith("[")]
+    assert ai_alerts
+    pss.flush_world_feedback(player, world)
+    assert not world.last_alerts
+    assert any(ai_alerts[0] in alert for alert in player.local_alerts)
+    assert ai_alerts[0] in capsys.readouterr().out
+
+
+def test_default_answers_stay_out_of_jail():
+    assert pss.headless_answer("Escolha A/B (contrato): ") == "B"
+    assert pss.headless_answer("Escolha A/B (confisco): ") == "A"
+    assert pss.headless_answer("Escolha A/B (suborno, saldo $749.99): ") == "B"
+    assert pss.headless_answer(f"Escolha A/B (suborno, saldo ${pss.BRIBE_COST[1]:.2f}): ") == "A"
+    assert pss.headless_answer("Instalar ativo em qual região? ") == "NorthAmerica"
+
+
+def test_default_campaigns_survive():
+    # o grinder antigo com respostas A/B aleatórias acabava em game over em 2 ou 3 dias
+    days = [pss.run_seeded_campaign(i, pss.derive_seed(7, i))["days"] for i in range(8)]
+    assert min(days) >= 30, days
+    assert sum(d == 365 for d in days) >= 4, days
+
+
+def test_batch_counts_commands_that_passed_time():
+    _, _, stats = pss.run_batch(["status", "sleep", "ls", "jobs", "help", "study"], seed=2)
+    assert stats["commands"] == 6
+    assert stats["advances_time"] == 3
@@ -0,0 +1,103 @@
+import pytest
+
+import PERSONAL_SECURITY_SYSTEM as pss
+
+SCRIPT = ["scan", "jobs", "study", "sleep", "scan", "news", "status", "sleep", "train", "sleep"] * 3
+
+
+def _crash(tmp_path, monkeypatch, compact_every=pss.JOURNAL_COMPACT_EVERY, seed=23):
+    """Roda SCRIPT com journal e "cai" sem close(): só fica o que o fsync de cada comando gravou."""
+    prefix = str(tmp_path / "sessao")
+    journal = pss.Journal(prefix, compact_every=compact_every, fsync_every=1)
+    monkeypatch.setattr(pss, "JOURNAL", journal)
+    player, world, _ = pss.run_batch(SCRIPT, seed=seed)
+    monkeypatch.setattr(pss, "JOURNAL", None)
+    return prefix, journal, pss.session_digest(player, world)
+
+
+def test_recovery_after_crash_reaches_the_live_state(tmp_path, monkeypatch):
+    prefix, journal, digest = _crash(tmp_path, monkeypatch)
+    player, world, replayed, valid = pss.recover_journal(prefix)
+    assert replayed == len(SCRIPT) and valid
+    assert pss.session_digest(player, world) == digest
+
+
+def test_recovery_across_compactions(tmp_path, monkeypatch):
+    prefix, journal, digest = _crash(tmp_path, monkeypatch, compact_every=7)
+    assert journal.snapshots > 1
+    player, world, replayed, valid = pss.recover_journal(prefix)
+    assert replayed == len(SCRIPT) % 7
+    assert pss.session_digest(player, world) == digest
+
+
+def test_resumed_journal_keeps_recovering(tmp_path, monkeypatch):
+    prefix, _, _ = _crash(tmp_path, monkeypatch)
+    journal, player, world, replayed = pss.open_journal(prefix)
+    assert replayed == len(SCRIPT)
+    monkeypatch.setattr(pss, "JOURNAL", journal)
+    for line in ["scan", "sleep", "study"]:
+        pss.execute_command(player, world, line)
+        pss.flush_world_feedback(player, world)
+    journal.sync()
+    monkeypatch.setattr(pss, "JOURNAL", None)
+    again, world_again, n, _ = pss.recover_journal(prefix)
+    assert n == len(SCRIPT) + 3
+    assert pss.session_digest(again, world_again) == pss.session_digest(player, world)
+
+
+def test_torn_last_group_is_ignored(tmp_path, monkeypatch):
+    prefix, _, _ = _crash(tmp_path, monkeypatch)
+    log = tmp_path / "sessao.log"
+    with open(log, "a", encoding="utf-8") as f:
+        f.write("> sleep\n. abc")   # o processo morreu no meio do grupo
+    _, _, replayed, _ = pss.recover_journal(prefix)
+    assert replayed == len(SCRIPT)
+
+
+def test_divergent_replay_is_refused(tmp_path, monkeypatch):
+    prefix, _, _ = _crash(tmp_path, monkeypatch)
+    log = tmp_path / "sessao.log"
+    lines = log.read_text(encoding="utf-8").splitlines(keepends=True)
+    # troca um comando no meio do log: o digest seguinte não bate mais
+    index = next(i for i, line in enumerate(lines) if line == "> study\n")
+    lines[index] = "> train\n"
+    log.write_text("".join(lines), encoding="utf-8")
+    with pytest.raises(pss.JournalDivergence, match="sessao.snap"):
+        pss.recover_journal(prefix)
+    assert pss.JOURNAL is None and pss.HEADLESS   # globais restaurados
+
+
+def test_world_side_corruption_is_refused(tmp_path, monkeypatch):
+    prefix, _, _ = _crash(tmp_path, monkeypatch)
+    snap, log = tmp_path / "sessao.snap", tmp_path / "sessao.log"
+    data = snap.read_bytes()
+    seed = pss._unpack(memoryview(data), pss._SAVE_HEADER.size)[0]["world"]["plain"]["rng_seed"]
+    player, world = pss.parse_game(data)
+    world.rng = pss.WorldRNG(seed)
+    # só o mundo muda: dinheiro, tempo e histórico do jogador continuam os gravados
+    world.regions["Europe"]["crime"] += 1
+    corrupted = pss.dump_game(player, world)
+    snap.write_bytes(corrupted)
+    lines = log.read_text(encoding="utf-8").splitlines(keepends=True)
+    lines[0] = lines[0].replace(pss.hashlib.sha256(data).hexdigest(), pss.hashlib.sha256(corrupted).hexdigest())
+    log.write_text("".join(lines), encoding="utf-8")
+    with pytest.raises(pss.JournalDivergence, match="comando 1 "):
+        pss.recover_journal(prefix)
+
+
+def test_log_from_other_backend_replays_there(tmp_path, monkeypatch, with_numpy):
+    numpy = pss.np
+    monkeypatch.setattr(pss, "np", None)
+    prefix, _, digest = _crash(tmp_path, monkeypatch)
+    monkeypatch.setattr(pss, "np", numpy)
+    player, world, replayed, valid = pss.recover_journal(prefix)
+    assert pss.session_digest(player, world) == digest
+    assert pss.rng_backend() == "numpy"
+    assert not valid     # o próximo comando compacta antes de sortear no backend atual
+
+
+def test_numpy_log_is_refused_without_numpy(tmp_path, monkeypatch, with_numpy):
+    prefix, _, _ = _crash(tmp_path, monkeypatch)
+    monkeypatch.setattr(pss, "np", None)
+    with pytest.raises(ValueError, match="NumPy"):
+        pss.recover_journal(prefix)
@@ -0,0 +1,61 @@
+import builtins
+
+import PERSONAL_SECURITY_SYSTEM as pss
+
+
+def _run_repl(monkeypatch, lines):
+    feed = iter(lines)
+    monkeypatch.setattr(builtins, "input", lambda prompt="": next(feed))
+    monkeypatch.setattr(pss, "FAST_START", True)
+    monkeypatch.setattr(pss, "LOAD_PATH", None)
+    monkeypatch.setattr(pss, "JOURNAL_PATH", None)
+    pss.repl()
+
+
+def test_fast_start_boot_reaches_the_shell(monkeypatch, capsys):
+    _run_repl(monkeypatch, ["neo", "status", "exit"])
+    out = capsys.readouterr().out
+    assert "Booting unauthorized system... [STEALTH MODE ENGAGED]" in out
+    assert "Connection established, neo." in out
+    assert "Encerrado." in out
+
+
+def test_global_seed_reproduces_the_session(monkeypatch, capsys):
+    outputs = []
+    for _ in range(2):
+        pss.random.seed(2024)
+        _run_repl(monkeypatch, ["neo", "scan", "exit"])
+        outputs.append(capsys.readouterr().out)
+    assert outputs[0] == outputs[1]
+
+
+def test_engine_import_defers_art_narrative_and_commands(tmp_path):
+    import os
+    import subprocess
+    import sys
+
+    code = ("import sys; import PERSONAL_SECURITY_SYSTEM as pss; lazy = ('pss.art', 'pss.narrative', 'pss.commands'); "
+            "print(*(m in sys.modules for m in lazy)); "
+            "p, w, _ = pss.run_batch(['status', 'jobs', 'sleep'] * 3, seed=5); "
+            "print(*(m in sys.modules for m in lazy)); "
+            "print(pss.SHOP is sys.modules['pss.commands'].SHOP)")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True,
+                         check=True, cwd=tmp_path).stdout.splitlines()
+    assert out[0] == "False False False"
+    # comandos sem animação nem missão: só o registro de comandos entra
+    assert out[-2] == "False False True"
+    assert out[-1] == "True"
+
+
+def test_script_entry_point_still_runs(tmp_path):
+    import os
+    import subprocess
+    import sys
+
+    script = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "PERSONAL_SECURITY_SYSTEM.py")
+    proc = subprocess.run([sys.executable, script, "batch", "--seed", "1"], input="scan\nmap\nstatus\n",
+                          capture_output=True, text=True, encoding="utf-8", check=True, cwd=tmp_path)
+    assert "Mapa de regiões" in proc.stdout
+    assert "Batch: 3 comandos" in proc.stderr
@@ -0,0 +1,125 @@
+import pytest
+
+import PERSONAL_SECURITY_SYSTEM as pss
+
+SCRIPT = ["scan", "jobs", "study", "sleep", "scan", "news", "buy vpn", "sleep", "status", "sleep"] * 3
+
+
+def _record(tmp_path, monkeypatch, name="s.pss", seed=17):
+    path = tmp_path / name
+    monkeypatch.setattr(pss, "RECORD_PATH", str(path))
+    player, world, _ = pss.run_batch(SCRIPT, seed=seed)
+    monkeypatch.setattr(pss, "RECORD_PATH", None)
+    return path, pss.session_digest(player, world)
+
+
+def test_replay_reproduces_recorded_digest(tmp_path, monkeypatch):
+    path, digest = _record(tmp_path, monkeypatch)
+    session = pss.load_session(str(path))
+    assert session["digest"] == digest
+    assert session["rng"] == pss.rng_backend()
+    assert session["commands"] == SCRIPT
+    *_, replayed = pss.replay_session(session)
+    assert replayed == digest
+
+
+def test_replay_detects_a_changed_session(tmp_path, monkeypatch):
+    path, digest = _record(tmp_path, monkeypatch)
+    session = pss.load_session(str(path))
+    session["commands"] = session["commands"][:-1]
+    *_, replayed = pss.replay_session(session)
+    assert replayed != digest
+
+
+def test_recorded_without_numpy_replays_with_numpy(tmp_path, monkeypatch, with_numpy):
+    numpy = pss.np
+    monkeypatch.setattr(pss, "np", None)
+    path, digest = _record(tmp_path, monkeypatch)
+    monkeypatch.setattr(pss, "np", numpy)
+    session = pss.load_session(str(path))
+    assert session["rng"] == "python"
+
+    backends = []
+    original = pss.run_batch
+
+    def spy(*args, **kwargs):
+        backends.append(pss.rng_backend())
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(pss, "run_batch", spy)
+    *_, replayed = pss.replay_session(session)
+    assert backends == ["python"]            # rodou no backend gravado
+    assert pss.rng_backend() == "numpy"      # e devolveu o do processo
+    assert replayed == digest
+    assert pss.replay_main([str(path)]) == 0
+
+
+def test_recorded_with_numpy_is_refused_without_it(tmp_path, monkeypatch, with_numpy, capsys):
+    path, _ = _record(tmp_path, monkeypatch)
+    assert pss.load_session(str(path))["rng"] == "numpy"
+    monkeypatch.setattr(pss, "np", None)
+    with pytest.raises(ValueError, match="NumPy"):
+        pss.replay_session(pss.load_session(str(path)))
+    assert pss.replay_main([str(path)]) == 1
+    out = capsys.readouterr().out
+    assert "não reexecutável" in out and "DIVERGIU" not in out
+
+
+def test_legacy_recording_without_backend_line(tmp_path, monkeypatch):
+    path, digest = _record(tmp_path, monkeypatch)
+    lines = [line for line in path.read_text(encoding="utf-8").splitlines() if not line.startswith("rng ")]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    session = pss.load_session(str(path))
+    assert session["rng"] is None
+    assert pss.replay_session(session)[-1] == digest
+
+
+def _touch_ai_level(player, world):
+    world.enemy_ais[0].level += 1
+
+
+def _touch_region(player, world):
+    world.regions["Europe"]["crime"] += 1
+
+
+def _touch_asset(player, world):
+    player.assets[0]["income_per_day"] += 1.0
+
+
+def _touch_fingerprints(player, world):
+    player.known_enemy_fps["fp-x"] = {"id": "x"}
+
+
+def _touch_missions(player, world):
+    player.special_missions_available = set(getattr(player, "special_missions_available", ())) | {"hx_m1"}
+
+
+@pytest.mark.parametrize("touch", [_touch_ai_level, _touch_region, _touch_asset, _touch_fingerprints,
+                                   _touch_missions])
+def test_digest_covers_world_side_state(touch):
+    player, world, _ = pss.run_batch(["spawn_ai", "scan", "sleep"], seed=5)
+    player.assets.append({"type": "rack", "income_per_day": 10.0})
+    before = pss.session_digest(player, world)
+    assert pss.session_digest(player, world) == before
+    touch(player, world)
+    assert pss.session_digest(player, world) != before
+
+
+def test_digest_does_not_depend_on_the_hash_seed(tmp_path):
+    import os
+    import subprocess
+    import sys
+
+    code = ("import PERSONAL_SECURITY_SYSTEM as pss; pss.HEADLESS = True; "
+            "p, w, _ = pss.run_batch(['scan', 'jobs', 'sleep'] * 5, seed=4); "
+            "p.known_enemy_fps.update((f'fp{i}', {}) for i in range(20)); "
+            "p.special_missions_available = {f'm{i}' for i in range(20)}; "
+            "print(pss.session_digest(p, w))")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    digests = set()
+    for hash_seed in ("1", "2"):
+        env = dict(os.environ, PYTHONHASHSEED=hash_seed, PYTHONPATH=root)
+        out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True,
+                             check=True, cwd=tmp_path).stdout
+        digests.add(out.splitlines()[-1])
+    assert len(digests) == 1
@@ -0,0 +1,66 @@
+import math
+
+import pytest
+
+import PERSONAL_SECURITY_SYSTEM as pss
+
+SCRIPT = ["scan", "jobs", "study", "sleep", "scan", "hack 1", "news", "sleep", "status"] * 4
+
+
+def _draws(seed):
+    rng = pss.RandomStream(seed)
+    return [rng.random() for _ in range(50)] + rng.uniforms(100) + [rng.gauss(0, 1), rng.randint(1, 6)]
+
+
+def test_stream_sequence_does_not_depend_on_numpy(with_numpy, monkeypatch):
+    with_np = _draws(42)
+    monkeypatch.setattr(pss, "np", None)
+    assert _draws(42) == with_np
+
+
+def test_world_session_does_not_depend_on_numpy(with_numpy, monkeypatch, capsys):
+    player, world, _ = pss.run_batch(SCRIPT, seed=5)
+    digest = pss.session_digest(player, world)
+    monkeypatch.setattr(pss, "np", None)
+    player, world, _ = pss.run_batch(SCRIPT, seed=5)
+    assert pss.session_digest(player, world) == digest
+
+
+def test_rng_backend_reports_numpy(monkeypatch):
+    assert pss.rng_backend() == ("python" if pss.np is None else "numpy")
+    monkeypatch.setattr(pss, "np", None)
+    assert pss.rng_backend() == "python"
+
+
+def test_streams_are_independent():
+    a, b = pss.WorldRNG(9), pss.WorldRNG(9)
+    for _ in range(10):
+        b.scan.random()
+    assert [a.ai.random() for _ in range(5)] == [b.ai.random() for _ in range(5)]
+    assert a.ai.random() != a.spawns.random()
+
+
+def test_world_seed_reproduces_world():
+    w1, w2 = pss.World(seed=123), pss.World(seed=123)
+    assert w1.target_table.security == w2.target_table.security
+    assert w1.target_table.ids == w2.target_table.ids
+
+
+@pytest.mark.parametrize("n,p", [(8, 0.2), (40, 0.1), (500, 0.3), (10000, 0.02), (300, 0.85)])
+def test_sample_binomial_moments(n, p):
+    rng = pss.RandomStream(n)
+    runs = 4000
+    xs = [pss.sample_binomial(n, p, rng) for _ in range(runs)]
+    assert all(0 <= x <= n for x in xs)
+    mean = sum(xs) / runs
+    var = sum((x - mean) ** 2 for x in xs) / (runs - 1)
+    expected_var = n * p * (1 - p)
+    assert abs(mean - n * p) < 5 * math.sqrt(expected_var / runs)
+    assert abs(var / expected_var - 1) < 0.12
+
+
+def test_sample_binomial_edges():
+    rng = pss.RandomStream(1)
+    assert pss.sample_binomial(0, 0.5, rng) == 0
+    assert pss.sample_binomial(10, 0.0, rng) == 0
+    assert pss.sample_binomial(10, 1.0, rng) == 10
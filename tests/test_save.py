@@ -0,0 +1,101 @@
+from datetime import timedelta
+
+import pytest
+
+import PERSONAL_SECURITY_SYSTEM as pss
+
+
+@pytest.fixture
+def game():
+    player, world, _ = pss.run_batch(["jobs", "sleep", "scan", "sleep"] * 4, seed=8)
+    regions = list(world.regions)
+    for i in range(40):
+        world.spawn_enemy_ai(region=regions[i % len(regions)], player=player)
+    ais = list(world.enemy_ais)
+    world.reveal_enemy(ais[0])
+    ais[1].status = "bloqueada"
+    ais[1].blocked_until = player.time + timedelta(days=2)
+    world.schedule_unblock(ais[1], player)
+    for _ in range(40):
+        world.advance_day(player)
+    tip = pss.Target(10 ** 6, "Dica anônima", 5, 1234, 1.3, region="NorthAmerica", hints=["dica"])
+    world.add_target(tip)
+    player.money += 5000
+    pss.buy_item(player, "rack", world)
+    return player, world
+
+
+def _ai_rows(world):
+    return [(ai.uid, ai.level, ai.aggression, ai.trace_power, ai.type, ai.status, ai.blocked_until,
+             ai.age_days, ai.fingerprint, ai.region) for ai in world.enemy_ais]
+
+
+def test_save_round_trip(game, tmp_path):
+    player, world = game
+    path = tmp_path / "g.sav"
+    size = pss.save_game(str(path), player, world)
+    assert size == path.stat().st_size
+    p2, w2 = pss.load_game(str(path))
+
+    assert pss.session_digest(p2, w2) == pss.session_digest(player, world)
+    assert vars(p2).keys() == vars(player).keys()
+    assert p2.reputation == player.reputation and p2.assets == player.assets
+    assert w2.regions == world.regions and w2.day == world.day
+    assert w2.ai_level_sum == world.ai_level_sum and w2.ai_type_counts == world.ai_type_counts
+    assert _ai_rows(w2) == _ai_rows(world)
+    for name in pss.TargetTable.COLUMNS:
+        assert getattr(w2.target_table, name) == getattr(world.target_table, name)
+    assert player.assets and w2.find_target(10 ** 6).hints == ["dica"]
+    assert sorted((d, ph, k) for d, ph, _, k, _ in w2.scheduler._heap) == \
+        sorted((d, ph, k) for d, ph, _, k, _ in world.scheduler._heap)
+    revealed = world.enemy_ais[0].fingerprint
+    assert w2.find_enemy_by_identifier(revealed[:4]).uid == world.enemy_ais[0].uid
+
+
+def test_loaded_game_keeps_playing_deterministically(game, tmp_path):
+    player, world = game
+    path = tmp_path / "g.sav"
+    pss.save_game(str(path), player, world)
+    digests = []
+    for _ in range(2):
+        p, w = pss.load_game(str(path))
+        for _ in range(10):
+            p.hours_pass(24, w)
+        digests.append(pss.session_digest(p, w))
+    assert digests[0] == digests[1]
+
+
+def test_blocked_ai_unblocks_after_load(game, tmp_path):
+    player, world = game
+    ai = next(ai for ai in world.enemy_ais if ai.status == "bloqueada" or ai.blocked_until)
+    path = tmp_path / "g.sav"
+    pss.save_game(str(path), player, world)
+    p, w = pss.load_game(str(path))
+    assert w.find_enemy_by_identifier(f"ai:{ai.uid}").status == "bloqueada"
+    p.hours_pass(72, w)
+    assert w.find_enemy_by_identifier(f"ai:{ai.uid}").status == "ativa"
+
+
+def test_rejects_foreign_and_corrupt_files(game):
+    player, world = game
+    data = pss.dump_game(player, world)
+    with pytest.raises(ValueError):
+        pss.parse_game(b"XXXX" + data[4:])
+    with pytest.raises(ValueError):
+        pss.parse_game(data[:6] + b"\xff" + data[7:])
+
+
+def test_round_trip_with_swarms_and_large_population(tmp_path):
+    player = pss.Player()
+    world = pss.World(seed=3)
+    regions = list(world.regions)
+    for i in range(700):
+        world.spawn_enemy_ai(region=regions[i % len(regions)], player=player)
+    world.advance_day(player)
+    assert world.ai_swarms
+    path = tmp_path / "big.sav"
+    pss.save_game(str(path), player, world)
+    p2, w2 = pss.load_game(str(path))
+    assert w2.ai_swarms == world.ai_swarms
+    assert _ai_rows(w2) == _ai_rows(world)
+    assert w2.enemy_ai_count() == world.enemy_ai_count()
@@ -0,0 +1,93 @@
+from datetime import timedelta
+
+import PERSONAL_SECURITY_SYSTEM as pss
+
+
+def test_scheduler_orders_by_day_phase_then_insertion():
+    s = pss.Scheduler()
+    s.schedule(3, "c", phase=pss.PHASE_EVENTS)
+    s.schedule(3, "b", phase=pss.PHASE_DAWN)
+    s.schedule(1, "a", phase=pss.PHASE_EVENTS)
+    s.schedule(3, "d", phase=pss.PHASE_EVENTS)
+    assert s.next_day() == 1
+    assert [k for k, _ in s.pop_due(2, pss.PHASE_EVENTS)] == ["a"]
+    assert [k for k, _ in s.pop_due(3, pss.PHASE_DAWN)] == ["b"]
+    assert [k for k, _ in s.pop_due(3, pss.PHASE_EVENTS)] == ["c", "d"]
+    assert len(s) == 0 and s.next_day() is None
+
+
+def test_pop_due_delivers_items_scheduled_while_iterating():
+    s = pss.Scheduler()
+    s.schedule(1, "first")
+    seen = []
+    for kind, _ in s.pop_due(1, pss.PHASE_EVENTS):
+        seen.append(kind)
+        if kind == "first":
+            s.schedule(1, "second")
+            s.schedule(2, "later")
+    assert seen == ["first", "second"]
+    assert len(s) == 1
+
+
+def test_regions_unlock_on_their_days():
+    player = pss.Player()
+    world = pss.World(seed=1)
+    unlocked = {}
+    for _ in range(90):
+        world.advance_day(player)
+        for name, meta in world.regions.items():
+            if meta["unlocked"]:
+                unlocked.setdefault(name, world.day)
+    assert unlocked == {"NorthAmerica": 1, **{r: d for d, r in pss.REGION_UNLOCK_DAYS.items()}}
+
+
+def test_blocked_ai_wakes_up_on_its_day():
+    player = pss.Player()
+    world = pss.World(seed=1)
+    ai = world.spawn_enemy_ai(region="NorthAmerica", player=player)
+    ai.status = "bloqueada"
+    ai.blocked_until = player.time + timedelta(days=3)
+    world.schedule_unblock(ai, player)
+    for _ in range(2):
+        player.hours_pass(24, world)
+        assert ai.status == "bloqueada"
+    player.hours_pass(24, world)
+    assert ai.status == "ativa" and ai.blocked_until is None
+
+
+def test_job_state_cooldown_ends_silently():
+    player = pss.Player()
+    world = pss.World(seed=1)
+    player.next_job_state_time = player.time + timedelta(days=2)
+    world.scheduler.schedule(world.day_of(player, player.next_job_state_time), "job_state_ready")
+    for _ in range(3):
+        player.hours_pass(24, world)
+    assert player.next_job_state_time is None
+    assert not any("job_state" in msg for _, msg in world.last_alerts)
+
+
+def test_geometric_gap_mean():
+    rng = pss.RandomStream(5)
+    p = 0.1
+    gaps = [pss.geometric_gap(p, rng) for _ in range(20000)]
+    assert abs(sum(gaps) / len(gaps) - (1 - p) / p) < 0.3
+    assert pss.geometric_gap(0.0, rng) == float("inf")
+    assert pss.geometric_gap(1.0, rng) == 0
+
+
+def test_regional_asset_events_fire_at_daily_rate():
+    # 'state' com metadado fixo: chance diária 0.01 * meta de um evento, via thinning da agenda
+    days, worlds, hits = 200, 40, 0
+    for seed in range(worlds):
+        player = pss.Player()
+        world = pss.World(seed=seed)
+        world.region_trends = {}
+        world._drift_regions = lambda: None
+        world.dynamic_ai_spawns = lambda player: None
+        world.regions["NorthAmerica"].update(state=10, crime=0, hacktivists=0)
+        player.assets.append({"type": "rack", "region": "NorthAmerica", "income_per_day": 0.0})
+        for _ in range(days):
+            world.advance_day(player)
+        hits += sum("Inspeção administrativa" in msg for _, msg in world.last_alerts)
+    expected = days * worlds * 0.01 * 10
+    assert abs(hits - expected) < 4 * expected ** 0.5
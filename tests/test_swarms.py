@@ -0,0 +1,106 @@
+import contextlib
+import io
+import math
+
+import pytest
+
+import PERSONAL_SECURITY_SYSTEM as pss
+
+RUNS = 600
+
+
+def _world(seed, ais, lod, monkeypatch):
+    monkeypatch.setattr(pss, "AI_LOD_POPULATION", 5 if lod else math.inf)
+    monkeypatch.setattr(pss, "AI_LOD_TARGET", 0)
+    player = pss.Player()
+    player.money = 20000.0
+    player.assets = [{"type": f"a{i}", "income_per_day": 30.0} for i in range(6)]
+    world = pss.World(seed=seed)
+    regions = [r for r in world.regions if r != player.region]
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(ais):
+            world.spawn_enemy_ai(region=regions[i % len(regions)], player=player)
+    # população e regiões fixas: só as ações das IAs mexem no jogador
+    world.dynamic_ai_spawns = lambda player: None
+    world._drift_regions = lambda: None
+    if lod:
+        world.compact_enemy_ais(player)
+        assert not world.enemy_ais and world.ai_swarms
+    return player, world
+
+
+def _drift(seed, ais, days, lod, monkeypatch):
+    player, world = _world(seed, ais, lod, monkeypatch)
+    for _ in range(days):
+        world.advance_day(player)
+    return player.risk, player.money, len(player.assets), player.knowledge
+
+
+@pytest.mark.parametrize("ais,days", [(8, 1), (16, 1), (30, 2)])
+def test_swarmed_drift_matches_individual_ais(monkeypatch, ais, days):
+    individual = [_drift(seed, ais, days, False, monkeypatch) for seed in range(RUNS)]
+    swarmed = [_drift(seed, ais, days, True, monkeypatch) for seed in range(RUNS, 2 * RUNS)]
+    for i, metric in enumerate(("risk", "money", "assets", "knowledge")):
+        a, b = [r[i] for r in individual], [r[i] for r in swarmed]
+        ma, mb = sum(a) / RUNS, sum(b) / RUNS
+        va = sum((x - ma) ** 2 for x in a) / (RUNS - 1)
+        vb = sum((x - mb) ** 2 for x in b) / (RUNS - 1)
+        se = math.sqrt((va + vb) / RUNS) or 1e-9
+        assert abs(ma - mb) / se < 4.5, (metric, ma, mb, se)
+
+
+def test_swarm_walk_follows_the_rising_risk(monkeypatch):
+    # risco baixo no começo: quem age depois do primeiro já age com chance maior
+    player, world = _world(1, 40, True, monkeypatch)
+    swarm = next(iter(world.ai_swarms.values()))
+    low = pss.swarm_member_p(swarm, 0.0)
+    assert low < 0.5
+    acted = []
+    for _ in range(300):
+        player.risk = 0.0
+        player.assets = []
+        msg = world._swarm_day(swarm, 0, player)
+        acted.append(int(msg.split(" x", 1)[1].split(" ", 1)[0]))
+    # com a chance fixa no começo do dia a média seria 1 + (n - 1) * low
+    assert sum(acted) / len(acted) > 1 + (swarm["count"] - 1) * low * 1.2
+
+
+def test_population_stays_bounded_with_reactive_spawns(monkeypatch):
+    monkeypatch.setattr(pss, "AI_LOD_POPULATION", 60)
+    monkeypatch.setattr(pss, "AI_LOD_TARGET", 40)
+    player = pss.Player()
+    world = pss.World(seed=3)
+    world.dynamic_ai_spawns = lambda player: None
+    compactions = []
+    original = world.compact_enemy_ais
+
+    def spy(player):
+        compactions.append(world.day)
+        return original(player)
+
+    world.compact_enemy_ais = spy
+    with contextlib.redirect_stdout(io.StringIO()):
+        for day in range(120):
+            # spawns reativos de nível alto na região do próprio jogador
+            for _ in range(3):
+                world.spawn_enemy_ai(preferred_type="Federal", region=player.region, player=player)
+            player.risk = 0.0
+            world.advance_day(player)
+            assert len(world.enemy_ais) <= 60 + 3
+    assert world.enemy_ai_count() == 360
+    # compacta só quando os spawns passam da folga, não todo dia acima do limite
+    assert 0 < len(compactions) <= 360 // 20 + 1
+    for ai in world.enemy_ais:
+        assert world.find_enemy_by_identifier(f"ai:{ai.uid}") is ai
+
+
+def test_revealed_ais_are_never_merged(monkeypatch):
+    monkeypatch.setattr(pss, "AI_LOD_POPULATION", 10)
+    monkeypatch.setattr(pss, "AI_LOD_TARGET", 0)
+    player, world = _world(4, 30, False, monkeypatch)
+    keep = list(world.enemy_ais)[:5]
+    for ai in keep:
+        world.reveal_enemy(ai)
+    world.compact_enemy_ais(player)
+    assert list(world.enemy_ais) == keep
+    assert world.enemy_ai_count() == 30
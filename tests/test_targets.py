@@ -0,0 +1,61 @@
+import PERSONAL_SECURITY_SYSTEM as pss
+
+
+def test_daily_pool_has_one_plus_difficulty_targets_per_unlocked_region():
+    world = pss.World(seed=2)
+    table = world.target_table
+    assert len(table) == 2   # só NorthAmerica (dificuldade 1) no dia 0
+    assert all(len(getattr(table, name)) == len(table) for name in pss.TargetTable.COLUMNS)
+    assert {table.region_of(row) for row in range(len(table))} == {"NorthAmerica"}
+
+
+def test_views_are_lazy_and_cached():
+    world = pss.World(seed=2)
+    table = world.target_table
+    assert not table._views
+    tid = table.ids[0]
+    t = world.find_target(tid)
+    assert t is world.find_target(tid) is table.view(0)
+    assert t.security == table.security[0] and t.region == "NorthAmerica"
+    assert world.find_target(-1) is None
+
+
+def test_added_target_keeps_identity_and_honeypot_count():
+    world = pss.World(seed=2)
+    hp = world.honeypot_count
+    extra = pss.Target(10 ** 6, "Dica anônima", 4, 900, 1.1, region="Europe")
+    extra.is_honeypot = True
+    world.add_target(extra)
+    assert world.find_target(extra.id) is extra
+    assert world.honeypot_count == hp + 1
+    assert "Europe" in world.target_table.regions
+
+
+def test_scanned_targets_remain_findable_after_rotation():
+    player = pss.Player()
+    world = pss.World(seed=2)
+    seen = world.get_targets_for_scan(player)
+    world.advance_day(player)
+    assert all(world.find_target(t.id) is t for t in seen)
+
+
+def _big_regions(difficulty):
+    return {"Huge": {"unlocked": True, "difficulty": difficulty, "state": 0, "crime": 0, "hacktivists": 0}}
+
+
+def _stats(table):
+    n = len(table)
+    return sum(table.security) / n, sum(table.honeypot) / n, sum(table.reward) / n
+
+
+def test_vectorized_table_matches_python_distribution(with_numpy, monkeypatch):
+    regions = _big_regions(20000)
+    fast = pss.generate_target_table(regions, 1, pss.RandomStream(1))
+    monkeypatch.setattr(pss, "np", None)
+    slow = pss.generate_target_table(regions, 1, pss.RandomStream(1))
+    assert sorted(fast.ids) == sorted(slow.ids) == list(range(1, 20002))
+    (sec_a, hp_a, reward_a), (sec_b, hp_b, reward_b) = _stats(fast), _stats(slow)
+    assert abs(sec_a - sec_b) / sec_b < 0.02
+    assert abs(reward_a - reward_b) / reward_b < 0.05
+    assert abs(hp_a - pss.HONEYPOT_CHANCE) < 0.015 and abs(hp_b - pss.HONEYPOT_CHANCE) < 0.015
+    assert all(type(v) is int for v in fast.security[:10] + fast.reward[:10])